@@ -7,10 +7,19 @@ Date: 2025-08-10
 Description:
 ------------
 This module provides an implementation of the Fibonacci sequence using simple recursion, recursion with memoization, and top-down dynamic programming.
+
+For large n, fibonacci_fast_doubling needs only O(log n) big-int multiplications,
+optionally modulo m, and for small m fibonacci_mod first reduces n by the Pisano
+period of m.
+fibonacci_many answers a batch of positions in one sorted sweep, and fibonacci_range
+lazily yields consecutive values.
 """
 
-from functools import lru_cache
+import random
 import timeit
+from typing import Iterable, Iterator, Optional
+
+from memoize import memoize
 
 
 def fibonacci(n: int) -> int:
@@ -40,7 +49,7 @@ def fibonacci(n: int) -> int:
     return fibonacci(n - 1) + fibonacci(n - 2)
 
 
-@lru_cache(maxsize=None)
+@memoize(maxsize=1_024, max_bytes=1 << 20)
 def fibonacci_with_memoization(n: int) -> int:
     """
     Calculate the nth Fibonacci number using recursion with memoization.
@@ -61,7 +70,7 @@ def fibonacci_with_memoization(n: int) -> int:
 
     Space Complexity:
     ----------------
-    O(n), for the memoization cache and recursion stack.
+    O(n), for the recursion stack; the cache holds at most 1,024 values and 1 MiB.
     """
     if n <= 1:
         return n
@@ -135,6 +144,263 @@ def fibonacci_efficient_space(n: int) -> int:
     return b
 
 
+def _fibonacci_pair(n: int, mod: Optional[int] = None) -> tuple[int, int]:
+    """
+    Returns (F(n), F(n + 1)), optionally modulo mod, by fast doubling.
+
+    The bits of n are consumed from the most significant one, using
+    F(2k) = F(k) * (2 * F(k + 1) - F(k)) and F(2k + 1) = F(k)^2 + F(k + 1)^2.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+        if mod is not None:
+            a, b = a % mod, b % mod
+    return a, b
+
+
+def fibonacci_fast_doubling(n: int, mod: Optional[int] = None) -> int:
+    """
+    Calculate the nth Fibonacci number using fast doubling.
+
+    Parameters:
+    ----------
+    n : int
+        The position in the Fibonacci sequence to calculate.
+    mod : int, optional
+        If given, return F(n) modulo mod; intermediate values then stay below mod^2.
+
+    Returns:
+    -------
+    int
+        The nth Fibonacci number (modulo mod).
+
+    Raises:
+    ------
+    ValueError
+        If n is negative or mod is not positive.
+
+    Time Complexity:
+    ---------------
+    O(log n) multiplications: O(M(n) log n) bit operations for exact results,
+    where M(n) is the cost of multiplying n-bit integers, or O(log n) word
+    operations with a small mod.
+
+    Space Complexity:
+    ----------------
+    O(n) bits for the exact result, O(1) with mod; no recursion.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if mod is not None and mod < 1:
+        raise ValueError("mod must be positive")
+    return _fibonacci_pair(n, mod)[0]
+
+
+@memoize(maxsize=128)
+def pisano_period(mod: int) -> int:
+    """
+    Calculate the Pisano period of mod: the period of F(n) modulo mod.
+
+    Parameters:
+    ----------
+    mod : int
+        The modulus.
+
+    Returns:
+    -------
+    int
+        The smallest p > 0 with F(p) = 0 and F(p + 1) = 1 modulo mod.
+
+    Raises:
+    ------
+    ValueError
+        If mod is not positive.
+
+    Time Complexity:
+    ---------------
+    O(p), with p <= 6 * mod; results are cached.
+    """
+    if mod < 1:
+        raise ValueError("mod must be positive")
+    if mod == 1:
+        return 1
+    a, b, period = 0, 1, 0
+    while True:
+        a, b = b, (a + b) % mod
+        period += 1
+        if a == 0 and b == 1:
+            return period
+
+
+# Up to this modulus the one-time Pisano period search (at most 6 * mod steps) takes
+# well under a second; above it, fibonacci_mod goes straight to fast doubling.
+PISANO_MAX_MOD = 10**6
+
+
+def fibonacci_mod(n: int, mod: int) -> int:
+    """
+    Calculate F(n) modulo mod, reducing n by the Pisano period first when mod is
+    small.
+
+    Useful when many queries share a small mod and n itself is astronomically
+    large: after the one-time O(mod) period computation, every query costs
+    O(log mod) instead of O(log n). Larger moduli, such as the 10^9 + 7 typical of
+    hashing, skip the period search, whose O(mod) cost would dwarf the O(log n)
+    fast doubling it saves.
+
+    Raises:
+    ------
+    ValueError
+        If n is negative or mod is not positive.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if mod > PISANO_MAX_MOD:
+        return fibonacci_fast_doubling(n, mod)
+    return fibonacci_fast_doubling(n % pisano_period(mod), mod)
+
+
+# Below this gap between two requested n, stepping is cheaper than a jump.
+_SWEEP_GAP = 32
+
+
+def fibonacci_many(ns: Iterable[int]) -> list[int]:
+    """
+    Calculate F(n) for every n in ns in a single sweep.
+
+    The distinct n are visited in increasing order carrying the pair (F(m), F(m + 1))
+    of the last one. Close targets are reached by stepping; distant ones by a jump
+    of g positions with the addition formulas F(m + g) = F(m) F(g + 1) + F(m - 1) F(g)
+    and F(m + g + 1) = F(m + 1) F(g + 1) + F(m) F(g), where (F(g), F(g + 1)) comes
+    from fast doubling.
+
+    Parameters:
+    ----------
+    ns : Iterable[int]
+        The positions in the Fibonacci sequence, in any order, repeats allowed.
+
+    Returns:
+    -------
+    list[int]
+        F(n) for each n, in the order of ns.
+
+    Raises:
+    ------
+    ValueError
+        If an n is negative.
+
+    Time Complexity:
+    ---------------
+    O(k log k) to sort k requests, plus at most O(max(ns)) additions for a dense
+    range or O(log g) multiplications per gap g for sparse requests.
+    """
+    ns = list(ns)
+    if ns and min(ns) < 0:
+        raise ValueError("n must be non-negative")
+    values = {}
+    m, a, b = 0, 0, 1
+    for n in sorted(set(ns)):
+        gap = n - m
+        if gap < _SWEEP_GAP:
+            for _ in range(gap):
+                a, b = b, a + b
+        else:
+            c, d = _fibonacci_pair(gap)
+            a, b = a * d + (b - a) * c, b * d + a * c
+        m = n
+        values[n] = a
+    return [values[n] for n in ns]
+
+
+def fibonacci_range(start: int = 0, stop: Optional[int] = None) -> Iterator[int]:
+    """
+    Lazily yield F(start), F(start + 1), ..., F(stop - 1).
+
+    Parameters:
+    ----------
+    start : int
+        The first position; reached by fast doubling, not by stepping from 0.
+    stop : int, optional
+        The position to stop before; None for an endless sequence.
+
+    Returns:
+    -------
+    Iterator[int]
+        The Fibonacci numbers, one addition each, holding only the current pair.
+
+    Raises:
+    ------
+    ValueError
+        If start is negative.
+    """
+    if start < 0:
+        raise ValueError("start must be non-negative")
+    a, b = _fibonacci_pair(start)
+    n = start
+    while stop is None or n < stop:
+        yield a
+        a, b = b, a + b
+        n += 1
+
+
+def benchmark_large_n():
+    """
+    Compare fast doubling with the linear bottom-up approach for large n, and the
+    Pisano shortcut with plain modular fast doubling.
+    """
+    for n in [10_000, 100_000, 1_000_000]:
+        time_doubling = timeit.timeit(lambda: fibonacci_fast_doubling(n), number=1)
+        if n <= 100_000:
+            assert fibonacci_fast_doubling(n) == fibonacci_efficient_space(n)
+            time_linear = timeit.timeit(lambda: fibonacci_efficient_space(n), number=1)
+            print(
+                f"F({n:,}): bottom-up {time_linear:.4f} seconds, "
+                f"fast doubling {time_doubling:.4f} seconds"
+            )
+        else:
+            print(f"F({n:,}): fast doubling {time_doubling:.4f} seconds")
+
+    n, mod = 10**1000, 999_983
+    assert fibonacci_mod(n, mod) == fibonacci_fast_doubling(n, mod)
+    pisano_period(mod)  # The one-time period computation is not part of a query.
+    time_plain = timeit.timeit(lambda: fibonacci_fast_doubling(n, mod), number=100)
+    time_pisano = timeit.timeit(lambda: fibonacci_mod(n, mod), number=100)
+    print(
+        f"F(10^1000) mod {mod}: fast doubling {time_plain / 100 * 1e6:.1f} us, "
+        f"with the Pisano period {time_pisano / 100 * 1e6:.1f} us"
+    )
+    mod = 10**9 + 7
+    time_hashing = timeit.timeit(lambda: fibonacci_mod(n, mod), number=100)
+    print(
+        f"F(10^1000) mod 10^9 + 7 (no period search): {time_hashing / 100 * 1e6:.1f} us"
+    )
+
+
+def benchmark_batched():
+    """
+    Compare fibonacci_many with calling fibonacci_efficient_space once per n, for a
+    consecutive range and for sparse random positions.
+    """
+    workloads = {
+        "range(2,000)": list(range(2_000)),
+        "200 random n < 20,000": random.Random(7).choices(range(20_000), k=200),
+    }
+    for name, ns in workloads.items():
+        expected = [fibonacci_efficient_space(n) for n in ns]
+        assert fibonacci_many(ns) == expected
+        time_each = timeit.timeit(
+            lambda ns=ns: [fibonacci_efficient_space(n) for n in ns], number=1
+        )
+        time_many = timeit.timeit(lambda ns=ns: fibonacci_many(ns), number=1)
+        print(
+            f"{name}: one call per n {time_each:.4f} seconds, "
+            f"fibonacci_many {time_many:.4f} seconds"
+        )
+
+
 def main():
     """
     Main function to demonstrate the performance of Fibonacci calculations.
@@ -144,6 +410,7 @@ def main():
     result_fibonacci_with_memoization = fibonacci_with_memoization(n)
     result_fibonacci_top_down = fibonacci_top_down(n)
     result_fibonacci_efficient_space = fibonacci_efficient_space(n)
+    result_fibonacci_fast_doubling = fibonacci_fast_doubling(n)
 
     print(f"Fibonacci({n}) using normal recursion: {result_fibonacci}")
     print(
@@ -155,6 +422,7 @@ def main():
     print(
         f"Fibonacci({n}) using bottom-up dynamic programming: {result_fibonacci_efficient_space}"
     )
+    print(f"Fibonacci({n}) using fast doubling: {result_fibonacci_fast_doubling}")
 
     time_taken_fibonacci = timeit.timeit(
         f"fibonacci({n})", globals=globals(), number=10
@@ -168,6 +436,9 @@ def main():
     time_taken_fibonacci_bottom_up = timeit.timeit(
         f"fibonacci_efficient_space({n})", globals=globals(), number=10
     )
+    time_taken_fibonacci_fast_doubling = timeit.timeit(
+        f"fibonacci_fast_doubling({n})", globals=globals(), number=10
+    )
 
     print(f"Time taken by normal recursion: {time_taken_fibonacci:.6f} seconds")
     print(
@@ -179,11 +450,15 @@ def main():
     print(
         f"Time taken by bottom-up dynamic programming: {time_taken_fibonacci_bottom_up:.6f} seconds"
     )
+    print(
+        f"Time taken by fast doubling: {time_taken_fibonacci_fast_doubling:.6f} seconds"
+    )
 
     # Calculate and display the speed difference in value and percentage
     speedup_memoization = time_taken_fibonacci / time_taken_fibonacci_with_memoization
     speedup_top_down = time_taken_fibonacci / time_taken_fibonacci_top_down
     speedup_bottom_up = time_taken_fibonacci / time_taken_fibonacci_bottom_up
+    speedup_fast_doubling = time_taken_fibonacci / time_taken_fibonacci_fast_doubling
 
     print(
         f"Speedup with memoization: {speedup_memoization:.2f}x ({(1 - 1/speedup_memoization) * 100:.2f}%)"
@@ -194,6 +469,15 @@ def main():
     print(
         f"Speedup with bottom-up DP: {speedup_bottom_up:.2f}x ({(1 - 1/speedup_bottom_up) * 100:.2f}%)"
     )
+    print(
+        f"Speedup with fast doubling: {speedup_fast_doubling:.2f}x ({(1 - 1/speedup_fast_doubling) * 100:.2f}%)"
+    )
+
+    print(f"First 10 Fibonacci numbers: {list(fibonacci_range(0, 10))}")
+    print(f"F(95), F(3), F(50): {fibonacci_many([95, 3, 50])}")
+
+    benchmark_large_n()
+    benchmark_batched()
 
 
 if __name__ == "__main__":
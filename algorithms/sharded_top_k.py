@@ -0,0 +1,183 @@
+"""
+Module: sharded_top_k
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a sharded top-k driver for numeric files that are larger than
+memory. The input is a flat file of little-endian int64 values on every host
+(big-endian hosts byte-swap them). It is split into chunks of chunk_items values;
+every chunk is memory-mapped and reduced to its own top k by
+find_k_largest/find_k_smallest in a process pool, and the sorted partial results
+are combined with heapq.merge. Only k values per chunk ever leave a worker, and no
+process holds more than one chunk's pages at a time.
+
+The top k of a union is the top k of the union of the per-chunk top k, so the
+result is exactly what find_k_largest/find_k_smallest return on the whole file.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+from itertools import islice
+import mmap
+import os
+import sys
+import tempfile
+import time
+from typing import Iterable, Optional
+
+from tok_k_elements import find_k_largest, find_k_smallest
+
+ITEM_SIZE = 8
+
+# The values are stored little-endian; a big-endian host swaps them on the way.
+_SWAP = sys.byteorder != "little"
+
+
+def write_int64_file(path: str, values: Iterable[int]) -> int:
+    """
+    Writes values to path as little-endian int64 and returns how many were written.
+    """
+    data = values if isinstance(values, array) else array("q", values)
+    if _SWAP:
+        data = array("q", data)
+        data.byteswap()
+    with open(path, "wb") as file:
+        data.tofile(file)
+    return len(data)
+
+
+def _chunk_top_k(path: str, start: int, stop: int, k: int, largest: bool) -> list[int]:
+    """
+    Returns the top k of the values [start, stop) of the file, best first.
+
+    The chunk is read in place on little-endian hosts and from a byte-swapped copy
+    on big-endian ones.
+    """
+    select = find_k_largest if largest else find_k_smallest
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                with view[start * ITEM_SIZE : stop * ITEM_SIZE] as raw:
+                    if _SWAP:
+                        chunk = array("q", bytes(raw))
+                        chunk.byteswap()
+                        return select(chunk, k)
+                    with raw.cast("q") as chunk:
+                        return select(chunk, k)
+
+
+def sharded_top_k(
+    path: str,
+    k: int,
+    largest: bool = True,
+    workers: Optional[int] = None,
+    chunk_items: int = 1 << 22,
+) -> list[int]:
+    """
+    Finds the k largest (or smallest) int64 values of a file in parallel.
+
+    Parameters:
+    ----------
+    path : str
+        A file of little-endian int64 values.
+    k : int
+        The number of values to find.
+    largest : bool
+        If True, find the k largest values; otherwise the k smallest.
+    workers : int, optional
+        The number of worker processes; defaults to os.cpu_count().
+    chunk_items : int
+        The number of values per chunk (4M values, 32 MiB, by default).
+
+    Returns:
+    -------
+    list[int]
+        The k largest values, largest first (or the k smallest, smallest first).
+
+    Raises:
+    ------
+    ValueError
+        If the file size is not a multiple of 8 bytes.
+
+    Time Complexity:
+    ---------------
+    O(n log k / p) for p workers, plus O(c k) to merge c chunks.
+    """
+    size = os.path.getsize(path)
+    if size % ITEM_SIZE:
+        raise ValueError(f"{path} does not hold whole int64 values")
+    count = size // ITEM_SIZE
+    if k <= 0 or count == 0:
+        return []
+    starts = range(0, count, chunk_items)
+    stops = [min(start + chunk_items, count) for start in starts]
+
+    with ProcessPoolExecutor(workers) as pool:
+        parts = list(
+            pool.map(
+                _chunk_top_k,
+                [path] * len(starts),
+                starts,
+                stops,
+                [k] * len(starts),
+                [largest] * len(starts),
+            )
+        )
+    return list(islice(heapq.merge(*parts, reverse=largest), k))
+
+
+def benchmark_scaling(count: int = 20_000_000, k: int = 100) -> None:
+    """
+    Reports the throughput of sharded_top_k with 1, 2, 4, ... up to os.cpu_count()
+    workers on a file of random int64 values.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.bin")
+        values = array("q")
+        values.frombytes(os.urandom(count * ITEM_SIZE))
+        write_int64_file(path, values)
+        print(f"{count:,} int64 values ({count * ITEM_SIZE / 2**20:,.0f} MiB)")
+
+        start = time.perf_counter()
+        expected = find_k_largest(values.tolist(), k)
+        elapsed = time.perf_counter() - start
+        print(f"  find_k_largest on a list: {count / elapsed / 1e6:.1f} M values/s")
+        del values
+
+        cores = os.cpu_count() or 1
+        for workers in sorted({1 << i for i in range(cores.bit_length())} | {cores}):
+            start = time.perf_counter()
+            result = sharded_top_k(path, k, workers=workers)
+            elapsed = time.perf_counter() - start
+            assert result == expected
+            print(
+                f"  sharded_top_k with {workers} worker(s): "
+                f"{count / elapsed / 1e6:.1f} M values/s"
+            )
+
+
+def main():
+    """
+    The main function to check sharded_top_k against find_k_largest/find_k_smallest
+    and to report how its throughput scales with the number of cores.
+    """
+    arr = [11, 23, 3, 53, 32, 42, 22, 63, 3, 53, 33, 23, 45]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "values.bin")
+        write_int64_file(path, arr)
+        for k in (0, 1, 3, len(arr), len(arr) + 5):
+            assert sharded_top_k(path, k, chunk_items=4) == find_k_largest(arr, k)
+            assert sharded_top_k(
+                path, k, largest=False, chunk_items=4
+            ) == find_k_smallest(arr, k)
+        print(f"sharded k largest: {sharded_top_k(path, 3, chunk_items=4)}, k=3")
+
+    benchmark_scaling()
+
+
+if __name__ == "__main__":
+    main()
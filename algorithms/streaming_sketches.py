@@ -0,0 +1,515 @@
+"""
+Module: streaming_sketches
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides mergeable sketches that summarize unbounded streams in bounded
+memory, as approximate counterparts of the exact functions in tok_k_elements:
+
+- MisraGries and SpaceSaving find the most frequent items with `capacity` counters.
+  For a stream of n items, every item with a frequency above n / capacity is kept,
+  and every estimated count is within n / capacity of the true count (Misra-Gries
+  never overestimates, Space-Saving never underestimates).
+- KLLSketch estimates quantiles and ranks with O(k) stored values. The rank of any
+  value is off by less than about 3.3 * n / k with 99% probability, which is
+  1.65% of n for the default k = 200; the error shrinks proportionally to 1/k.
+
+Sketches of the same kind and size can be merged, so a stream can be split across
+workers whose sketches are combined at the end, with the same error bounds relative
+to the combined stream length.
+"""
+
+from collections import Counter
+from functools import partial
+import heapq
+import math
+import random
+import timeit
+import tracemalloc
+from typing import Hashable, Iterable, Optional
+
+
+class MisraGries:
+    """
+    A class representing a Misra-Gries frequent-items summary.
+
+    Methods:
+    -------
+    update(item)
+        Counts one occurrence of an item.
+    extend(items: Iterable)
+        Counts every item of an iterable.
+    estimate(item) -> int
+        Returns a lower bound on the frequency of an item.
+    most_common(k: int) -> list[tuple[item, int]]
+        Returns the k items with the largest estimates.
+    merge(other: MisraGries)
+        Folds another summary into this one.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.counters: dict[Hashable, int] = {}
+        self.count = 0
+
+    def update(self, item: Hashable) -> None:
+        """
+        Counts one occurrence of an item.
+
+        When all counters are taken by other items, every counter is decremented
+        instead, which is what bounds the undercount by n / (capacity + 1).
+
+        Time Complexity:
+        ---------------
+        O(1) amortized: a decrement round costs O(capacity) but removes at least as
+        many increments as it costs.
+        """
+        counters = self.counters
+        self.count += 1
+        if item in counters:
+            counters[item] += 1
+        elif len(counters) < self.capacity:
+            counters[item] = 1
+        else:
+            self.counters = {key: c - 1 for key, c in counters.items() if c > 1}
+
+    def extend(self, items: Iterable[Hashable]) -> None:
+        """
+        Counts every item of an iterable, consuming it lazily.
+        """
+        for item in items:
+            self.update(item)
+
+    def estimate(self, item: Hashable) -> int:
+        """
+        Returns an estimate e of the frequency f of an item with
+        f - n / (capacity + 1) <= e <= f.
+        """
+        return self.counters.get(item, 0)
+
+    def most_common(self, k: int) -> list[tuple[Hashable, int]]:
+        """
+        Returns the k items with the largest estimated frequencies, largest first.
+        """
+        return heapq.nlargest(k, self.counters.items(), key=lambda entry: entry[1])
+
+    def merge(self, other: "MisraGries") -> None:
+        """
+        Folds another summary with the same capacity into this one.
+
+        The counters are added and then all reduced by the (capacity + 1)-th largest
+        count, which keeps at most capacity of them and preserves the error bound
+        for the combined stream.
+        """
+        if other.capacity != self.capacity:
+            raise ValueError("can only merge summaries with the same capacity")
+        combined = Counter(self.counters)
+        combined.update(other.counters)
+        self.count += other.count
+        if len(combined) > self.capacity:
+            cut = heapq.nlargest(self.capacity + 1, combined.values())[-1]
+            combined = {key: c - cut for key, c in combined.items() if c > cut}
+        self.counters = dict(combined)
+
+
+class SpaceSaving:
+    """
+    A class representing a Space-Saving frequent-items summary.
+
+    Every monitored item has a count and an error: the item's true frequency lies
+    in [count - error, count]. When a new item arrives and all counters are taken,
+    it replaces the item with the smallest count m and inherits count m + 1 with
+    error m. The smallest count is found with a lazy min-heap, which holds one
+    entry per increment and is rebuilt from the counters when it grows too large.
+
+    Methods:
+    -------
+    update(item)
+        Counts one occurrence of an item.
+    extend(items: Iterable)
+        Counts every item of an iterable.
+    estimate(item) -> int
+        Returns an upper bound on the frequency of an item.
+    floor() -> int
+        Returns the largest frequency an unmonitored item can have.
+    most_common(k: int) -> list[tuple[item, int]]
+        Returns the k items with the largest estimates.
+    merge(other: SpaceSaving)
+        Folds another summary into this one.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.counters: dict[Hashable, int] = {}
+        self.errors: dict[Hashable, int] = {}
+        self.count = 0
+        self._heap: list[tuple[int, int, Hashable]] = []
+        self._tiebreak = 0
+
+    def _push(self, item: Hashable, count: int) -> None:
+        # The tiebreak keeps the heap from comparing items, which may not be ordered.
+        self._tiebreak += 1
+        heapq.heappush(self._heap, (count, self._tiebreak, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [
+            (count, index, item)
+            for index, (item, count) in enumerate(self.counters.items())
+        ]
+        self._tiebreak = len(self._heap)
+        heapq.heapify(self._heap)
+
+    def _minimum(self) -> tuple[Hashable, int]:
+        """
+        Returns the monitored item with the smallest count, dropping stale entries.
+        """
+        heap, counters = self._heap, self.counters
+        while True:
+            count, _, item = heap[0]
+            if counters.get(item) == count:
+                return item, count
+            heapq.heappop(heap)
+
+    def update(self, item: Hashable) -> None:
+        """
+        Counts one occurrence of an item.
+
+        Time Complexity:
+        ---------------
+        O(log capacity) amortized.
+        """
+        counters = self.counters
+        self.count += 1
+        if item in counters:
+            counters[item] += 1
+        elif len(counters) < self.capacity:
+            counters[item] = 1
+            self.errors[item] = 0
+        else:
+            evicted, minimum = self._minimum()
+            del counters[evicted], self.errors[evicted]
+            counters[item] = minimum + 1
+            self.errors[item] = minimum
+        self._push(item, counters[item])
+
+    def extend(self, items: Iterable[Hashable]) -> None:
+        """
+        Counts every item of an iterable, consuming it lazily.
+        """
+        for item in items:
+            self.update(item)
+
+    def floor(self) -> int:
+        """
+        Returns the largest frequency an unmonitored item can have.
+        """
+        if len(self.counters) < self.capacity:
+            return 0
+        return self._minimum()[1]
+
+    def estimate(self, item: Hashable) -> int:
+        """
+        Returns an estimate e of the frequency f of an item with f <= e <= f + n /
+        capacity.
+        """
+        return self.counters.get(item, self.floor())
+
+    def most_common(self, k: int) -> list[tuple[Hashable, int]]:
+        """
+        Returns the k items with the largest estimated frequencies, largest first.
+
+        Every item with a true frequency above count / capacity is monitored, so it
+        is reported if k is large enough.
+        """
+        return heapq.nlargest(k, self.counters.items(), key=lambda entry: entry[1])
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """
+        Folds another summary with the same capacity into this one.
+
+        An item missing from one summary is charged that summary's floor (the
+        largest count it could have had there), both as count and as error; the
+        capacity items with the largest combined counts are kept.
+        """
+        if other.capacity != self.capacity:
+            raise ValueError("can only merge summaries with the same capacity")
+        floor_one, floor_two = self.floor(), other.floor()
+        combined = {}
+        for item in self.counters.keys() | other.counters.keys():
+            count = self.counters.get(item, floor_one) + other.counters.get(
+                item, floor_two
+            )
+            error = self.errors.get(item, floor_one) + other.errors.get(item, floor_two)
+            combined[item] = (count, error)
+        kept = heapq.nlargest(
+            self.capacity, combined.items(), key=lambda entry: entry[1][0]
+        )
+        self.counters = {item: count for item, (count, _) in kept}
+        self.errors = {item: error for item, (_, error) in kept}
+        self.count += other.count
+        self._rebuild_heap()
+
+
+class KLLSketch:
+    """
+    A class representing a KLL quantile sketch.
+
+    Values are kept in a hierarchy of compactors; an item at level h stands for 2^h
+    stream items. When the sketch is over capacity, the lowest full compactor is
+    sorted and every other item (starting at a random offset) is promoted to the
+    next level, the rest are dropped. Level capacities shrink geometrically by 2/3
+    towards the bottom, so the sketch stores O(k) values in total.
+
+    Methods:
+    -------
+    update(value: float)
+        Adds one value.
+    extend(values: Iterable[float])
+        Adds every value of an iterable.
+    rank(value: float) -> int
+        Estimates the number of stream values at most value.
+    quantile(q: float) -> float
+        Estimates the value at normalized rank q.
+    merge(other: KLLSketch)
+        Folds another sketch into this one.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Parameters:
+        ----------
+        k : int
+            The size of the top compactor; the rank error is below about
+            3.3 * n / k with 99% probability (1.65% of n for the default k = 200).
+        seed : int, optional
+            The seed of the random compaction offsets.
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.compactors: list[list[float]] = [[]]
+        self._random = random.Random(seed)
+        self._capacity = self._total_capacity()
+
+    def _level_capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _total_capacity(self) -> int:
+        return sum(self._level_capacity(h) for h in range(len(self.compactors)))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values stored in the sketch (not the stream length).
+        """
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _compress(self) -> None:
+        """
+        Compacts the lowest over-full level until the sketch fits its capacity.
+        """
+        while len(self) > self._capacity:
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) >= self._level_capacity(level):
+                    break
+            if level + 1 == len(self.compactors):
+                self.compactors.append([])
+                self._capacity = self._total_capacity()
+            compactor.sort()
+            # An odd item out stays behind, so the total weight is preserved.
+            leftover = [compactor.pop()] if len(compactor) % 2 else []
+            offset = self._random.randrange(2)
+            self.compactors[level + 1].extend(compactor[offset::2])
+            compactor[:] = leftover
+
+    def update(self, value: float) -> None:
+        """
+        Adds one value to the sketch.
+
+        Time Complexity:
+        ---------------
+        O(1) amortized, plus O(k log k) per compaction.
+        """
+        self.count += 1
+        self.compactors[0].append(value)
+        if len(self.compactors[0]) >= self._level_capacity(0):
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Adds every value of an iterable, consuming it lazily.
+        """
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: "KLLSketch") -> None:
+        """
+        Folds another sketch with the same k into this one.
+        """
+        if other.k != self.k:
+            raise ValueError("can only merge sketches with the same k")
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.count += other.count
+        self._capacity = self._total_capacity()
+        self._compress()
+
+    def _weighted_values(self) -> list[tuple[float, int]]:
+        return sorted(
+            (value, 1 << level)
+            for level, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+
+    def rank(self, value: float) -> int:
+        """
+        Estimates the number of stream values that are at most value.
+        """
+        return sum(
+            len([v for v in compactor if v <= value]) << level
+            for level, compactor in enumerate(self.compactors)
+        )
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the smallest value whose normalized rank is at least q.
+
+        Raises:
+        ------
+        ValueError
+            If q is not in [0, 1] or the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        weighted = self._weighted_values()
+        if not weighted:
+            raise ValueError("quantile of an empty sketch")
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+def _traced_peak(build) -> int:
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _merged(sketch_class, parts: list[list], *args):
+    """
+    Builds one sketch per part and merges them into the first, as per-worker
+    sketches would be.
+    """
+    sketches = [sketch_class(*args) for _ in parts]
+    for sketch, part in zip(sketches, parts):
+        sketch.extend(part)
+    for sketch in sketches[1:]:
+        sketches[0].merge(sketch)
+    return sketches[0]
+
+
+def _benchmark_heavy_hitters(stream: list[int], workers: int) -> None:
+    """
+    Compares MisraGries and SpaceSaving with Counter.most_common.
+    """
+    parts = [stream[i::workers] for i in range(workers)]
+    n, capacity, k = len(stream), 100, 10
+    exact = dict(Counter(stream))
+    for label, build in [
+        ("Counter.most_common (exact)", lambda: Counter(stream).most_common(k)),
+        ("MisraGries", partial(_merged, MisraGries, parts, capacity)),
+        ("SpaceSaving", partial(_merged, SpaceSaving, parts, capacity)),
+    ]:
+        elapsed = timeit.timeit(build, number=1)
+        peak = _traced_peak(build)
+        result = build()
+        if isinstance(result, list):
+            line = f"top {k}: {[item for item, _ in result]}"
+        else:
+            error = max(abs(result.estimate(item) - exact[item]) for item in exact)
+            top = [item for item, _ in result.most_common(k)]
+            line = f"top {k}: {top}, max count error {error:,} <= {n // capacity:,}"
+        print(f"  {label}: {elapsed:.2f} s, peak {peak / 1024:,.0f} KiB, {line}")
+
+
+def _benchmark_quantiles(values: list[float], workers: int) -> None:
+    """
+    Compares KLLSketch with exact quantiles of the sorted values.
+    """
+    parts = [values[i::workers] for i in range(workers)]
+    n, levels = len(values), (0.01, 0.25, 0.5, 0.75, 0.99)
+
+    def exact_quantiles():
+        ordered = sorted(values)
+        return [ordered[int(q * (n - 1))] for q in levels]
+
+    time_exact = timeit.timeit(exact_quantiles, number=1)
+    sketch = _merged(KLLSketch, parts, 200)
+    time_sketch = timeit.timeit(partial(_merged, KLLSketch, parts, 200), number=1)
+    error = max(
+        abs(sketch.rank(probe) - (1 + int(q * (n - 1))))
+        for probe, q in zip(exact_quantiles(), levels)
+    )
+    print(f"  sorted quantiles (exact): {time_exact:.2f} s, {n:,} values kept")
+    print(
+        f"  KLLSketch(k=200): {time_sketch:.2f} s, {len(sketch):,} values kept, "
+        f"max rank error {error / n:.3%} of n"
+    )
+
+
+def benchmark_sketches(n: int = 10**6, workers: int = 4) -> None:
+    """
+    Compares the sketches with exact answers on a Zipf-like stream of n items.
+
+    Every sketch is built from `workers` partial sketches that are merged, as
+    per-worker sketches would be. n defaults to 10^6 to keep the run short; the
+    sketches' memory does not depend on n, so larger streams only take longer.
+    """
+    rng = random.Random(0)
+    print(f"stream of {n:,} items, {workers} merged partial sketches")
+    _benchmark_heavy_hitters(
+        [int(100 * rng.paretovariate(1.1)) for _ in range(n)], workers
+    )
+    _benchmark_quantiles([rng.random() for _ in range(n)], workers)
+
+
+def main():
+    """
+    The main function to demonstrate the sketches and compare them with exact
+    answers.
+    """
+    stream = list("abracadabra alakazam")
+    heavy = SpaceSaving(4)
+    heavy.extend(stream)
+    print(f"SpaceSaving most common: {heavy.most_common(2)}")  # [('a', 9), ...]
+    summary = MisraGries(4)
+    summary.extend(stream)
+    print(f"MisraGries most common: {summary.most_common(2)}")
+
+    quantiles = KLLSketch(seed=1)
+    quantiles.extend(range(100_000))
+    print(f"KLL median of 0..99999: {quantiles.quantile(0.5)}")
+
+    benchmark_sketches()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,69 +7,231 @@ Date: 2025-08-10
 Description:
 ------------
 This module provides an implementation of finding the k largest and k smallest elements in an array, and searching in a heap.
+
+For unbounded streams, TopK keeps the top k of everything seen so far in a heap of
+size k, and SlidingWindowTopK keeps the top k of the last N items or T seconds,
+evicting expired items lazily instead of rescanning the window.
+Large NumPy arrays and numeric buffers are selected with NumPy's O(n) argpartition
+instead of heapq when NumPy is installed.
+IndexedPriorityQueue is a binary heap with a position map, so items can be found,
+re-prioritized and removed in place.
 """
 
+from array import array
+from collections import deque
+from functools import partial
 import heapq
+import random
+import time
+import timeit
+from typing import Callable, Hashable, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the vectorized selection.
+    np = None
+
+# Below this many elements heapq beats converting to NumPy and calling argpartition;
+# re-measure with benchmark_crossover on new hardware.
+NUMPY_CROSSOVER = 500
+
+
+def _prefers_numpy(arr, use_numpy: Optional[bool]) -> bool:
+    """
+    Decides whether a selection should run on NumPy.
+
+    Lists stay on heapq unless use_numpy is True, because converting them costs as
+    much as the heap selection itself; NumPy arrays and other buffers (array.array,
+    memoryview, ...) switch to NumPy at NUMPY_CROSSOVER elements.
+    """
+    if use_numpy is not None:
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+        return use_numpy
+    if np is None or isinstance(arr, (list, tuple, deque)):
+        return False
+    is_buffer = isinstance(arr, (np.ndarray, array, memoryview, bytes, bytearray))
+    return is_buffer and len(arr) >= NUMPY_CROSSOVER
+
+
+def _select_numpy(
+    arr, k: int, largest: bool, return_indices: bool
+) -> Optional[list[int]]:
+    """
+    Selects the k largest or smallest elements with argpartition.
+
+    argpartition finds the k-th value in O(n); the elements strictly better than it
+    are all kept, and the slots left are filled with the lowest-index elements
+    equal to it, which is exactly what heapq.nlargest/nsmallest keep. The k
+    survivors are then sorted stably, best first.
+
+    Returns None for arrays containing NaN: NaN compares false with everything,
+    so heapq's result depends on positions in a way argpartition cannot
+    reproduce, and the caller falls back to heapq.
+    """
+    if isinstance(arr, (bytes, bytearray)):
+        # np.asarray would make a single byte-string element, not byte values.
+        values = np.frombuffer(arr, np.uint8)
+    else:
+        values = np.asarray(arr).ravel()
+    if values.size == 0 or k <= 0:
+        return []
+    if values.dtype.kind in "fc" and np.isnan(values).any():
+        return None
+    k = min(k, values.size)
+    if largest:
+        kth = values[np.argpartition(values, values.size - k)[values.size - k]]
+        better = np.flatnonzero(values > kth)
+    else:
+        kth = values[np.argpartition(values, k - 1)[k - 1]]
+        better = np.flatnonzero(values < kth)
+    ties = np.flatnonzero(values == kth)[: k - better.size]
+    indices = np.sort(np.concatenate((better, ties)))
+    if largest:
+        # A stable ascending sort of the reversed indices, reversed again, orders
+        # by value descending and keeps equal values in ascending index order.
+        reverse = indices[::-1]
+        indices = reverse[np.argsort(values[reverse], kind="stable")[::-1]]
+    else:
+        indices = indices[np.argsort(values[indices], kind="stable")]
+    return (indices if return_indices else values[indices]).tolist()
 
 
-def find_k_largest(arr: list[int], k: int) -> list[int]:
+def _heapq_input(arr):
+    """
+    Converts NumPy arrays to lists of Python numbers for the heapq path, so that
+    both paths return the same element types (and flat indices) for any size.
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        return arr.ravel().tolist()
+    return arr
+
+
+def find_k_largest(
+    arr: list[int],
+    k: int,
+    return_indices: bool = False,
+    use_numpy: Optional[bool] = None,
+) -> list[int]:
     """
     Find the k largest elements in an array.
 
     Parameters:
     ----------
     arr : list[int]
-        The input array from which to find the k largest elements.
+        The input array from which to find the k largest elements; NumPy arrays and
+        other buffers of numbers are accepted as well.
     k : int
         The number of largest elements to find.
+    return_indices : bool
+        If True, return the positions of the elements instead of their values.
+    use_numpy : bool, optional
+        Force (True) or forbid (False) the NumPy argpartition path; by default it
+        is used for NumPy arrays and buffers of at least NUMPY_CROSSOVER elements.
 
     Returns:
     -------
     list[int]
-        A list containing the k largest elements from the array.
+        A list containing the k largest elements from the array (or their indices),
+        largest first; equal elements appear in order of position. Both paths
+        return the same result; arrays containing NaN always use heapq.
 
     Time Complexity:
     ---------------
-    O(n log k), where n is the number of elements in the array.
+    O(n log k) with heapq, O(n + k log k) with NumPy, where n is the number of
+    elements in the array.
 
     Space Complexity:
     ----------------
-    O(k), for storing the k largest elements.
+    O(k), for storing the k largest elements (O(n) on the NumPy path).
     """
-    if k == 0:
+    if k <= 0:
         return []
+    if _prefers_numpy(arr, use_numpy):
+        selected = _select_numpy(arr, k, largest=True, return_indices=return_indices)
+        if selected is not None:
+            return selected
+    arr = _heapq_input(arr)
+    if return_indices:
+        return heapq.nlargest(k, range(len(arr)), key=arr.__getitem__)
     return heapq.nlargest(k, arr)
 
 
-def find_k_smallest(arr: list[int], k: int) -> list[int]:
+def find_k_smallest(
+    arr: list[int],
+    k: int,
+    return_indices: bool = False,
+    use_numpy: Optional[bool] = None,
+) -> list[int]:
     """
     Find the k smallest elements in an array.
 
     Parameters:
     ----------
     arr : list[int]
-        The input array from which to find the k smallest elements.
+        The input array from which to find the k smallest elements; NumPy arrays and
+        other buffers of numbers are accepted as well.
     k : int
         The number of smallest elements to find.
+    return_indices : bool
+        If True, return the positions of the elements instead of their values.
+    use_numpy : bool, optional
+        Force (True) or forbid (False) the NumPy argpartition path; by default it
+        is used for NumPy arrays and buffers of at least NUMPY_CROSSOVER elements.
 
     Returns:
     -------
     list[int]
-        A list containing the k smallest elements from the array.
+        A list containing the k smallest elements from the array (or their
+        indices), smallest first; equal elements appear in order of position. Both
+        paths return the same result; arrays containing NaN always use heapq.
 
     Time Complexity:
     ---------------
-    O(n log k), where n is the number of elements in the array.
+    O(n log k) with heapq, O(n + k log k) with NumPy, where n is the number of
+    elements in the array.
 
     Space Complexity:
     ----------------
-    O(k), for storing the k smallest elements.
+    O(k), for storing the k smallest elements (O(n) on the NumPy path).
     """
-    if k == 0:
+    if k <= 0:
         return []
+    if _prefers_numpy(arr, use_numpy):
+        selected = _select_numpy(arr, k, largest=False, return_indices=return_indices)
+        if selected is not None:
+            return selected
+    arr = _heapq_input(arr)
+    if return_indices:
+        return heapq.nsmallest(k, range(len(arr)), key=arr.__getitem__)
     return heapq.nsmallest(k, arr)
 
 
+def benchmark_crossover(sizes: Iterable[int] = (100, 500, 1_000, 100_000, 10**6)):
+    """
+    Times heapq and NumPy selections of the 10 largest values of int64 arrays, to
+    find the size from which NUMPY_CROSSOVER should switch to NumPy.
+    """
+    if np is None:
+        print("NumPy is not installed; only the heapq path is available")
+        return
+    k = 10
+    for size in sizes:
+        values = array("q", (random.randrange(10**9) for _ in range(size)))
+        number = max(1, 100_000 // size)
+        time_heapq = timeit.timeit(
+            partial(find_k_largest, values, k, use_numpy=False), number=number
+        )
+        time_numpy = timeit.timeit(
+            partial(find_k_largest, values, k, use_numpy=True), number=number
+        )
+        winner = "numpy" if time_numpy < time_heapq else "heapq"
+        print(
+            f"{size:>9,} elements - heapq: {time_heapq / number * 1000:.3f} ms, "
+            f"numpy: {time_numpy / number * 1000:.3f} ms ({winner})"
+        )
+
+
 def search_in_heap(heap: list[int], value: int) -> bool:
     """
     Search for a value in a heap.
@@ -88,11 +250,471 @@ def search_in_heap(heap: list[int], value: int) -> bool:
 
     Time Complexity:
     ---------------
-    O(n), where n is the number of elements in the heap.
+    O(n), where n is the number of elements in the heap. IndexedPriorityQueue
+    answers membership in O(1).
     """
     return value in heap
 
 
+class TopK:
+    """
+    A class representing a bounded accumulator of the k largest (or smallest) values
+    of a stream.
+
+    Methods:
+    -------
+    push(value: int)
+        Offers one value to the accumulator.
+    extend(values: Iterable[int])
+        Offers every value of an iterable, which may be unbounded.
+    result() -> list[int]
+        Returns the current top k, best first.
+    """
+
+    def __init__(self, k: int, largest: bool = True):
+        """
+        Parameters:
+        ----------
+        k : int
+            The number of values to keep.
+        largest : bool
+            If True, keep the k largest values; otherwise the k smallest.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.largest = largest
+        # A min-heap of the kept values; values are negated when keeping the
+        # smallest, so heap[0] is always the worst value kept.
+        self._heap: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, value: int) -> None:
+        """
+        Offers one value to the accumulator.
+
+        Time Complexity:
+        ---------------
+        O(log k)
+        """
+        key = value if self.largest else -value
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, key)
+        elif self.k and key > self._heap[0]:
+            heapq.heapreplace(self._heap, key)
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Offers every value of an iterable, consuming it lazily.
+
+        Time Complexity:
+        ---------------
+        O(n log k), where n is the number of values consumed.
+        """
+        heap, k, sign = self._heap, self.k, 1 if self.largest else -1
+        if k == 0:
+            return
+        for value in values:
+            key = sign * value
+            if len(heap) < k:
+                heapq.heappush(heap, key)
+            elif key > heap[0]:
+                heapq.heapreplace(heap, key)
+
+    def result(self) -> list[int]:
+        """
+        Returns the current top k, best first, like find_k_largest/find_k_smallest.
+
+        Time Complexity:
+        ---------------
+        O(k log k)
+        """
+        ordered = sorted(self._heap, reverse=True)
+        return ordered if self.largest else [-key for key in ordered]
+
+
+class SlidingWindowTopK:  # pylint: disable=too-many-instance-attributes
+    """
+    A class representing the top k values over a sliding window of a stream.
+
+    The window is either the last `size` items or the items pushed in the last
+    `duration` seconds. Every item gets a sequence number; the window is the range
+    of sequence numbers at or after `_live_from`, so expiring items is just moving
+    that bound. Expired items are removed from the heap lazily: when they reach
+    the top, and by a compaction that rebuilds the heap once it holds more than
+    twice as many entries as the window.
+
+    A duration window runs on clock() until a value is pushed with an explicit
+    timestamp; from then on the stream carries its own time, and reads measure
+    the window back from the newest pushed timestamp (or from an explicit now).
+
+    Methods:
+    -------
+    push(value: int, timestamp: float = None)
+        Adds a value to the window.
+    result(now: float = None) -> list[int]
+        Returns the top k values of the window, best first.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        size: Optional[int] = None,
+        duration: Optional[float] = None,
+        largest: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Parameters:
+        ----------
+        k : int
+            The number of values to report.
+        size : int, optional
+            The window length in items.
+        duration : float, optional
+            The window length in seconds; exactly one of size and duration is given.
+        largest : bool
+            If True, report the k largest values; otherwise the k smallest.
+        clock : Callable[[], float]
+            The time source for pushes without an explicit timestamp.
+        """
+        if (size is None) == (duration is None):
+            raise ValueError("give exactly one of size and duration")
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.size = size
+        self.duration = duration
+        self.largest = largest
+        self.clock = clock
+        # Entries are (key, sequence number); key is -value when keeping the largest.
+        self._heap: list[tuple[int, int]] = []
+        self._next_sequence = 0
+        self._live_from = 0
+        self._timestamps: deque[tuple[float, int]] = deque()
+        # The newest explicit timestamp, or None while the window runs on clock().
+        self._stream_time: Optional[float] = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the window.
+        """
+        self._expire()
+        return self._next_sequence - self._live_from
+
+    def _expire(self, now: Optional[float] = None) -> None:
+        """
+        Moves the start of the window and drops expired entries from the heap top.
+        """
+        if self.duration is not None:
+            if now is None:
+                now = self.clock() if self._stream_time is None else self._stream_time
+            horizon = now - self.duration
+            timestamps = self._timestamps
+            while timestamps and timestamps[0][0] <= horizon:
+                self._live_from = timestamps.popleft()[1] + 1
+        else:
+            self._live_from = max(0, self._next_sequence - self.size)
+
+        heap, live_from = self._heap, self._live_from
+        while heap and heap[0][1] < live_from:
+            heapq.heappop(heap)
+        if len(heap) > 2 * (self._next_sequence - live_from) + 64:
+            self._heap = [entry for entry in heap if entry[1] >= live_from]
+            heapq.heapify(self._heap)
+
+    def push(self, value: int, timestamp: Optional[float] = None) -> None:
+        """
+        Adds a value to the window, expiring whatever falls out of it.
+
+        Parameters:
+        ----------
+        value : int
+            The value to add.
+        timestamp : float, optional
+            The time of the value for duration windows; defaults to clock().
+            Timestamps must not decrease, and once one is given, later reads use
+            the newest of them as the current time.
+
+        Time Complexity:
+        ---------------
+        O(log n) amortized, where n is the number of items in the window.
+        """
+        sequence = self._next_sequence
+        self._next_sequence = sequence + 1
+        if self.duration is not None:
+            if timestamp is None:
+                now = self.clock()
+            else:
+                now = self._stream_time = timestamp
+            self._timestamps.append((now, sequence))
+        else:
+            now = None
+        heapq.heappush(self._heap, (-value if self.largest else value, sequence))
+        self._expire(now)
+
+    def result(self, now: Optional[float] = None) -> list[int]:
+        """
+        Returns the top k values of the window, best first.
+
+        The heap is walked best-first with a second, small heap of positions, so
+        only the entries above the k-th best (and any expired ones among them)
+        are visited.
+
+        Parameters:
+        ----------
+        now : float, optional
+            The current time for duration windows; defaults to the newest pushed
+            timestamp if timestamps were given, otherwise to clock(). Values that
+            expire at now stay expired for later calls.
+
+        Time Complexity:
+        ---------------
+        O((k + s) log k), where s is the number of expired entries visited.
+        """
+        self._expire(now)
+        heap, live_from = self._heap, self._live_from
+        found: list[int] = []
+        frontier = [(heap[0], 0)] if heap and self.k else []
+        while frontier and len(found) < self.k:
+            (key, sequence), index = heapq.heappop(frontier)
+            if sequence >= live_from:
+                found.append(-key if self.largest else key)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return found
+
+
+class IndexedPriorityQueue:
+    """
+    A class representing a min-priority queue of distinct items with a position map.
+
+    The heap holds (priority, item) pairs and _position maps every item to its index
+    in the heap, so an item's entry can be found in O(1) and sifted into place after
+    its priority changes, instead of pushing a duplicate and skipping it later.
+    Only priorities are compared; items just have to be hashable.
+
+    Methods:
+    -------
+    push(item, priority)
+        Adds an item.
+    pop() -> tuple[item, priority]
+        Removes and returns the item with the smallest priority.
+    peek() -> tuple[item, priority]
+        Returns the item with the smallest priority.
+    update_priority(item, priority)
+        Changes the priority of an item (decrease-key or increase-key).
+    remove(item) -> priority
+        Removes an item.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, Hashable]] = []
+        self._position: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: Hashable) -> bool:
+        """
+        Checks if an item is in the queue in O(1).
+        """
+        return item in self._position
+
+    def priority(self, item: Hashable) -> float:
+        """
+        Returns the priority of an item.
+
+        Raises:
+        ------
+        KeyError
+            If the item is not in the queue.
+        """
+        return self._heap[self._position[item]][0]
+
+    def _sift_up(self, index: int) -> None:
+        heap, position = self._heap, self._position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if heap[parent][0] <= entry[0]:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][1]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[1]] = index
+
+    def _sift_down(self, index: int) -> None:
+        heap, position = self._heap, self._position
+        entry, size = heap[index], len(heap)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if entry[0] <= heap[child][0]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][1]] = index
+            index = child
+        heap[index] = entry
+        position[entry[1]] = index
+
+    def push(self, item: Hashable, priority: float) -> None:
+        """
+        Adds an item with the given priority.
+
+        Raises:
+        ------
+        ValueError
+            If the item is already in the queue; use update_priority instead.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        if item in self._position:
+            raise ValueError(f"{item!r} is already in the queue")
+        self._heap.append((priority, item))
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self) -> tuple[Hashable, float]:
+        """
+        Returns the item with the smallest priority and its priority in O(1).
+
+        Raises:
+        ------
+        IndexError
+            If the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty priority queue")
+        priority, item = self._heap[0]
+        return item, priority
+
+    def pop(self) -> tuple[Hashable, float]:
+        """
+        Removes and returns the item with the smallest priority and its priority.
+
+        Raises:
+        ------
+        IndexError
+            If the queue is empty.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        if not self._heap:
+            raise IndexError("pop from an empty priority queue")
+        item = self._heap[0][1]
+        return item, self.remove(item)
+
+    def update_priority(self, item: Hashable, priority: float) -> None:
+        """
+        Changes the priority of an item and restores the heap order.
+
+        Raises:
+        ------
+        KeyError
+            If the item is not in the queue.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        index = self._position[item]
+        old_priority = self._heap[index][0]
+        self._heap[index] = (priority, item)
+        if priority < old_priority:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def remove(self, item: Hashable) -> float:
+        """
+        Removes an item from the queue and returns its priority.
+
+        The last heap entry takes the removed entry's place and is sifted up or
+        down from there.
+
+        Raises:
+        ------
+        KeyError
+            If the item is not in the queue.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        index = self._position.pop(item)
+        priority = self._heap[index][0]
+        last = self._heap.pop()
+        if index < len(self._heap):
+            self._heap[index] = last
+            if last[0] < priority:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        return priority
+
+
+def benchmark_indexed_priority_queue(arr: list[int]) -> None:
+    """
+    Demonstrates IndexedPriorityQueue and compares decrease-key in place with
+    pushing duplicates and skipping stale entries (lazy deletion).
+    """
+    # An indexed heap answers membership without a scan and re-prioritizes in place
+    queue = IndexedPriorityQueue()
+    for index, value in enumerate(arr):
+        queue.push(f"task{index}", value)
+    queue.update_priority("task7", 1)
+    queue.remove("task2")
+    print(f"task2 in queue: {'task2' in queue}, smallest: {queue.peek()}")
+
+    # Benchmark: 100,000 decrease-key operations on 10,000 items
+    items = list(range(10_000))
+    updates = [(random.choice(items), random.random()) for _ in range(100_000)]
+
+    def lazy_deletion() -> int:
+        heap = [(1.0, item) for item in items]
+        best = dict.fromkeys(items, 1.0)
+        for item, priority in updates:
+            if priority < best[item]:
+                best[item] = priority
+                heapq.heappush(heap, (priority, item))
+        largest = len(heap)
+        while heap:
+            priority, item = heapq.heappop(heap)
+            if best.get(item) == priority:
+                del best[item]
+        return largest
+
+    def indexed() -> int:
+        queue = IndexedPriorityQueue()
+        for item in items:
+            queue.push(item, 1.0)
+        for item, priority in updates:
+            if priority < queue.priority(item):
+                queue.update_priority(item, priority)
+        largest = len(queue)
+        while queue:
+            queue.pop()
+        return largest
+
+    print(f"largest heap with lazy deletion: {lazy_deletion():,} entries")
+    print(f"largest heap with IndexedPriorityQueue: {indexed():,} entries")
+    time_lazy = timeit.timeit(lazy_deletion, number=1)
+    time_indexed = timeit.timeit(indexed, number=1)
+    print(f"Time taken by lazy deletion: {time_lazy:.3f} seconds")
+    print(f"Time taken by IndexedPriorityQueue: {time_indexed:.3f} seconds")
+
+
 def main():
     """
     Main function to demonstrate finding k largest and k smallest elements,
@@ -109,6 +731,53 @@ def main():
     value_to_search = 23
     print(f"Is {value_to_search} in heap: {search_in_heap(heap, value_to_search)}")
 
+    print(f"indices of the k largest: {find_k_largest(arr, k, return_indices=True)}")
+    benchmark_crossover()
+
+    benchmark_indexed_priority_queue(arr)
+
+    # Top k of a stream, without materializing it
+    top = TopK(k)
+    top.extend(iter(arr))
+    print(f"streaming k largest: {top.result()}, k={k}")
+
+    window = SlidingWindowTopK(k, size=5)
+    for value in arr:
+        window.push(value)
+    print(f"k largest of the last 5: {window.result()}, k={k}")  # [53, 45, 33]
+
+    # Event timestamps define the window, not the wall clock: with values at
+    # t = 0..12 and a 10-second window, the values at t <= 2 have expired.
+    timed = SlidingWindowTopK(k, duration=10)
+    for timestamp, value in enumerate(arr):
+        timed.push(value, timestamp=timestamp)
+    assert len(timed) == len(arr) - 3
+    assert timed.result() == find_k_largest(arr[3:], k)
+    print(f"k largest of the last 10 seconds: {timed.result()}, k={k}")
+    assert not timed.result(now=100)  # Expiry is permanent: time never goes back.
+
+    # Benchmark: a window of 10,000 items queried after every 10 pushes
+    stream = [random.randrange(10**9) for _ in range(100_000)]
+
+    def rescan_window():
+        recent: deque[int] = deque(maxlen=10_000)
+        for i, value in enumerate(stream):
+            recent.append(value)
+            if i % 10 == 0:
+                find_k_largest(recent, 10)
+
+    def sliding_window():
+        window = SlidingWindowTopK(10, size=10_000)
+        for i, value in enumerate(stream):
+            window.push(value)
+            if i % 10 == 0:
+                window.result()
+
+    time_rescan = timeit.timeit(rescan_window, number=1)
+    time_window = timeit.timeit(sliding_window, number=1)
+    print(f"Time taken by rescanning the window: {time_rescan:.3f} seconds")
+    print(f"Time taken by SlidingWindowTopK: {time_window:.3f} seconds")
+
 
 if __name__ == "__main__":
     main()
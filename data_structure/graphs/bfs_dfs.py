@@ -2,12 +2,34 @@
 This module provides implementations of Breadth-First Search (BFS) and Depth-First Search (DFS)
 for traversing graphs. The graph is represented as a dictionary where keys are node identifiers
 and values are lists of adjacent nodes.
+
+Besides the set-returning bfs and dfs, the module offers lazy, iterative
+traversals that yield nodes in visit order (optionally with their parent and
+depth) and helpers that stop as soon as a target or matching node is found.
+None of the traversals recurse, so arbitrarily long paths are supported.
+
+For undirected, low-diameter graphs, direction_optimizing_bfs switches to
+bottom-up expansion while the frontier is large, and multi_source_bfs computes
+the distance to the nearest of many seeds in a single pass.
 """
 
 from collections import deque
-from typing import Dict, List, Set, Optional
+import random
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Optional,
+    Tuple,
+    Union,
+)
 
 Graph = Dict[str, List[str]]
+Visit = Tuple[str, Optional[str], int]
 
 
 def bfs(graph_data: Graph, start: str) -> Set[str]:
@@ -47,16 +69,305 @@ def dfs(graph_data: Graph, vertex: str, visited: Optional[Set[str]] = None) -> S
     """
     if visited is None:
         visited = set()
-    if vertex in visited:
-        return visited
-
-    visited.add(vertex)
-    for n in graph_data.get(vertex, []):
-        if n not in visited:
-            dfs(graph_data, n, visited)
+    for _ in _dfs_walk(graph_data, vertex, visited):
+        pass
     return visited
 
 
+def bfs_iter(
+    graph_data: Graph, start: str, with_parents: bool = False
+) -> Iterator[Union[str, Visit]]:
+    """
+    Lazily yield the nodes of a breadth-first search in visit order.
+
+    Args:
+        graph_data (Graph): The graph to traverse.
+        start (str): The starting node for the BFS.
+        with_parents (bool): If True, yield (node, parent, depth) tuples instead of
+            nodes; the start node has parent None and depth 0.
+
+    Yields:
+        Union[str, Visit]: The next visited node, or its (node, parent, depth).
+    """
+    visited: Set[str] = {start}
+    queue: deque[Visit] = deque([(start, None, 0)])
+
+    while queue:
+        visit = queue.popleft()
+        v, _, depth = visit
+        yield visit if with_parents else v
+        for n in graph_data.get(v, []):
+            if n not in visited:
+                visited.add(n)
+                queue.append((n, v, depth + 1))
+
+
+def _dfs_walk(graph_data: Graph, start: str, visited: Set[str]) -> Iterator[Visit]:
+    """
+    Yield (node, parent, depth) in the pre-order of a recursive DFS, using an
+    explicit stack of neighbor iterators instead of the call stack.
+    """
+    if start in visited:
+        return
+    visited.add(start)
+    yield start, None, 0
+    stack: List[Tuple[str, Iterator[str]]] = [(start, iter(graph_data.get(start, [])))]
+
+    while stack:
+        v, neighbors = stack[-1]
+        for n in neighbors:
+            if n not in visited:
+                visited.add(n)
+                yield n, v, len(stack)
+                stack.append((n, iter(graph_data.get(n, []))))
+                break
+        else:
+            stack.pop()
+
+
+def dfs_iter(
+    graph_data: Graph, start: str, with_parents: bool = False
+) -> Iterator[Union[str, Visit]]:
+    """
+    Lazily yield the nodes of a depth-first search in visit (pre-)order.
+
+    The order is the same as the recursive formulation would produce.
+
+    Args:
+        graph_data (Graph): The graph to traverse.
+        start (str): The starting node for the DFS.
+        with_parents (bool): If True, yield (node, parent, depth) tuples instead of
+            nodes; the start node has parent None and depth 0.
+
+    Yields:
+        Union[str, Visit]: The next visited node, or its (node, parent, depth).
+    """
+    for visit in _dfs_walk(graph_data, start, set()):
+        yield visit if with_parents else visit[0]
+
+
+def find(
+    graph_data: Graph,
+    start: str,
+    predicate: Callable[[str], bool],
+    order: str = "bfs",
+) -> Optional[str]:
+    """
+    Return the first node, in traversal order, that satisfies a predicate.
+
+    The traversal stops as soon as a match is found.
+
+    Args:
+        graph_data (Graph): The graph to traverse.
+        start (str): The starting node.
+        predicate (Callable[[str], bool]): The condition to look for.
+        order (str): "bfs" (the closest match) or "dfs".
+
+    Returns:
+        Optional[str]: The first matching node, or None if no reachable node matches.
+
+    Raises:
+        ValueError: If order is neither "bfs" nor "dfs".
+    """
+    if order not in ("bfs", "dfs"):
+        raise ValueError(f"unsupported traversal order {order!r}")
+    traversal = bfs_iter if order == "bfs" else dfs_iter
+    return next((v for v in traversal(graph_data, start) if predicate(v)), None)
+
+
+def is_reachable(graph_data: Graph, start: str, target: str) -> bool:
+    """
+    Check whether target can be reached from start, stopping as soon as it is found.
+
+    Args:
+        graph_data (Graph): The graph to traverse.
+        start (str): The starting node.
+        target (str): The node to look for.
+
+    Returns:
+        bool: True if target is reachable from start.
+    """
+    return any(v == target for v in bfs_iter(graph_data, start))
+
+
+def shortest_path(graph_data: Graph, start: str, target: str) -> Optional[List[str]]:
+    """
+    Find a path with the fewest edges from start to target.
+
+    Args:
+        graph_data (Graph): The graph to traverse.
+        start (str): The starting node.
+        target (str): The node to reach.
+
+    Returns:
+        Optional[List[str]]: The nodes of the path from start to target, or None if
+        target is not reachable.
+    """
+    parents: Dict[str, Optional[str]] = {}
+    for v, parent, _ in bfs_iter(graph_data, start, with_parents=True):
+        parents[v] = parent
+        if v == target:
+            path = [v]
+            while parents[path[-1]] is not None:
+                path.append(parents[path[-1]])
+            path.reverse()
+            return path
+    return None
+
+
+def multi_source_bfs(graph_data: Graph, sources: Iterable[str]) -> Dict[str, int]:
+    """
+    Compute the distance from every reachable node to its nearest source in one pass.
+
+    All sources start in the queue at distance 0, so the cost is that of a single
+    BFS instead of one BFS per source.
+
+    Args:
+        graph_data (Graph): The graph to traverse.
+        sources (Iterable[str]): The seed nodes.
+
+    Returns:
+        Dict[str, int]: The number of edges between each reachable node and its
+        nearest source.
+    """
+    distances: Dict[str, int] = dict.fromkeys(sources, 0)
+    queue: deque[str] = deque(distances)
+
+    while queue:
+        v = queue.popleft()
+        next_distance = distances[v] + 1
+        for n in graph_data.get(v, []):
+            if n not in distances:
+                distances[n] = next_distance
+                queue.append(n)
+    return distances
+
+
+def direction_optimizing_bfs(
+    graph_data: Graph, start: str, alpha: int = 14, beta: int = 24
+) -> Dict[str, int]:
+    """
+    Perform a direction-optimizing breadth-first search and return distances.
+
+    Top-down steps scan the edges out of the frontier. Once those outnumber the
+    edges left to explore divided by alpha, the search switches to bottom-up
+    steps, where every unvisited node looks for any neighbor in the frontier and
+    stops at the first one; this skips most edges into already visited nodes when
+    the frontier covers a large part of the graph. It switches back once the
+    frontier shrinks below len(graph_data) / beta nodes.
+
+    The graph must be undirected (every edge listed at both ends), as bottom-up
+    steps read a node's neighbors as its parents.
+
+    Args:
+        graph_data (Graph): The undirected graph to traverse.
+        start (str): The starting node for the BFS.
+        alpha (int): The top-down to bottom-up switching threshold.
+        beta (int): The bottom-up to top-down switching threshold.
+
+    Returns:
+        Dict[str, int]: The number of edges from start to each reachable node; the
+        keys are exactly the nodes bfs visits.
+    """
+    distances: Dict[str, int] = {start: 0}
+    unvisited: Set[str] = set(graph_data)
+    unvisited.discard(start)
+    unexplored_edges = sum(len(neighbors) for neighbors in graph_data.values())
+    frontier: List[str] = [start]
+    level = 0
+    bottom_up = False
+
+    while frontier:
+        level += 1
+        frontier_edges = sum(len(graph_data.get(v, [])) for v in frontier)
+        unexplored_edges -= frontier_edges
+        if not bottom_up:
+            bottom_up = frontier_edges * alpha > unexplored_edges
+        else:
+            bottom_up = len(frontier) * beta >= len(graph_data)
+
+        next_frontier: List[str] = []
+        if bottom_up:
+            in_frontier = set(frontier)
+            for v in unvisited:
+                for n in graph_data[v]:
+                    if n in in_frontier:
+                        distances[v] = level
+                        next_frontier.append(v)
+                        break
+            unvisited.difference_update(next_frontier)
+        else:
+            for v in frontier:
+                for n in graph_data.get(v, []):
+                    if n not in distances:
+                        distances[n] = level
+                        next_frontier.append(n)
+                        unvisited.discard(n)
+        frontier = next_frontier
+    return distances
+
+
+def power_law_graph(num_nodes: int, edges_per_node: int, seed: int = 0) -> Graph:
+    """
+    Generate an undirected graph with a power-law degree distribution.
+
+    Nodes are added one at a time and attached to edges_per_node existing nodes
+    chosen with probability proportional to their degree (Barabasi-Albert).
+
+    Args:
+        num_nodes (int): The number of nodes.
+        edges_per_node (int): The number of edges each new node brings.
+        seed (int): The random seed.
+
+    Returns:
+        Graph: The generated graph; nodes are named "0", "1", ...
+    """
+    rng = random.Random(seed)
+    adjacency: Dict[int, Set[int]] = {v: set() for v in range(num_nodes)}
+    # Every node appears here once per incident edge, so a uniform pick from the
+    # list is a pick proportional to degree.
+    endpoints: List[int] = list(range(edges_per_node))
+    for v in range(edges_per_node, num_nodes):
+        targets: Set[int] = set()
+        while len(targets) < edges_per_node:
+            targets.add(rng.choice(endpoints))
+        for n in targets:
+            adjacency[v].add(n)
+            adjacency[n].add(v)
+            endpoints.extend((v, n))
+    return {str(v): [str(n) for n in neighbors] for v, neighbors in adjacency.items()}
+
+
+def benchmark_power_law(num_nodes: int = 200_000, edges_per_node: int = 8) -> None:
+    """
+    Compare bfs with direction_optimizing_bfs, and multi_source_bfs with one bfs per
+    seed, on a synthetic power-law graph.
+    """
+    graph_data = power_law_graph(num_nodes, edges_per_node)
+    print(f"power-law graph with {num_nodes:,} nodes, {edges_per_node} edges per node")
+
+    start = time.perf_counter()
+    reached = bfs(graph_data, "0")
+    time_bfs = time.perf_counter() - start
+    start = time.perf_counter()
+    distances = direction_optimizing_bfs(graph_data, "0")
+    time_direction = time.perf_counter() - start
+    assert distances.keys() == reached
+    print(f"  bfs: {time_bfs:.3f} seconds")
+    print(f"  direction_optimizing_bfs: {time_direction:.3f} seconds")
+
+    seeds = [str(v) for v in random.Random(1).sample(range(num_nodes), 16)]
+    start = time.perf_counter()
+    per_seed = [direction_optimizing_bfs(graph_data, seed) for seed in seeds]
+    time_per_seed = time.perf_counter() - start
+    start = time.perf_counter()
+    nearest = multi_source_bfs(graph_data, seeds)
+    time_multi = time.perf_counter() - start
+    assert nearest == {v: min(d[v] for d in per_seed) for v in per_seed[0]}
+    print(f"  one search per seed, {len(seeds)} seeds: {time_per_seed:.3f} seconds")
+    print(f"  multi_source_bfs, {len(seeds)} seeds: {time_multi:.3f} seconds")
+
+
 if __name__ == "__main__":
     graph_example: Graph = {
         "A": ["B", "C"],
@@ -69,3 +380,18 @@ if __name__ == "__main__":
 
     print(bfs(graph_example, "A"))  # {'A', 'B', 'C', 'D', 'E', 'F'}
     print(dfs(graph_example, "A"))  # {'A', 'B', 'D', 'E', 'C', 'F'} (order can vary)
+    print(list(bfs_iter(graph_example, "A")))  # ['A', 'B', 'C', 'D', 'E', 'F']
+    print(list(dfs_iter(graph_example, "A")))  # ['A', 'B', 'D', 'E', 'F', 'C']
+    print(list(bfs_iter(graph_example, "A", with_parents=True))[-1])  # ('F', 'C', 2)
+    print(shortest_path(graph_example, "A", "F"))  # ['A', 'C', 'F']
+
+    # A 100,000 node chain: far beyond the recursion limit, and the reachability
+    # check stops after visiting two nodes.
+    chain: Graph = {str(i): [str(i - 1), str(i + 1)] for i in range(1, 99_999)}
+    chain["0"], chain["99999"] = ["1"], ["99998"]
+    print(len(dfs(chain, "0")))  # 100000
+    print(is_reachable(chain, "50000", "50001"))  # True
+    print(direction_optimizing_bfs(graph_example, "A"))  # {'A': 0, 'B': 1, ..., 'F': 2}
+    print(multi_source_bfs(graph_example, ["D", "F"]))  # {'D': 0, 'F': 0, 'B': 1, ...}
+
+    benchmark_power_law()
@@ -0,0 +1,352 @@
+"""
+Module: csr_graph
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a frozen, compressed sparse row (CSR) graph. Vertex names are
+interned once to dense integer ids, and the adjacency is stored in two flat
+array('q') buffers: offsets[v] .. offsets[v + 1] delimits the slice of neighbors
+that holds the (ascending) neighbor ids of vertex v. An edge costs 8 bytes per
+direction instead of a hashed set entry, and traversals run on integers with a
+bytearray as the visited set instead of hashing strings.
+
+A CSRGraph is read-only. It can be built from a simple_graph.Graph, from a
+stream of edges, or on top of a memory-mapped graph_storage file without copying
+the adjacency. It implements get(vertex, default), so bfs and dfs from bfs_dfs
+run on it directly, and its own bfs/dfs methods provide the integer fast path.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+import random
+import time
+import tracemalloc
+from typing import Iterable, Iterator, Set, Union
+
+import bfs_dfs
+from simple_graph import Graph
+
+Buffer = Union[array, memoryview]
+
+
+def _intern_edges(
+    edges: Iterable[tuple[str, str]], vertices: Iterable[str]
+) -> tuple[list[str], array, array]:
+    """
+    Gives every vertex a dense id in order of first sight and returns the names
+    plus the edges as two int64 columns of ids.
+    """
+    ids: dict[str, int] = {}
+    names: list[str] = []
+    for vertex in vertices:
+        if vertex not in ids:
+            ids[vertex] = len(names)
+            names.append(vertex)
+    sources, targets = array("q"), array("q")
+    for source, target in edges:
+        for vertex in (source, target):
+            if vertex not in ids:
+                ids[vertex] = len(names)
+                names.append(vertex)
+        sources.append(ids[source])
+        targets.append(ids[target])
+    return names, sources, targets
+
+
+def _group_rows(
+    vertex_count: int, sources: array, targets: array
+) -> tuple[array, array]:
+    """
+    Groups the edge columns by source with a counting sort and returns the CSR
+    offsets and neighbor ids, every row sorted and without duplicates.
+    """
+    degrees = array("q", bytes(8 * (vertex_count + 1)))
+    for source in sources:
+        degrees[source + 1] += 1
+    for index in range(vertex_count):
+        degrees[index + 1] += degrees[index]
+    cursor = array("q", degrees)
+    placed = array("q", bytes(8 * len(sources)))
+    for source, target in zip(sources, targets):
+        placed[cursor[source]] = target
+        cursor[source] += 1
+
+    offsets = array("q", [0])
+    neighbors = array("q")
+    for index in range(vertex_count):
+        row = sorted(set(placed[degrees[index] : degrees[index + 1]]))
+        neighbors.extend(row)
+        offsets.append(len(neighbors))
+    return offsets, neighbors
+
+
+class CSRGraph:
+    """
+    A class representing a frozen graph in compressed sparse row form.
+
+    Attributes:
+    ----------
+    names : list[str]
+        The vertex names, indexed by vertex id.
+    ids : dict[str, int]
+        The vertex id of every name.
+    offsets : array('q') or memoryview
+        offsets[v] .. offsets[v + 1] is the range of neighbors holding vertex v's
+        neighbors.
+    neighbors : array('q') or memoryview
+        The neighbor ids of all vertices, ascending within each vertex.
+
+    Methods:
+    -------
+    from_graph(graph: Graph) -> CSRGraph
+        Freezes a simple_graph.Graph.
+    from_edges(edges: Iterable[tuple[str, str]], directed: bool) -> CSRGraph
+        Builds a graph from a stream of edges.
+    get(vertex: str, default) -> list[str]
+        Returns the neighbors of a vertex, as the bfs_dfs functions expect.
+    bfs(start: str) -> Set[str] / dfs(start: str) -> Set[str]
+        Traverse on integer ids and return the reachable vertices.
+    """
+
+    def __init__(self, names: list[str], offsets: Buffer, neighbors: Buffer):
+        if len(offsets) != len(names) + 1:
+            raise ValueError("offsets must have one entry more than names")
+        self.names = names
+        self.ids = {name: index for index, name in enumerate(names)}
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        """
+        Freezes a simple_graph.Graph into CSR form.
+
+        Time Complexity:
+        ---------------
+        O(V + E log d), where d is the largest degree (rows are sorted).
+        """
+        names = list(graph.adjacency_list)
+        ids = {name: index for index, name in enumerate(names)}
+        offsets = array("q", [0])
+        neighbors = array("q")
+        for name in names:
+            neighbors.extend(sorted(ids[n] for n in graph.adjacency_list[name]))
+            offsets.append(len(neighbors))
+        return cls(names, offsets, neighbors)
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[tuple[str, str]],
+        directed: bool = False,
+        vertices: Iterable[str] = (),
+    ) -> "CSRGraph":
+        """
+        Builds a graph from a stream of (source, target) pairs.
+
+        The edges are consumed once into two int64 columns, then placed with a
+        counting sort; no per-vertex Python containers are created. Duplicate edges
+        are dropped.
+
+        Parameters:
+        ----------
+        edges : Iterable[tuple[str, str]]
+            The edges; vertices are created on first sight.
+        directed : bool
+            If False (the default), every edge is stored in both directions like
+            simple_graph.Graph does.
+        vertices : Iterable[str]
+            Extra vertices to create, e.g. isolated ones.
+
+        Time Complexity:
+        ---------------
+        O(V + E log d)
+        """
+        names, sources, targets = _intern_edges(edges, vertices)
+        if not directed:
+            sources, targets = sources + targets, targets + sources
+        return cls(names, *_group_rows(len(names), sources, targets))
+
+    @classmethod
+    def from_mapped(cls, mapped) -> "CSRGraph":
+        """
+        Wraps a graph_storage.MappedGraph without copying its adjacency buffers.
+
+        The CSRGraph is only valid while the mapped file stays open.
+        """
+        return cls(list(mapped), mapped.offsets, mapped.neighbor_ids)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __contains__(self, vertex: str) -> bool:
+        return vertex in self.ids
+
+    @property
+    def edge_entries(self) -> int:
+        """
+        Returns the number of stored adjacency entries (2 per undirected edge).
+        """
+        return len(self.neighbors)
+
+    def degree(self, vertex: str) -> int:
+        """
+        Returns the number of neighbors of a vertex in O(1).
+        """
+        vertex_id = self.ids[vertex]
+        return self.offsets[vertex_id + 1] - self.offsets[vertex_id]
+
+    def neighbor_ids(self, vertex_id: int) -> Buffer:
+        """
+        Returns the ascending neighbor ids of a vertex id.
+        """
+        return self.neighbors[self.offsets[vertex_id] : self.offsets[vertex_id + 1]]
+
+    def get(self, vertex: str, default=None):
+        """
+        Returns the neighbor names of a vertex, or default if it does not exist.
+
+        This is the part of the mapping interface that bfs_dfs relies on.
+        """
+        vertex_id = self.ids.get(vertex)
+        if vertex_id is None:
+            return default
+        names = self.names
+        return [names[n] for n in self.neighbor_ids(vertex_id)]
+
+    def has_edge(self, vertex_one: str, vertex_two: str) -> bool:
+        """
+        Checks if an edge exists, by binary search over the neighbor row.
+        """
+        id_one, id_two = self.ids.get(vertex_one), self.ids.get(vertex_two)
+        if id_one is None or id_two is None:
+            return False
+        row = self.neighbor_ids(id_one)
+        index = bisect_left(row, id_two)
+        return index < len(row) and row[index] == id_two
+
+    def bfs_ids(self, start_id: int) -> bytearray:
+        """
+        Performs a breadth-first search on vertex ids.
+
+        Returns:
+        -------
+        bytearray
+            visited[v] is 1 for every vertex v reachable from start_id.
+        """
+        offsets, neighbors = self.offsets, self.neighbors
+        visited = bytearray(len(self.names))
+        visited[start_id] = 1
+        queue: deque[int] = deque([start_id])
+        while queue:
+            v = queue.popleft()
+            for n in neighbors[offsets[v] : offsets[v + 1]]:
+                if not visited[n]:
+                    visited[n] = 1
+                    queue.append(n)
+        return visited
+
+    def dfs_ids(self, start_id: int) -> bytearray:
+        """
+        Performs an iterative depth-first search on vertex ids.
+
+        Returns:
+        -------
+        bytearray
+            visited[v] is 1 for every vertex v reachable from start_id.
+        """
+        offsets, neighbors = self.offsets, self.neighbors
+        visited = bytearray(len(self.names))
+        stack = [start_id]
+        while stack:
+            v = stack.pop()
+            if visited[v]:
+                continue
+            visited[v] = 1
+            row = neighbors[offsets[v] : offsets[v + 1]]
+            stack.extend(n for n in reversed(row) if not visited[n])
+        return visited
+
+    def _names_of(self, visited: bytearray) -> Set[str]:
+        names = self.names
+        return {names[i] for i, flag in enumerate(visited) if flag}
+
+    def bfs(self, start: str) -> Set[str]:
+        """
+        Returns the set of vertices reachable from start, like bfs_dfs.bfs.
+        """
+        vertex_id = self.ids.get(start)
+        if vertex_id is None:
+            return {start}
+        return self._names_of(self.bfs_ids(vertex_id))
+
+    def dfs(self, start: str) -> Set[str]:
+        """
+        Returns the set of vertices reachable from start, like bfs_dfs.dfs.
+        """
+        vertex_id = self.ids.get(start)
+        if vertex_id is None:
+            return {start}
+        return self._names_of(self.dfs_ids(vertex_id))
+
+
+def _random_graph(vertex_count: int, edge_count: int) -> Graph:
+    graph = Graph()
+    names = [f"v{i}" for i in range(vertex_count)]
+    for name in names:
+        graph.add_vertex(name)
+    for _ in range(edge_count):
+        graph.add_edge(random.choice(names), random.choice(names))
+    return graph
+
+
+def _traced(build):
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current - baseline
+
+
+def main():
+    """
+    The main function to demonstrate the CSRGraph and to compare its memory per edge
+    and traversal throughput against the dict-of-sets Graph.
+    """
+    csr = CSRGraph.from_edges(
+        [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("C", "E"), ("D", "E")],
+        vertices=["F"],
+    )
+    print(f"neighbors of C: {csr.get('C')}")
+    print(f"bfs_dfs.bfs on CSR: {sorted(bfs_dfs.bfs(csr, 'A'))}")
+    print(f"CSRGraph.dfs: {sorted(csr.dfs('A'))}")
+
+    vertex_count, edge_count = 100_000, 1_000_000
+    print(f"random graph with {vertex_count:,} vertices and {edge_count:,} edges")
+    graph, graph_bytes = _traced(lambda: _random_graph(vertex_count, edge_count))
+    frozen, csr_bytes = _traced(lambda: CSRGraph.from_graph(graph))
+    entries = frozen.edge_entries
+    print(f"  memory per adjacency entry - Graph: {graph_bytes / entries:.1f} bytes")
+    print(f"  memory per adjacency entry - CSRGraph: {csr_bytes / entries:.1f} bytes")
+
+    for label, traverse in [
+        ("bfs_dfs.bfs on Graph", lambda: bfs_dfs.bfs(graph.adjacency_list, "v0")),
+        ("bfs_dfs.bfs on CSRGraph", lambda: bfs_dfs.bfs(frozen, "v0")),
+        ("CSRGraph.bfs_ids", lambda: frozen.bfs_ids(0)),
+    ]:
+        start = time.perf_counter()
+        traverse()
+        elapsed = time.perf_counter() - start
+        print(f"  {label}: {entries / elapsed:,.0f} edges/s ({elapsed:.3f} seconds)")
+
+
+if __name__ == "__main__":
+    main()
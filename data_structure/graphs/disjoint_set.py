@@ -0,0 +1,144 @@
+"""
+Module: disjoint_set
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a disjoint-set (union-find) structure over hashable items.
+find uses path compression and union attaches the shallower tree under the deeper
+one (union by rank), so any sequence of m operations on n items costs
+O(m * alpha(n)), where the inverse Ackermann function alpha(n) is below 5 for
+every practical n.
+"""
+
+from typing import Hashable, Iterable
+
+
+class DisjointSet:
+    """
+    A class representing a partition of items into disjoint sets.
+
+    Methods:
+    -------
+    add(item) -> bool
+        Adds an item as a singleton set.
+    find(item) -> item
+        Returns the representative of the set containing item.
+    union(item_one, item_two) -> bool
+        Merges the sets containing the two items.
+    connected(item_one, item_two) -> bool
+        Checks if two items are in the same set.
+    """
+
+    def __init__(self, items: Iterable[Hashable] = ()):
+        self._parent: dict = {}
+        self._rank: dict = {}
+        self.set_count = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._parent
+
+    def add(self, item: Hashable) -> bool:
+        """
+        Adds an item as a new singleton set.
+
+        Returns:
+        -------
+        bool
+            True if the item was added, False if it already exists.
+        """
+        if item in self._parent:
+            return False
+        self._parent[item] = item
+        self._rank[item] = 0
+        self.set_count += 1
+        return True
+
+    def find(self, item: Hashable) -> Hashable:
+        """
+        Returns the representative of the set containing item.
+
+        Every item on the path to the root is re-linked directly to the root.
+
+        Raises:
+        ------
+        KeyError
+            If the item was never added.
+
+        Time Complexity:
+        ---------------
+        O(alpha(n)) amortized.
+        """
+        parent = self._parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, item_one: Hashable, item_two: Hashable) -> bool:
+        """
+        Merges the sets containing the two items.
+
+        Returns:
+        -------
+        bool
+            True if two sets were merged, False if the items were already together.
+
+        Raises:
+        ------
+        KeyError
+            If either item was never added.
+
+        Time Complexity:
+        ---------------
+        O(alpha(n)) amortized.
+        """
+        root_one, root_two = self.find(item_one), self.find(item_two)
+        if root_one == root_two:
+            return False
+        rank = self._rank
+        if rank[root_one] < rank[root_two]:
+            root_one, root_two = root_two, root_one
+        self._parent[root_two] = root_one
+        if rank[root_one] == rank[root_two]:
+            rank[root_one] += 1
+        del rank[root_two]
+        self.set_count -= 1
+        return True
+
+    def connected(self, item_one: Hashable, item_two: Hashable) -> bool:
+        """
+        Checks if two items are in the same set.
+
+        Raises:
+        ------
+        KeyError
+            If either item was never added.
+        """
+        return self.find(item_one) == self.find(item_two)
+
+
+def main():
+    """
+    The main function to demonstrate the DisjointSet.
+    """
+    sets = DisjointSet("ABCDEF")
+    sets.union("A", "B")
+    sets.union("C", "D")
+    sets.union("B", "D")
+    print(f"A and C connected: {sets.connected('A', 'C')}")  # True
+    print(f"A and E connected: {sets.connected('A', 'E')}")  # False
+    print(f"number of sets: {sets.set_count}")  # 3
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,472 @@
+"""
+Module: graph_storage
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a compact binary on-disk format for the undirected Graph of
+simple_graph. Vertices get dense ids in the order of their UTF-8 encoded names and
+the adjacency is stored in compressed sparse row (CSR) form, so the whole file is
+a header followed by a few flat arrays:
+
+    offset  size      field
+    0       4         magic b"GRPH"
+    4       2         format version (currently 2)
+    6       2         flags; bit 0 set if the weight array is present
+    8       8         number of vertices V
+    16      8         number of adjacency entries E (twice the number of edges)
+    24      8         length in bytes of the name blob B
+    32      8*(V+1)   name offsets into the name blob, int64
+    ...     8*(V+1)   adjacency offsets into the neighbor array, int64
+    ...     8*E       neighbor ids, int64, ascending within each vertex
+    ...     8*E       edge weights, float64, parallel to the neighbor ids (optional)
+    ...     B         UTF-8 vertex names, concatenated in id order
+
+The weight array is only written when some edge has a weight other than
+Graph.DEFAULT_WEIGHT, so unweighted graphs keep the smaller layout. Version 1
+files, which never had weights, are still readable.
+
+All numbers are little-endian on every host; big-endian hosts byte-swap the
+arrays when writing and reading (losing the zero-copy mapping of the arrays, but
+not the format). MappedGraph memory-maps a file and answers queries in place:
+names are found by binary search over the sorted name blob and neighbor lists are
+slices of the mapped arrays, so opening a graph costs O(1). load_graph rebuilds a
+mutable Graph when one is needed.
+"""
+
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import timeit
+from typing import Iterator, Optional
+
+from simple_graph import Graph
+
+MAGIC = b"GRPH"
+FORMAT_VERSION = 2
+READABLE_VERSIONS = (1, 2)
+HEADER = struct.Struct("<4sHHqqq")
+HAS_WEIGHTS = 1
+
+
+# The arrays are stored little-endian; a big-endian host swaps them on the way.
+_SWAP = sys.byteorder != "little"
+
+
+def _write_array(file, values: array) -> None:
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(file)
+
+
+def save_graph(graph: Graph, path: str) -> None:
+    """
+    Writes a graph to path.
+
+    Parameters:
+    ----------
+    graph : Graph
+        The graph to save.
+    path : str
+        The destination file.
+    """
+    encoded = sorted(vertex.encode() for vertex in graph.adjacency_list)
+    names = [name.decode() for name in encoded]
+    ids = {name: index for index, name in enumerate(names)}
+
+    name_offsets = array("q", [0])
+    for name in encoded:
+        name_offsets.append(name_offsets[-1] + len(name))
+    offsets = array("q", [0])
+    neighbors = array("q")
+    for name in names:
+        neighbors.extend(sorted(ids[n] for n in graph.adjacency_list[name]))
+        offsets.append(len(neighbors))
+    sections = [name_offsets, offsets, neighbors]
+    flags = 0
+    if graph.weights:
+        flags |= HAS_WEIGHTS
+        sections.append(_edge_weights(graph, ids, offsets, neighbors))
+
+    blob = b"".join(encoded)
+    with open(path, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC, FORMAT_VERSION, flags, len(names), len(neighbors), len(blob)
+            )
+        )
+        for section in sections:
+            _write_array(file, section)
+        file.write(blob)
+
+
+def _edge_weights(
+    graph: Graph, ids: dict[str, int], offsets: array, neighbors: array
+) -> array:
+    """
+    Returns the float64 weight of every adjacency entry, in neighbor-array order.
+    """
+    weights = array("d", [graph.DEFAULT_WEIGHT]) * len(neighbors)
+    for key, weight in graph.weights.items():
+        one, two = ids[key[0]], ids[key[1]]
+        for vertex_id, neighbor_id in ((one, two), (two, one)):
+            lo, hi = offsets[vertex_id], offsets[vertex_id + 1]
+            weights[bisect_left(neighbors, neighbor_id, lo, hi)] = weight
+    return weights
+
+
+def _layout(data) -> tuple[list[tuple[str, int, int]], int]:
+    """
+    Validates the header of a GRPH file and locates its arrays.
+
+    Returns:
+    -------
+    tuple[list[tuple[str, int, int]], int]
+        The (typecode, start, stop) byte range of every array, and the offset of
+        the name blob.
+
+    Raises:
+    ------
+    ValueError
+        If the data is not a complete GRPH file of a readable version.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("truncated GRPH header")
+    magic, version, flags, vertex_count, entries, blob_size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"not a GRPH file (magic {magic!r})")
+    if version not in READABLE_VERSIONS:
+        raise ValueError(f"unsupported GRPH version {version}")
+
+    lengths = [("q", vertex_count + 1), ("q", vertex_count + 1), ("q", entries)]
+    if version >= 2 and flags & HAS_WEIGHTS:
+        lengths.append(("d", entries))
+    start = HEADER.size
+    sections = []
+    for typecode, length in lengths:
+        sections.append((typecode, start, start + 8 * length))
+        start += 8 * length
+    if len(data) < start + blob_size:
+        raise ValueError("truncated GRPH file")
+    return sections, start
+
+
+class MappedGraph:
+    """
+    A class representing a read-only, memory-mapped view of a saved graph.
+
+    It also behaves like the read-only mapping that bfs and dfs in bfs_dfs expect:
+    get(vertex, default) returns the neighbors of a vertex.
+
+    Methods:
+    -------
+    has_vertex(vertex: str) -> bool
+        Checks if a vertex exists, by binary search over the names.
+    has_edge(vertex_one: str, vertex_two: str) -> bool
+        Checks if an edge exists, by binary search over the neighbor ids.
+    neighbors(vertex: str) -> list[str]
+        Returns the neighbors of a vertex.
+    close()
+        Releases the mapping.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            sections, blob_start = _layout(self._mmap)
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        view = memoryview(self._mmap)
+        arrays = [self._section(view, *section) for section in sections]
+        self._name_offsets, self.offsets, self.neighbor_ids = arrays[:3]
+        # None when every edge has the default weight.
+        self.edge_weights = arrays[3] if len(arrays) > 3 else None
+        self._blob_start = blob_start
+        self.vertex_count = len(self._name_offsets) - 1
+        view.release()
+
+    @staticmethod
+    def _section(view: memoryview, typecode: str, lo: int, hi: int):
+        """
+        Returns the array of 8-byte numbers stored in view[lo:hi]: a zero-copy view
+        on little-endian hosts, a byte-swapped copy on big-endian ones.
+        """
+        if not _SWAP:
+            return view[lo:hi].cast(typecode)
+        values = array(typecode, bytes(view[lo:hi]))
+        values.byteswap()
+        return values
+
+    def close(self) -> None:
+        """
+        Releases the memory mapping; the object cannot be used afterwards.
+        """
+        for section in (
+            self._name_offsets,
+            self.offsets,
+            self.neighbor_ids,
+            self.edge_weights,
+        ):
+            if isinstance(section, memoryview):
+                section.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedGraph":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _name_bytes(self, vertex_id: int) -> bytes:
+        start = self._blob_start
+        return self._mmap[
+            start
+            + self._name_offsets[vertex_id] : start
+            + self._name_offsets[vertex_id + 1]
+        ]
+
+    def name(self, vertex_id: int) -> str:
+        """
+        Returns the name of the vertex with the given id.
+        """
+        return self._name_bytes(vertex_id).decode()
+
+    def vertex_id(self, vertex: str) -> Optional[int]:
+        """
+        Returns the id of a vertex, or None if it does not exist.
+
+        Time Complexity:
+        ---------------
+        O(log V) name comparisons.
+        """
+        key = vertex.encode()
+        lo, hi = 0, self.vertex_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.vertex_count and self._name_bytes(lo) == key:
+            return lo
+        return None
+
+    def __len__(self) -> int:
+        return self.vertex_count
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.name(i) for i in range(self.vertex_count))
+
+    def __contains__(self, vertex: str) -> bool:
+        return self.vertex_id(vertex) is not None
+
+    def has_vertex(self, vertex: str) -> bool:
+        """
+        Checks if a vertex exists in the graph.
+        """
+        return self.vertex_id(vertex) is not None
+
+    def neighbor_slice(self, vertex_id: int) -> memoryview:
+        """
+        Returns the ascending neighbor ids of a vertex as a zero-copy view (a copy
+        on big-endian hosts).
+
+        The view must be released (or dropped) before the graph is closed.
+        """
+        return self.neighbor_ids[self.offsets[vertex_id] : self.offsets[vertex_id + 1]]
+
+    def neighbors(self, vertex: str) -> list[str]:
+        """
+        Returns the neighbors of a vertex, or an empty list if it does not exist.
+        """
+        vertex_id = self.vertex_id(vertex)
+        if vertex_id is None:
+            return []
+        return [self.name(n) for n in self.neighbor_slice(vertex_id)]
+
+    def get(self, vertex: str, default=None):
+        """
+        Returns the neighbors of a vertex, or default if it does not exist.
+        """
+        vertex_id = self.vertex_id(vertex)
+        if vertex_id is None:
+            return default
+        return [self.name(n) for n in self.neighbor_slice(vertex_id)]
+
+    def _entry(self, vertex_one: str, vertex_two: str) -> Optional[int]:
+        """
+        Returns the position of vertex_two in the neighbor array of vertex_one, or
+        None if there is no such edge.
+        """
+        id_one, id_two = self.vertex_id(vertex_one), self.vertex_id(vertex_two)
+        if id_one is None or id_two is None:
+            return None
+        lo, hi = self.offsets[id_one], self.offsets[id_one + 1]
+        index = bisect_left(self.neighbor_ids, id_two, lo, hi)
+        if index < hi and self.neighbor_ids[index] == id_two:
+            return index
+        return None
+
+    def has_edge(self, vertex_one: str, vertex_two: str) -> bool:
+        """
+        Checks if an edge exists between two vertices.
+        """
+        return self._entry(vertex_one, vertex_two) is not None
+
+    def weight(self, vertex_one: str, vertex_two: str) -> float:
+        """
+        Returns the weight of an edge, like Graph.weight.
+
+        Raises:
+        ------
+        KeyError
+            If the edge does not exist.
+        """
+        index = self._entry(vertex_one, vertex_two)
+        if index is None:
+            raise KeyError((vertex_one, vertex_two))
+        weights = self.edge_weights
+        if weights is None:
+            return Graph.DEFAULT_WEIGHT
+        return weights[index]
+
+
+def load_graph(path: str) -> Graph:
+    """
+    Loads a graph saved by save_graph into a new mutable Graph.
+    """
+    with MappedGraph(path) as mapped:
+        names = list(mapped)
+        graph = Graph()
+        adjacency = graph.adjacency_list
+        offsets, neighbor_ids = mapped.offsets, mapped.neighbor_ids
+        for vertex_id, name in enumerate(names):
+            row = neighbor_ids[offsets[vertex_id] : offsets[vertex_id + 1]].tolist()
+            adjacency[name] = {names[n] for n in row}
+        if mapped.edge_weights is not None:
+            _load_weights(graph, names, mapped)
+    return graph
+
+
+def _load_weights(graph: Graph, names: list[str], mapped: MappedGraph) -> None:
+    """
+    Copies the non-default weights of a mapped graph into graph.weights.
+    """
+    offsets, neighbor_ids = mapped.offsets, mapped.neighbor_ids
+    default = graph.DEFAULT_WEIGHT
+    for vertex_id, name in enumerate(names):
+        for index in range(offsets[vertex_id], offsets[vertex_id + 1]):
+            neighbor_id, weight = neighbor_ids[index], mapped.edge_weights[index]
+            if vertex_id <= neighbor_id and weight != default:
+                graph.weights[Graph.edge_key(name, names[neighbor_id])] = weight
+
+
+def verify_round_trip(graph: Graph, path: str) -> list[str]:
+    """
+    Saves graph to path and checks that load_graph and MappedGraph both give it
+    back unchanged.
+
+    Returns:
+    -------
+    list[str]
+        A description of every mismatch; empty when the round trip is exact.
+    """
+    save_graph(graph, path)
+    problems = []
+    loaded = load_graph(path)
+    if loaded.adjacency_list != graph.adjacency_list:
+        problems.append("load_graph returned a different adjacency list")
+    if loaded.weights != graph.weights:
+        problems.append("load_graph returned different edge weights")
+    with MappedGraph(path) as mapped:
+        if set(mapped) != set(graph.adjacency_list):
+            problems.append("the mapped graph has different vertices")
+        for vertex, neighbors in graph.adjacency_list.items():
+            if set(mapped.neighbors(vertex)) != neighbors:
+                problems.append(f"the mapped neighbors of {vertex!r} differ")
+            for neighbor in neighbors:
+                if not mapped.has_edge(vertex, neighbor):
+                    problems.append(f"the mapped graph lacks {vertex!r}-{neighbor!r}")
+                elif mapped.weight(vertex, neighbor) != graph.weight(vertex, neighbor):
+                    problems.append(f"the weight of {vertex!r}-{neighbor!r} differs")
+    return problems
+
+
+def benchmark_warm_start(path: str, n: int = 100_000) -> None:
+    """
+    Compares rebuilding a graph edge by edge with load_graph and with
+    memory-mapping the saved file.
+    """
+    edges = [(f"v{i}", f"v{(i * 7 + 1) % n}") for i in range(n)]
+    edges += [(f"v{i}", f"v{(i + 1) % n}") for i in range(n)]
+
+    def rebuild() -> Graph:
+        rebuilt = Graph()
+        for i in range(n):
+            rebuilt.add_vertex(f"v{i}")
+        for vertex_one, vertex_two in edges:
+            rebuilt.add_edge(vertex_one, vertex_two)
+        return rebuilt
+
+    save_graph(rebuild(), path)
+    print(f"file size for {n:,} vertices: {os.path.getsize(path):,} bytes")
+
+    def map_and_query() -> bool:
+        with MappedGraph(path) as mapped:
+            return mapped.has_edge("v1", "v2")
+
+    time_rebuild = timeit.timeit(rebuild, number=1)
+    time_load = timeit.timeit(lambda: load_graph(path), number=1)
+    time_mmap = timeit.timeit(map_and_query, number=1)
+    print(f"warm start by re-adding vertices and edges: {time_rebuild:.3f} seconds")
+    print(f"warm start by load_graph: {time_load:.3f} seconds")
+    print(f"warm start by memory-mapping: {time_mmap:.6f} seconds")
+
+
+def main():
+    """
+    The main function to round-trip a graph through the on-disk format and compare
+    warm-start times.
+    """
+    graph = Graph()
+    for vertex in ["A", "B", "C", "D", "E", "F", "Ä"]:
+        graph.add_vertex(vertex)
+    for vertex_one, vertex_two in [
+        ("A", "B"),
+        ("A", "C"),
+        ("B", "D"),
+        ("C", "D"),
+        ("C", "E"),
+        ("D", "E"),
+        ("E", "F"),
+        ("F", "Ä"),
+    ]:
+        graph.add_edge(vertex_one, vertex_two)
+    graph.add_edge("E", "F", 7.5)
+    graph.add_edge("Ä", "Ä", 2.0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.grph")
+        problems = verify_round_trip(graph, path)
+        if problems:
+            raise RuntimeError(f"round trip failed: {problems}")
+        with MappedGraph(path) as mapped:
+            print(f"mapped neighbors of C: {mapped.neighbors('C')}")
+            print(f"mapped weight of E-F: {mapped.weight('E', 'F')}")
+        print("round trip: ok")
+
+        benchmark_warm_start(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Module: parallel_bfs
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a level-synchronous breadth-first search that expands each
+frontier in parallel over a process pool. The graph is frozen into CSR form and
+its offsets and neighbor arrays, together with the visited flags, are placed in
+multiprocessing.shared_memory blocks that every worker attaches to once, so the
+graph is never pickled. Per level, only the frontier ids go to the workers and
+only the newly discovered ids come back, both as packed int64 bytes.
+
+Levels whose frontier is smaller than min_parallel_frontier are expanded in the
+calling process, where the round trip to the pool would cost more than the work.
+The set of reachable vertices is identical to the one bfs_dfs.bfs returns.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+import random
+import time
+from typing import Optional, Set
+
+import bfs_dfs
+from csr_graph import CSRGraph
+
+# The shared arrays of the pool worker this module is running in.
+_worker_buffers: dict = {}
+
+
+def _expand(offsets, neighbors, visited, frontier) -> array:
+    """
+    Returns the unvisited neighbors of the frontier ids, without duplicates.
+    """
+    found: Set[int] = set()
+    for v in frontier:
+        for n in neighbors[offsets[v] : offsets[v + 1]]:
+            if not visited[n]:
+                found.add(n)
+    return array("q", found)
+
+
+def _attach(offsets_name: str, neighbors_name: str, visited_name: str) -> None:
+    """
+    Pool initializer: attaches the worker to the shared graph once.
+    """
+    blocks = [
+        shared_memory.SharedMemory(name=name)
+        for name in (offsets_name, neighbors_name, visited_name)
+    ]
+    _worker_buffers["blocks"] = blocks
+    _worker_buffers["offsets"] = blocks[0].buf.cast("q")
+    _worker_buffers["neighbors"] = blocks[1].buf.cast("q")
+    _worker_buffers["visited"] = blocks[2].buf
+
+
+def _expand_in_worker(frontier_bytes: bytes) -> bytes:
+    frontier = array("q")
+    frontier.frombytes(frontier_bytes)
+    found = _expand(
+        _worker_buffers["offsets"],
+        _worker_buffers["neighbors"],
+        _worker_buffers["visited"],
+        frontier,
+    )
+    return found.tobytes()
+
+
+def _shared_copy(data: bytes) -> shared_memory.SharedMemory:
+    # Zero-sized blocks are not allowed, so an empty array still gets 8 bytes.
+    block = shared_memory.SharedMemory(create=True, size=max(len(data), 8))
+    block.buf[: len(data)] = data
+    return block
+
+
+class ParallelBFS:
+    """
+    A class representing a shared-memory graph and the process pool that searches it.
+
+    Building one copies the graph into shared memory and starts the workers, so it
+    should be reused for many searches and closed (or used as a context manager)
+    to release the pool and the shared blocks.
+
+    Methods:
+    -------
+    bfs(start: str) -> Set[str]
+        Returns the set of vertices reachable from start, like bfs_dfs.bfs.
+    bfs_ids(start_id: int) -> bytearray
+        Returns the visited flags of a search from a vertex id.
+    close()
+        Shuts down the pool and frees the shared memory.
+    """
+
+    def __init__(
+        self,
+        graph,
+        workers: Optional[int] = None,
+        min_parallel_frontier: int = 2_048,
+    ):
+        """
+        Parameters:
+        ----------
+        graph : CSRGraph or simple_graph.Graph
+            The graph to search; a Graph is frozen with CSRGraph.from_graph.
+        workers : int, optional
+            The number of worker processes; defaults to os.cpu_count().
+        min_parallel_frontier : int
+            Frontiers smaller than this are expanded without the pool.
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_graph(graph)
+        self.graph = graph
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_frontier = min_parallel_frontier
+
+        vertex_count = len(graph)
+        self._blocks = [
+            _shared_copy(array("q", graph.offsets).tobytes()),
+            _shared_copy(array("q", graph.neighbors).tobytes()),
+            _shared_copy(bytes(vertex_count)),
+        ]
+        # Typed views of the blocks: offsets, neighbor ids and visited flags.
+        self._views = (
+            self._blocks[0].buf[: 8 * (vertex_count + 1)].cast("q"),
+            self._blocks[1].buf[: 8 * graph.edge_entries].cast("q"),
+            self._blocks[2].buf[:vertex_count],
+        )
+        self._pool = ProcessPoolExecutor(
+            self.workers,
+            initializer=_attach,
+            initargs=tuple(block.name for block in self._blocks),
+        )
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool and frees the shared memory blocks.
+        """
+        self._pool.shutdown()
+        for view in self._views:
+            view.release()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+
+    def __enter__(self) -> "ParallelBFS":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def bfs_ids(self, start_id: int) -> bytearray:
+        """
+        Performs a level-synchronous breadth-first search on vertex ids.
+
+        Every level is split into one chunk per worker; the workers only read the
+        shared visited flags, and the calling process merges their discoveries and
+        marks them before the next level starts.
+
+        Returns:
+        -------
+        bytearray
+            visited[v] is 1 for every vertex v reachable from start_id.
+
+        Time Complexity:
+        ---------------
+        O(V + E) work in total, spread over the workers.
+        """
+        offsets, neighbors, visited = self._views
+        visited[:] = bytes(len(visited))
+        visited[start_id] = 1
+        frontier = array("q", [start_id])
+
+        while frontier:
+            if len(frontier) < self.min_parallel_frontier or self.workers == 1:
+                discovered = [_expand(offsets, neighbors, visited, frontier)]
+            else:
+                step = -(-len(frontier) // self.workers)
+                chunks = [
+                    frontier[i : i + step].tobytes()
+                    for i in range(0, len(frontier), step)
+                ]
+                discovered = []
+                for found_bytes in self._pool.map(_expand_in_worker, chunks):
+                    found = array("q")
+                    found.frombytes(found_bytes)
+                    discovered.append(found)
+
+            # Chunks may discover the same vertex; the visited check drops repeats.
+            frontier = array("q")
+            for found in discovered:
+                for n in found:
+                    if not visited[n]:
+                        visited[n] = 1
+                        frontier.append(n)
+        return bytearray(visited)
+
+    def bfs(self, start: str) -> Set[str]:
+        """
+        Returns the set of vertices reachable from start, like bfs_dfs.bfs.
+        """
+        vertex_id = self.graph.ids.get(start)
+        if vertex_id is None:
+            return {start}
+        names = self.graph.names
+        return {names[i] for i, flag in enumerate(self.bfs_ids(vertex_id)) if flag}
+
+
+def parallel_bfs(graph, start: str, workers: Optional[int] = None) -> Set[str]:
+    """
+    Performs one parallel breadth-first search; see ParallelBFS for repeated searches.
+
+    Parameters:
+    ----------
+    graph : CSRGraph or simple_graph.Graph
+        The graph to search.
+    start : str
+        The starting vertex.
+    workers : int, optional
+        The number of worker processes; defaults to os.cpu_count().
+
+    Returns:
+    -------
+    Set[str]
+        The vertices reachable from start.
+    """
+    with ParallelBFS(graph, workers) as engine:
+        return engine.bfs(start)
+
+
+def benchmark_scaling(vertex_count: int = 1_000_000, degree: int = 8) -> None:
+    """
+    Times one search on a random graph with 1, 2, 4, ... up to os.cpu_count() workers.
+    """
+    rng = random.Random(0)
+    edges = (
+        (f"v{rng.randrange(vertex_count)}", f"v{rng.randrange(vertex_count)}")
+        for _ in range(vertex_count * degree // 2)
+    )
+    csr = CSRGraph.from_edges(edges, vertices=[f"v{i}" for i in range(vertex_count)])
+    print(f"random graph with {len(csr):,} vertices, {csr.edge_entries:,} entries")
+
+    start = time.perf_counter()
+    expected = csr.bfs_ids(0)
+    print(f"  CSRGraph.bfs_ids: {time.perf_counter() - start:.3f} seconds")
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1 << i for i in range(cores.bit_length())} | {cores})
+    for workers in counts:
+        with ParallelBFS(csr, workers) as engine:
+            start = time.perf_counter()
+            visited = engine.bfs_ids(0)
+            elapsed = time.perf_counter() - start
+        assert visited == expected
+        print(f"  ParallelBFS with {workers} worker(s): {elapsed:.3f} seconds")
+
+
+def main():
+    """
+    The main function to check ParallelBFS against bfs_dfs.bfs and to benchmark how
+    it scales with the number of cores.
+    """
+    rng = random.Random(1)
+    names = [f"v{i}" for i in range(20_000)]
+    edges = [(rng.choice(names), rng.choice(names)) for _ in range(30_000)]
+    csr = CSRGraph.from_edges(edges, vertices=names)
+    adjacency = {name: csr.get(name) for name in csr}
+
+    # Force the pool on every level so the parallel path is actually exercised.
+    with ParallelBFS(csr, workers=2, min_parallel_frontier=0) as engine:
+        for start in rng.sample(names, 5) + ["missing"]:
+            assert engine.bfs(start) == bfs_dfs.bfs(adjacency, start)
+    print("parallel bfs matches bfs_dfs.bfs: ok")
+
+    benchmark_scaling()
+
+
+if __name__ == "__main__":
+    main()
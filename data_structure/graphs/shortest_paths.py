@@ -0,0 +1,386 @@
+"""
+Module: shortest_paths
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides weighted shortest-path searches on the undirected Graph of
+simple_graph, using the edge weights set with Graph.add_edge (unweighted edges
+count as Graph.DEFAULT_WEIGHT). All searches keep their open set in a binary heap
+with heapq and skip stale heap entries lazily instead of decreasing keys.
+
+- dijkstra settles vertices in order of distance until it reaches the target.
+- astar orders the heap by distance plus a heuristic estimate of the remaining
+  distance, which steers the search towards the target.
+- bidirectional_dijkstra grows one search from each end and stops when they meet,
+  settling roughly two balls of half the radius instead of one full ball.
+
+Point-to-point searches return a PathResult with the distance, the path and the
+number of settled vertices, which is the usual measure of the work a search did.
+"""
+
+import heapq
+import math
+import random
+import time
+from typing import Callable, NamedTuple, Optional
+
+from simple_graph import Graph
+
+Heuristic = Callable[[str, str], float]
+
+
+class PathResult(NamedTuple):
+    """
+    The result of a point-to-point search.
+
+    Attributes:
+    ----------
+    distance : float
+        The length of the shortest path, or math.inf if the target is unreachable.
+    path : list[str]
+        The vertices of the path from source to target, or [] if unreachable.
+    settled : int
+        The number of vertices whose distance the search finalized.
+    """
+
+    distance: float
+    path: list[str]
+    settled: int
+
+
+def _weight(weights: dict, vertex_one: str, vertex_two: str) -> float:
+    # Mirrors Graph.edge_key; inlined because it runs once per scanned edge.
+    if vertex_one <= vertex_two:
+        key = vertex_one, vertex_two
+    else:
+        key = vertex_two, vertex_one
+    weight = weights.get(key, Graph.DEFAULT_WEIGHT)
+    if weight < 0:
+        raise ValueError(f"negative weight {weight} on edge {key}")
+    return weight
+
+
+def _trace(parents: dict, vertex: str) -> list[str]:
+    """
+    Follows parent links back from vertex and returns the path ending at vertex.
+    """
+    path = [vertex]
+    while parents[path[-1]] is not None:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def shortest_distances(graph: Graph, source: str) -> dict[str, float]:
+    """
+    Computes the distance from source to every reachable vertex.
+
+    Raises:
+    ------
+    ValueError
+        If a negative edge weight is encountered.
+
+    Time Complexity:
+    ---------------
+    O((V + E) log V)
+    """
+    adjacency, weights = graph.adjacency_list, graph.weights
+    distances: dict[str, float] = {}
+    heap = [(0, source)]
+    while heap:
+        distance, v = heapq.heappop(heap)
+        if v in distances:
+            continue
+        distances[v] = distance
+        for n in adjacency.get(v, ()):
+            if n not in distances:
+                heapq.heappush(heap, (distance + _weight(weights, v, n), n))
+    return distances
+
+
+def astar(
+    graph: Graph, source: str, target: str, heuristic: Optional[Heuristic] = None
+) -> PathResult:
+    """
+    Finds a shortest path with the A* search.
+
+    Parameters:
+    ----------
+    graph : Graph
+        The graph to search.
+    source : str
+        The start of the path.
+    target : str
+        The end of the path.
+    heuristic : Callable[[str, str], float], optional
+        heuristic(vertex, target) estimates the distance from vertex to target. It
+        must be consistent (never larger than an edge weight plus the estimate from
+        the other end of that edge), which also makes it admissible. Without one,
+        the search is exactly Dijkstra's algorithm.
+
+    Returns:
+    -------
+    PathResult
+        The distance, the path and the number of settled vertices.
+
+    Raises:
+    ------
+    ValueError
+        If a negative edge weight is encountered.
+
+    Time Complexity:
+    ---------------
+    O((V + E) log V) in the worst case; a good heuristic settles far fewer vertices.
+    """
+    adjacency, weights = graph.adjacency_list, graph.weights
+    estimate = heuristic or (lambda vertex, goal: 0)
+    distances: dict[str, float] = {source: 0}
+    parents: dict[str, Optional[str]] = {source: None}
+    settled: set[str] = set()
+    heap = [(estimate(source, target), source)]
+
+    while heap:
+        _, v = heapq.heappop(heap)
+        if v in settled:
+            continue
+        settled.add(v)
+        if v == target:
+            return PathResult(distances[v], _trace(parents, v), len(settled))
+        distance = distances[v]
+        for n in adjacency.get(v, ()):
+            if n in settled:
+                continue
+            candidate = distance + _weight(weights, v, n)
+            if candidate < distances.get(n, math.inf):
+                distances[n] = candidate
+                parents[n] = v
+                heapq.heappush(heap, (candidate + estimate(n, target), n))
+    return PathResult(math.inf, [], len(settled))
+
+
+def dijkstra(graph: Graph, source: str, target: str) -> PathResult:
+    """
+    Finds a shortest path with Dijkstra's algorithm, stopping once target is settled.
+
+    Returns:
+    -------
+    PathResult
+        The distance, the path and the number of settled vertices.
+
+    Raises:
+    ------
+    ValueError
+        If a negative edge weight is encountered.
+
+    Time Complexity:
+    ---------------
+    O((V + E) log V)
+    """
+    return astar(graph, source, target)
+
+
+class _Search(NamedTuple):
+    """
+    The state of one side of a bidirectional search.
+    """
+
+    distances: dict[str, float]
+    parents: dict[str, Optional[str]]
+    heap: list[tuple[float, str]]
+    settled: set[str]
+
+    @classmethod
+    def start(cls, vertex: str) -> "_Search":
+        return cls({vertex: 0}, {vertex: None}, [(0, vertex)], set())
+
+
+def _relax(
+    graph: Graph,
+    search: _Search,
+    other: dict[str, float],
+    v: str,
+    distance: float,
+) -> tuple[float, Optional[str]]:
+    """
+    Relaxes the edges of the settled vertex v for one side of a bidirectional
+    search.
+
+    Returns:
+    -------
+    tuple[float, Optional[str]]
+        The length of the shortest path through v and a neighbor n that the other
+        side has reached (distances in other), and that neighbor; (inf, None) if
+        there is none.
+    """
+    own, parents, heap = search.distances, search.parents, search.heap
+    weights = graph.weights
+    best, via = math.inf, None
+    for n in graph.adjacency_list.get(v, ()):
+        candidate = distance + _weight(weights, v, n)
+        if candidate < own.get(n, math.inf):
+            own[n] = candidate
+            parents[n] = v
+            heapq.heappush(heap, (candidate, n))
+        if n in other and candidate + other[n] < best:
+            best, via = candidate + other[n], n
+    return best, via
+
+
+def bidirectional_dijkstra(graph: Graph, source: str, target: str) -> PathResult:
+    """
+    Finds a shortest path by running Dijkstra's algorithm from both ends.
+
+    The side whose heap has the smaller minimum is advanced. Whenever an edge
+    links the two searches, the best path length mu is updated, and the search
+    stops as soon as the two heap minimums add up to at least mu: no undiscovered
+    path can be shorter.
+
+    Returns:
+    -------
+    PathResult
+        The distance, the path and the number of settled vertices on both sides.
+
+    Raises:
+    ------
+    ValueError
+        If a negative edge weight is encountered.
+
+    Time Complexity:
+    ---------------
+    O((V + E) log V) in the worst case.
+    """
+    if source == target:
+        return PathResult(0, [source], 1)
+    # Index 0 is the search from source, index 1 the search from target.
+    searches = (_Search.start(source), _Search.start(target))
+    heaps = searches[0].heap, searches[1].heap
+    best, meeting = math.inf, None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        search = searches[side]
+        distance, v = heapq.heappop(search.heap)
+        if v in search.settled:
+            continue
+        search.settled.add(v)
+        through, n = _relax(graph, search, searches[1 - side].distances, v, distance)
+        if through < best:
+            best, meeting = through, (v, n) if side == 0 else (n, v)
+
+    count = len(searches[0].settled) + len(searches[1].settled)
+    if meeting is None:
+        return PathResult(math.inf, [], count)
+    # meeting is the edge (u, w) joining the source side (u) to the target side (w).
+    path = _trace(searches[0].parents, meeting[0])
+    path.extend(reversed(_trace(searches[1].parents, meeting[1])))
+    return PathResult(best, path, count)
+
+
+def grid_graph(
+    width: int, height: int, seed: int = 0
+) -> tuple[Graph, dict[str, tuple[int, int]]]:
+    """
+    Builds a road-network-like grid with random edge weights between 1 and 3.
+
+    Returns:
+    -------
+    tuple[Graph, dict[str, tuple[int, int]]]
+        The graph and the coordinates of every vertex.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    coordinates = {f"{x},{y}": (x, y) for x in range(width) for y in range(height)}
+    for vertex in coordinates:
+        graph.add_vertex(vertex)
+    for x in range(width):
+        for y in range(height):
+            if x + 1 < width:
+                graph.add_edge(f"{x},{y}", f"{x + 1},{y}", rng.uniform(1, 3))
+            if y + 1 < height:
+                graph.add_edge(f"{x},{y}", f"{x},{y + 1}", rng.uniform(1, 3))
+    return graph, coordinates
+
+
+def _run_queries(
+    graph: Graph,
+    search: Callable[[Graph, str, str], PathResult],
+    pairs: list[tuple[str, str]],
+    reference: list[float],
+) -> tuple[int, float]:
+    """
+    Runs search on every pair, checks the distances against reference and returns
+    the total number of settled vertices and the elapsed seconds.
+    """
+    settled = 0
+    start = time.perf_counter()
+    for (source, target), expected in zip(pairs, reference):
+        result = search(graph, source, target)
+        assert math.isclose(result.distance, expected)
+        settled += result.settled
+    return settled, time.perf_counter() - start
+
+
+def benchmark_settled(size: int = 300, queries: int = 20) -> None:
+    """
+    Compares the settled vertices and query times of the three searches on a grid.
+
+    A* uses the Manhattan distance, which is consistent because every edge moves one
+    step and weighs at least 1.
+    """
+    graph, coordinates = grid_graph(size, size)
+    names = list(coordinates)
+
+    def manhattan(vertex: str, goal: str) -> float:
+        (x1, y1), (x2, y2) = coordinates[vertex], coordinates[goal]
+        return abs(x1 - x2) + abs(y1 - y2)
+
+    rng = random.Random(1)
+    pairs = [(rng.choice(names), rng.choice(names)) for _ in range(queries)]
+    searches = {
+        "dijkstra": dijkstra,
+        "astar (manhattan)": lambda g, s, t: astar(g, s, t, manhattan),
+        "bidirectional_dijkstra": bidirectional_dijkstra,
+    }
+    print(f"{size}x{size} weighted grid, {queries} random queries")
+    reference = [dijkstra(graph, s, t).distance for s, t in pairs]
+    for label, search in searches.items():
+        settled, elapsed = _run_queries(graph, search, pairs, reference)
+        print(
+            f"  {label}: {settled / queries:,.0f} settled vertices per query, "
+            f"{elapsed / queries * 1000:.1f} ms per query"
+        )
+
+
+def main():
+    """
+    The main function to demonstrate the shortest-path searches and compare how many
+    vertices each of them settles.
+    """
+    graph = Graph()
+    for vertex in ["A", "B", "C", "D", "E", "F"]:
+        graph.add_vertex(vertex)
+    for vertex_one, vertex_two, weight in [
+        ("A", "B", 4),
+        ("A", "C", 2),
+        ("B", "D", 5),
+        ("C", "D", 8),
+        ("C", "E", 10),
+        ("D", "E", 2),
+        ("E", "F", 3),
+    ]:
+        graph.add_edge(vertex_one, vertex_two, weight)
+
+    print(f"shortest_distances from A: {shortest_distances(graph, 'A')}")
+    print(f"dijkstra A -> F: {dijkstra(graph, 'A', 'F')}")
+    print(f"bidirectional_dijkstra A -> F: {bidirectional_dijkstra(graph, 'A', 'F')}")
+
+    benchmark_settled()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,36 @@ Date: 2025-08-10
 Description:
 ------------
 This module provides an implementation of an undirected graph using an adjacency list.
+Edges can optionally carry a weight; only weights that differ from the default of 1
+are stored, so unweighted graphs pay nothing for the feature.
+Connectivity queries are answered by a union-find index that vertex and edge
+insertions keep up to date and that removals invalidate for a lazy rebuild.
+Batches of vertices and edges can be added or removed in one call, and edge-list
+or CSV files can be streamed into a graph in fixed-size chunks.
+The adjacency can be exported as a dense NumPy matrix, as sparse COO/CSR arrays, or
+streamed row by row to a text file.
 """
 
+from array import array
+import csv
+from functools import partial
+from itertools import islice
+import os
+import random
+import sys
+import tempfile
+import timeit
+from typing import Iterable, Optional, TextIO, Union
+
+from disjoint_set import DisjointSet
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for to_adjacency_matrix.
+    np = None
+
+Edge = Union[tuple[str, str], tuple[str, str, float]]
+
 
 class Graph:
     """
@@ -18,13 +46,38 @@ class Graph:
     ----------
     adjacency_list : dict
         A dictionary to store the adjacency list of the graph.
+    weights : dict
+        The weights of the edges whose weight is not DEFAULT_WEIGHT, keyed by
+        edge_key(vertex_one, vertex_two).
+    components : DisjointSet or None
+        The connected-components index, or None while it is not maintained.
     """
 
-    def __init__(self):
+    DEFAULT_WEIGHT = 1
+
+    def __init__(self, track_components: bool = False):
         """
         Initializes a new instance of the Graph class.
+
+        Parameters
+        ----------
+        track_components : bool
+            If True, maintain the connected-components index from the start;
+            otherwise it is built by the first connectivity query.
         """
         self.adjacency_list: dict[str, set[str]] = {}
+        self.weights: dict[tuple[str, str], float] = {}
+        self.components = DisjointSet() if track_components else None
+        self._components_stale = False
+
+    @staticmethod
+    def edge_key(vertex_one: str, vertex_two: str) -> tuple[str, str]:
+        """
+        Returns the key of an undirected edge in the weights dictionary.
+        """
+        if vertex_one <= vertex_two:
+            return vertex_one, vertex_two
+        return vertex_two, vertex_one
 
     def add_vertex(self, new_vertex: str) -> bool:
         """
@@ -43,18 +96,26 @@ class Graph:
         if new_vertex in self.adjacency_list:
             return False
         self.adjacency_list[new_vertex] = set()
+        if self.components is not None and not self._components_stale:
+            self.components.add(new_vertex)
         return True
 
-    def add_edge(self, vertex_one: str, vertex_two: str) -> bool:
+    def add_edge(
+        self, vertex_one: str, vertex_two: str, weight: float = DEFAULT_WEIGHT
+    ) -> bool:
         """
         Adds an undirected edge between two vertices in the graph.
 
+        Adding an edge that already exists updates its weight.
+
         Parameters
         ----------
         vertex_one : str
             The first vertex of the edge.
         vertex_two : str
             The second vertex of the edge.
+        weight : float
+            The weight of the edge; defaults to DEFAULT_WEIGHT.
 
         Returns
         -------
@@ -68,8 +129,29 @@ class Graph:
             return False
         self.adjacency_list[vertex_one].add(vertex_two)
         self.adjacency_list[vertex_two].add(vertex_one)
+        if self.components is not None and not self._components_stale:
+            self.components.union(vertex_one, vertex_two)
+        if weight != self.DEFAULT_WEIGHT:
+            self.weights[self.edge_key(vertex_one, vertex_two)] = weight
+        elif self.weights:
+            self.weights.pop(self.edge_key(vertex_one, vertex_two), None)
         return True
 
+    def weight(self, vertex_one: str, vertex_two: str) -> float:
+        """
+        Returns the weight of an edge.
+
+        Raises
+        ------
+        KeyError
+            If there is no edge between the two vertices.
+        """
+        if vertex_two not in self.adjacency_list.get(vertex_one, ()):
+            raise KeyError((vertex_one, vertex_two))
+        return self.weights.get(
+            self.edge_key(vertex_one, vertex_two), self.DEFAULT_WEIGHT
+        )
+
     def remove_edge(self, vertex_one: str, vertex_two: str) -> bool:
         """
         Removes an undirected edge between two vertices in the graph.
@@ -91,8 +173,13 @@ class Graph:
             or vertex_two not in self.adjacency_list
         ):
             return False
+        if vertex_two in self.adjacency_list[vertex_one]:
+            # A union cannot be undone; rebuild on the next connectivity query.
+            self._components_stale = True
         self.adjacency_list[vertex_one].discard(vertex_two)
         self.adjacency_list[vertex_two].discard(vertex_one)
+        if self.weights:
+            self.weights.pop(self.edge_key(vertex_one, vertex_two), None)
         return True
 
     def remove_vertex(self, vertex_to_remove: str) -> bool:
@@ -117,30 +204,500 @@ class Graph:
 
         # Remove the vertex from the adjacency list
         self.adjacency_list.pop(vertex_to_remove)
+        self._components_stale = True
 
         # Remove the vertex only from its actual neighbors
         for neighbor in neighbors:
             self.adjacency_list[neighbor].discard(vertex_to_remove)
+            if self.weights:
+                self.weights.pop(self.edge_key(vertex_to_remove, neighbor), None)
 
         return True
 
+    def add_vertices(self, new_vertices: Iterable[str]) -> int:
+        """
+        Adds a batch of vertices to the graph.
+
+        Parameters
+        ----------
+        new_vertices : Iterable[str]
+            The vertices to be added; existing vertices are skipped.
+
+        Returns
+        -------
+        int
+            The number of vertices that were added.
+        """
+        adjacency = self.adjacency_list
+        before = len(adjacency)
+        for vertex in new_vertices:
+            if vertex not in adjacency:
+                adjacency[vertex] = set()
+                if self.components is not None and not self._components_stale:
+                    self.components.add(vertex)
+        return len(adjacency) - before
+
+    def add_edges(self, edges: Iterable[Edge], create_vertices: bool = False) -> int:
+        """
+        Adds a batch of undirected edges to the graph.
+
+        All endpoints are validated in one pass before anything is changed, so a
+        batch is either applied completely or not at all.
+
+        Parameters
+        ----------
+        edges : Iterable[Edge]
+            (vertex_one, vertex_two) or (vertex_one, vertex_two, weight) tuples.
+        create_vertices : bool
+            If True, missing endpoints are added instead of rejected.
+
+        Returns
+        -------
+        int
+            The number of edges that were added; edges that already exist (or
+            repeat within the batch) only have their weight updated.
+
+        Raises
+        ------
+        KeyError
+            If an endpoint does not exist and create_vertices is False.
+        """
+        batch = edges if isinstance(edges, list) else list(edges)
+        if create_vertices:
+            self._add_endpoints(batch)
+        else:
+            adjacency = self.adjacency_list
+            for edge in batch:
+                if edge[0] not in adjacency or edge[1] not in adjacency:
+                    raise KeyError(edge[0] if edge[0] not in adjacency else edge[1])
+
+        adjacency = self.adjacency_list
+        added = 0
+        for edge in batch:
+            neighbors = adjacency[edge[0]]
+            if edge[1] not in neighbors:
+                neighbors.add(edge[1])
+                adjacency[edge[1]].add(edge[0])
+                added += 1
+        if added and self.components is not None and not self._components_stale:
+            union = self.components.union
+            for edge in batch:
+                union(edge[0], edge[1])
+        self._set_weights(batch)
+        return added
+
+    def _add_endpoints(self, batch: list[Edge]) -> None:
+        """
+        Adds the endpoints of a batch of edges that are not vertices yet.
+        """
+        adjacency = self.adjacency_list
+        created = []
+        for edge in batch:
+            if edge[0] not in adjacency:
+                adjacency[edge[0]] = set()
+                created.append(edge[0])
+            if edge[1] not in adjacency:
+                adjacency[edge[1]] = set()
+                created.append(edge[1])
+        if self.components is not None and not self._components_stale:
+            for vertex in created:
+                self.components.add(vertex)
+
+    def _set_weights(self, batch: list[Edge]) -> None:
+        """
+        Applies the weights of a batch of edges with the same rules as add_edge:
+        non-default weights are stored, default ones forget any stored weight.
+        """
+        weights, default = self.weights, self.DEFAULT_WEIGHT
+        if not weights and max(map(len, batch), default=2) == 2:
+            return
+        for edge in batch:
+            key = self.edge_key(edge[0], edge[1])
+            weight = edge[2] if len(edge) > 2 else default
+            if weight != default:
+                weights[key] = weight
+            else:
+                weights.pop(key, None)
+
+    def remove_edges(self, edges: Iterable[tuple[str, str]]) -> int:
+        """
+        Removes a batch of undirected edges from the graph.
+
+        Parameters
+        ----------
+        edges : Iterable[tuple[str, str]]
+            The edges to remove; edges that do not exist are skipped.
+
+        Returns
+        -------
+        int
+            The number of edges that were removed.
+        """
+        adjacency, weights = self.adjacency_list, self.weights
+        removed = 0
+        for vertex_one, vertex_two, *_ in edges:
+            neighbors = adjacency.get(vertex_one)
+            if neighbors is None or vertex_two not in neighbors:
+                continue
+            neighbors.discard(vertex_two)
+            adjacency[vertex_two].discard(vertex_one)
+            if weights:
+                weights.pop(self.edge_key(vertex_one, vertex_two), None)
+            removed += 1
+        if removed:
+            self._components_stale = True
+        return removed
+
+    def _component_index(self) -> DisjointSet:
+        """
+        Returns the connected-components index, (re)building it if needed.
+
+        Time Complexity
+        ---------------
+        O(1) when the index is current, O(V + E) to rebuild it after a removal.
+        """
+        if self.components is None or self._components_stale:
+            components = DisjointSet(self.adjacency_list)
+            for vertex, neighbors in self.adjacency_list.items():
+                for neighbor in neighbors:
+                    components.union(vertex, neighbor)
+            self.components = components
+            self._components_stale = False
+        return self.components
+
+    def connected(self, vertex_one: str, vertex_two: str) -> bool:
+        """
+        Checks if there is a path between two vertices.
+
+        Returns
+        -------
+        bool
+            True if both vertices exist and are in the same connected component.
+
+        Time Complexity
+        ---------------
+        O(alpha(V)) amortized while only vertices and edges are being added.
+        """
+        if (
+            vertex_one not in self.adjacency_list
+            or vertex_two not in self.adjacency_list
+        ):
+            return False
+        return self._component_index().connected(vertex_one, vertex_two)
+
+    def component_of(self, vertex: str) -> str:
+        """
+        Returns the representative vertex of the component containing vertex.
+
+        Two vertices are connected exactly when their representatives are equal;
+        a representative may change when components are merged or rebuilt.
+
+        Raises
+        ------
+        KeyError
+            If the vertex does not exist.
+        """
+        if vertex not in self.adjacency_list:
+            raise KeyError(vertex)
+        return self._component_index().find(vertex)
+
+    def component_count(self) -> int:
+        """
+        Returns the number of connected components.
+        """
+        return self._component_index().set_count
+
+    def vertex_index(self) -> dict[str, int]:
+        """
+        Returns the position of every vertex in the exported matrices.
+
+        Vertices are numbered in insertion order.
+        """
+        return {vertex: index for index, vertex in enumerate(self.adjacency_list)}
+
+    def to_sparse(self, fmt: str = "coo") -> tuple[list[str], array, array]:
+        """
+        Exports the adjacency matrix in a sparse format.
+
+        Parameters
+        ----------
+        fmt : str
+            "coo" for coordinate lists or "csr" for compressed sparse rows.
+
+        Returns
+        -------
+        tuple[list[str], array, array]
+            For "coo": the vertices, the row indices and the column indices of the
+            non-zero entries. For "csr": the vertices, the row offsets (length V + 1)
+            and the column indices, ascending within each row. The int64 arrays
+            support the buffer protocol, e.g. numpy.frombuffer(cols, dtype=numpy.int64).
+
+        Raises
+        ------
+        ValueError
+            If fmt is neither "coo" nor "csr".
+
+        Time Complexity
+        ---------------
+        O(V + E) for "coo", O(V + E log d) for "csr".
+        """
+        if fmt not in ("coo", "csr"):
+            raise ValueError(f"unsupported sparse format {fmt!r}")
+        vertices = list(self.adjacency_list)
+        index = self.vertex_index()
+        cols = array("q")
+        if fmt == "csr":
+            offsets = array("q", [0])
+            for vertex in vertices:
+                cols.extend(sorted(index[n] for n in self.adjacency_list[vertex]))
+                offsets.append(len(cols))
+            return vertices, offsets, cols
+        rows = array("q")
+        for i, vertex in enumerate(vertices):
+            neighbors = self.adjacency_list[vertex]
+            cols.extend(index[n] for n in neighbors)
+            rows.extend([i] * len(neighbors))
+        return vertices, rows, cols
+
+    def to_adjacency_matrix(self, dtype: str = "uint8"):
+        """
+        Exports the dense adjacency matrix as a NumPy array.
+
+        The matrix is filled with a single vectorized scatter of the COO
+        coordinates instead of one Python assignment per edge.
+
+        Parameters
+        ----------
+        dtype : str
+            The NumPy dtype of the matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            A V x V matrix where entry [i, j] is 1 if the i-th and j-th vertices
+            (see vertex_index) are adjacent.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("to_adjacency_matrix requires NumPy")
+        vertices, rows, cols = self.to_sparse("coo")
+        matrix = np.zeros((len(vertices), len(vertices)), dtype=dtype)
+        row_index = np.frombuffer(rows, dtype=np.int64)
+        col_index = np.frombuffer(cols, dtype=np.int64)
+        matrix[row_index, col_index] = 1
+        return matrix
+
+    def write_adjacency_matrix(self, stream: TextIO):
+        """
+        Streams the adjacency matrix as text, one row at a time.
+
+        Only one row is materialized at once, so graphs whose matrix does not fit
+        in memory can still be written out.
+
+        Parameters
+        ----------
+        stream : TextIO
+            The text stream to write to.
+        """
+        vertices = list(self.adjacency_list)
+        index = self.vertex_index()
+        stream.write(f"   {' '.join(vertices)}\n")
+        for vertex in vertices:
+            row = ["0"] * len(vertices)
+            for neighbor in self.adjacency_list[vertex]:
+                row[index[neighbor]] = "1"
+            stream.write(f"{vertex} {' '.join(row)}\n")
+
     def print_adjacency_matrix(self):
         """
         Prints the adjacency matrix of the graph.
         """
-        existing_vertices = list(self.adjacency_list.keys())
-        matrix = [[0] * len(existing_vertices) for _ in range(len(existing_vertices))]
+        self.write_adjacency_matrix(sys.stdout)
 
-        for i, vertex in enumerate(existing_vertices):
-            for neighbor in self.adjacency_list[vertex]:
-                matrix[i][existing_vertices.index(neighbor)] = 1
 
-        print("  ", " ".join(existing_vertices))
-        for i, row in enumerate(matrix):
-            print(existing_vertices[i], " ".join(map(str, row)))
+def read_edge_list(
+    path: str,
+    graph: Optional[Graph] = None,
+    delimiter: Optional[str] = None,
+    skip_header: bool = False,
+    chunk_size: int = 100_000,
+) -> Graph:
+    """
+    Streams an edge-list or CSV file into a graph.
 
+    Every line holds two vertex names and an optional weight. Lines are read and
+    added with add_edges in chunks of chunk_size edges, so memory use is bounded
+    by the chunk and the graph, not by the file. Blank lines and lines starting
+    with "#" are skipped.
 
-if __name__ == "__main__":
+    Parameters
+    ----------
+    path : str
+        The file to read.
+    graph : Graph, optional
+        The graph to add to; a new Graph by default.
+    delimiter : str, optional
+        The field separator. None splits on whitespace; any other value parses
+        the file as CSV with that delimiter, honoring quoted fields.
+    skip_header : bool
+        If True, the first line is ignored.
+    chunk_size : int
+        The number of edges added per batch.
+
+    Returns
+    -------
+    Graph
+        The graph the edges were added to.
+
+    Raises
+    ------
+    ValueError
+        If a line does not have two or three fields.
+    """
+    graph = Graph() if graph is None else graph
+    with open(path, newline="", encoding="utf-8") as file:
+        if skip_header:
+            next(file, None)
+        lines = (line for line in file if line.strip() and line[0] != "#")
+        if delimiter is None:
+            rows = (line.split() for line in lines)
+        else:
+            rows = csv.reader(lines, delimiter=delimiter)
+        while True:
+            chunk = []
+            for row in islice(rows, chunk_size):
+                if len(row) == 2:
+                    chunk.append((row[0], row[1]))
+                elif len(row) == 3:
+                    chunk.append((row[0], row[1], float(row[2])))
+                else:
+                    raise ValueError(f"expected 2 or 3 fields, got {row!r}")
+            if not chunk:
+                return graph
+            graph.add_edges(chunk, create_vertices=True)
+
+
+def benchmark_exports(vertex_counts: list[int], degree: int = 4):
+    """
+    Times the sparse, dense and streaming exports on random graphs.
+
+    The sparse exports run at every size. The dense and streaming exports write
+    all V^2 matrix cells (10^12 at 10^6 vertices), so they only run up to 10^4
+    vertices.
+    """
+    for vertex_count in vertex_counts:
+        graph = Graph()
+        for i in range(vertex_count):
+            graph.add_vertex(str(i))
+        for _ in range(vertex_count * degree // 2):
+            graph.add_edge(
+                str(random.randrange(vertex_count)), str(random.randrange(vertex_count))
+            )
+
+        timings = {
+            "to_sparse(coo)": timeit.timeit(partial(graph.to_sparse, "coo"), number=1),
+            "to_sparse(csr)": timeit.timeit(partial(graph.to_sparse, "csr"), number=1),
+        }
+        if vertex_count <= 10_000:
+            if np is not None:
+                timings["to_adjacency_matrix"] = timeit.timeit(
+                    graph.to_adjacency_matrix, number=1
+                )
+            with open(os.devnull, "w", encoding="utf-8") as sink:
+                timings["write_adjacency_matrix"] = timeit.timeit(
+                    partial(graph.write_adjacency_matrix, sink), number=1
+                )
+        for label, elapsed in timings.items():
+            print(f"{vertex_count:>9,} vertices - {label}: {elapsed:.3f} seconds")
+
+
+def benchmark_connectivity(vertex_count: int = 100_000, queries: int = 1_000):
+    """
+    Times connectivity queries answered by a bfs per query and by the index.
+    """
+    # Only the baseline needs a traversal; Graph itself does not depend on it.
+    import bfs_dfs  # pylint: disable=import-outside-toplevel
+
+    graph = Graph(track_components=True)
+    for i in range(vertex_count):
+        graph.add_vertex(str(i))
+    for _ in range(vertex_count // 2):
+        graph.add_edge(
+            str(random.randrange(vertex_count)), str(random.randrange(vertex_count))
+        )
+    pairs = [
+        (str(random.randrange(vertex_count)), str(random.randrange(vertex_count)))
+        for _ in range(queries)
+    ]
+
+    def by_bfs():
+        return [v in bfs_dfs.bfs(graph.adjacency_list, u) for u, v in pairs]
+
+    def by_index():
+        return [graph.connected(u, v) for u, v in pairs]
+
+    assert by_bfs() == by_index()
+    time_bfs = timeit.timeit(by_bfs, number=1)
+    time_index = timeit.timeit(by_index, number=1)
+    print(f"{queries:,} connectivity queries, {vertex_count:,} vertices")
+    print(f"  bfs per query: {queries / time_bfs:,.0f} queries/s")
+    print(f"  component index: {queries / time_index:,.0f} queries/s")
+
+    vertex = next(v for v, neighbors in graph.adjacency_list.items() if neighbors)
+    graph.remove_edge(vertex, next(iter(graph.adjacency_list[vertex])))
+    time_rebuild = timeit.timeit(lambda: graph.connected("0", "1"), number=1)
+    print(f"  first query after a removal (rebuild): {time_rebuild:.3f} seconds")
+
+
+def benchmark_ingest(vertex_count: int = 20_000, edge_count: int = 100_000):
+    """
+    Compares ingest throughput of per-call add_vertex/add_edge, add_edges and
+    read_edge_list in edges per second.
+    """
+    names = [str(i) for i in range(vertex_count)]
+    edges = [(random.choice(names), random.choice(names)) for _ in range(edge_count)]
+
+    def per_call() -> Graph:
+        graph = Graph()
+        for vertex_one, vertex_two in edges:
+            graph.add_vertex(vertex_one)
+            graph.add_vertex(vertex_two)
+            graph.add_edge(vertex_one, vertex_two)
+        return graph
+
+    def batched() -> Graph:
+        graph = Graph()
+        graph.add_edges(edges, create_vertices=True)
+        return graph
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(f"{u},{v}\n" for u, v in edges)
+
+        expected = per_call().adjacency_list
+        assert batched().adjacency_list == expected
+        assert read_edge_list(path, delimiter=",").adjacency_list == expected
+
+        print(f"ingesting {edge_count:,} edges over {vertex_count:,} vertices")
+        for label, ingest in [
+            ("add_vertex/add_edge per edge", per_call),
+            ("add_edges", batched),
+            ("read_edge_list (CSV)", lambda: read_edge_list(path, delimiter=",")),
+        ]:
+            elapsed = timeit.timeit(ingest, number=1)
+            print(f"  {label}: {edge_count / elapsed:,.0f} edges/s")
+
+
+def main():
+    """
+    The main function to demonstrate the Graph, its exports and connectivity index,
+    and to run the benchmarks.
+    """
     graph = Graph()
     vertices = ["A", "B", "C", "D", "E", "F"]
     edges = [
@@ -160,3 +717,17 @@ if __name__ == "__main__":
         graph.add_edge(v_one, v_two)
 
     graph.print_adjacency_matrix()
+    print(f"sparse (coo): {graph.to_sparse('coo')}")
+    if np is not None:
+        print(graph.to_adjacency_matrix())
+
+    print(f"A and F connected: {graph.connected('A', 'F')}")
+    print(f"component count: {graph.component_count()}")
+
+    benchmark_connectivity()
+    benchmark_ingest()
+    benchmark_exports([10_000, 100_000, 1_000_000])
+
+
+if __name__ == "__main__":
+    main()
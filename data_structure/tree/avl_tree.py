@@ -0,0 +1,264 @@
+"""
+Module: avl_tree - self-balancing.
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a self-balancing (AVL) variant of the BinarySearchTree.
+Every node tracks the height of its subtree and the tree is rebalanced with
+rotations after each insertion and removal, so the height never exceeds
+~1.44 * log2(n) and insert, contains and remove run in O(log n) even when the
+keys arrive already sorted. All operations are iterative, so deep trees never
+hit the recursion limit.
+"""
+
+import math
+import timeit
+
+from binary_search_tree import BinarySearchTree, Node, _size
+
+
+class AVLNode(Node):
+    """
+    A class representing a node in an AVL tree.
+
+    Attributes:
+    ----------
+    height : int
+        The height of the subtree rooted at this node (a leaf has height 1).
+    """
+
+    __slots__ = ("height",)
+
+    def __init__(self, value: int):
+        super().__init__(value)
+        self.height = 1
+
+
+def _height(node: AVLNode) -> int:
+    return node.height if node is not None else 0
+
+
+class AVLTree(BinarySearchTree):
+    """
+    A class representing a self-balancing binary search tree (AVL tree).
+
+    It has the same API as BinarySearchTree; contains and the traversals are
+    inherited unchanged, while insert and remove keep the tree balanced.
+
+    Methods:
+    -------
+    insert(value: int) -> bool
+        Inserts a value into the tree and rebalances it.
+    remove(value: int) -> bool
+        Removes a value from the tree and rebalances it.
+    height() -> int
+        Returns the height of the tree.
+    """
+
+    def _new_node(self, value: int) -> AVLNode:
+        """
+        Creates a detached AVL node.
+        """
+        return AVLNode(value)
+
+    def height(self) -> int:
+        """
+        Returns the height of the tree, 0 for an empty tree.
+        """
+        return _height(self.root)
+
+    def insert(self, value: int) -> bool:
+        """
+        Inserts a value into the tree and rebalances it.
+
+        Parameters:
+        ----------
+        value : int
+            The value to be inserted into the tree.
+
+        Returns:
+        -------
+        bool
+            True if the value was inserted, False if the value already exists in the tree.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        if self.root is None:
+            self.root = self._new_node(value)
+            return True
+
+        path: list[AVLNode] = []
+        current_node: AVLNode = self.root
+        while current_node is not None:
+            if value == current_node.value:
+                return False
+            path.append(current_node)
+            if value > current_node.value:
+                current_node = current_node.right
+            else:
+                current_node = current_node.left
+
+        parent = path[-1]
+        if value > parent.value:
+            parent.right = self._new_node(value)
+        else:
+            parent.left = self._new_node(value)
+        self._rebalance_path(path)
+        return True
+
+    def remove(self, value: int) -> bool:
+        """
+        Removes a value from the tree and rebalances it.
+
+        Parameters:
+        ----------
+        value : int
+            The value to be removed from the tree.
+
+        Returns:
+        -------
+        bool
+            True if the value was removed, False if the value does not exist in the tree.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        path: list[AVLNode] = []
+        node: AVLNode = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.right if value > node.value else node.left
+        if node is None:
+            return False
+
+        # A node with two children takes the value of its in-order successor,
+        # which is then unlinked instead (it has at most one child).
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+            return True
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._rebalance_path(path)
+        return True
+
+    def _rebalance_path(self, path: list[AVLNode]) -> None:
+        """
+        Updates heights and restores the AVL invariant on the nodes of the given
+        root-to-node path, from the bottom up.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            balanced = self._rebalance(node)
+            if balanced is node:
+                continue
+            if i == 0:
+                self.root = balanced
+            elif path[i - 1].left is node:
+                path[i - 1].left = balanced
+            else:
+                path[i - 1].right = balanced
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """
+        Restores the AVL invariant at a single node and returns the new subtree root.
+        """
+        self._update(node)
+        balance = _height(node.left) - _height(node.right)
+        if balance > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _update(self, node: AVLNode) -> None:
+        """
+        Recomputes the height and subtree size of a node from its children.
+        """
+        node.height = 1 + max(_height(node.left), _height(node.right))
+        node.size = 1 + _size(node.left) + _size(node.right)
+
+    def _rotate_left(self, node: AVLNode) -> AVLNode:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: AVLNode) -> AVLNode:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+
+def benchmark_sorted_insert(n: int) -> float:
+    """
+    Inserts n already-sorted keys into an AVLTree and returns the time taken.
+    """
+    tree = AVLTree()
+    return timeit.timeit(lambda: [tree.insert(i) for i in range(n)], number=1)
+
+
+def main():
+    """
+    The main function to demonstrate the usage of the AVLTree class and to show that
+    sorted-input insertion scales as O(n log n).
+    """
+    avl = AVLTree()
+    for value in [10, 23, 4, 56, 73, 33, 44, 38]:
+        avl.insert(value)
+
+    print(f"contains 33: {avl.contains(33)}")
+    print(f"remove 33: {avl.remove(33)}")
+    print(f"contains 33: {avl.contains(33)}")
+    print(f"in-order traversal: {avl.in_order_traversal(avl.root)}")
+    print(f"height: {avl.height()}")
+
+    for n in [10_000, 100_000, 1_000_000]:
+        elapsed = benchmark_sorted_insert(n)
+        per_op = elapsed / (n * math.log2(n)) * 1e9
+        print(
+            f"sorted insert of {n:>9,} keys: {elapsed:8.3f} seconds "
+            f"({per_op:.1f} ns per n*log2(n))"
+        )
+
+    tree = AVLTree()
+    for i in range(1_000):
+        tree.insert(i)
+    time_balanced = timeit.timeit(lambda: tree.contains(999), number=10_000)
+    skewed = BinarySearchTree()
+    for i in range(1_000):
+        skewed.insert(i)
+    time_skewed = timeit.timeit(lambda: skewed.contains(999), number=10_000)
+    print(f"contains on 1,000 sorted keys - unbalanced: {time_skewed:.6f} seconds")
+    print(f"contains on 1,000 sorted keys - AVL: {time_balanced:.6f} seconds")
+
+
+if __name__ == "__main__":
+    main()
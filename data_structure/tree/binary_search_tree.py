@@ -12,6 +12,11 @@ BinarySearchTree class to manage the tree operations such as insertion,
 searching, removal, and traversal.
 """
 
+import math
+import random
+import timeit
+from typing import Iterable, Iterator, Optional
+
 
 class Node:
     """
@@ -25,12 +30,21 @@ class Node:
         A reference to the left child node.
     right : Node, optional
         A reference to the right child node.
+    size : int
+        The number of nodes in the subtree rooted at this node.
     """
 
+    __slots__ = ("value", "left", "right", "size")
+
     def __init__(self, value: int):
         self.value = value
         self.left: Node = None
         self.right: Node = None
+        self.size = 1
+
+
+def _size(node: Node) -> int:
+    return node.size if node is not None else 0
 
 
 class BinarySearchTree:
@@ -50,17 +64,184 @@ class BinarySearchTree:
         Checks if a value exists in the binary search tree.
     remove(value: int) -> bool
         Removes a value from the binary search tree.
-    __str__() -> str
-        Returns a string representation of the binary search tree.
-    _in_order_traversal(node: Node, values: list)
-        Performs an in-order traversal of the tree and appends node values to the list.
-    _print_tree(node: Node, prefix: str, is_left: bool)
-        Recursively prints the tree structure.
+    __iter__() -> Iterator[int]
+        Lazily yields the values of the tree in ascending order.
+    __reversed__() -> Iterator[int]
+        Lazily yields the values of the tree in descending order.
+    iter_pre_order(node: Node) / iter_in_order(node: Node) / iter_post_order(node: Node)
+        Lazily yield the values of a subtree, driven by an explicit stack.
+    rank(value: int) -> int
+        Returns the number of values smaller than the given value.
+    select(k: int) -> int
+        Returns the k-th smallest value (0-based).
+    floor(value: int) / ceiling(value: int) -> int, optional
+        Return the closest value at most / at least the given value.
+    range_count(lo: int, hi: int) -> int
+        Returns the number of values between lo and hi (inclusive).
+    range_iter(lo: int, hi: int) -> Iterator[int]
+        Lazily yields the values between lo and hi (inclusive) in ascending order.
+    from_sorted(values: Iterable[int]) -> BinarySearchTree
+        Builds a perfectly balanced tree from sorted values in O(n).
+    insert_many(values: Iterable[int]) -> int
+        Inserts a batch of values, merging large batches into the tree in one pass.
+    remove_many(values: Iterable[int]) -> int
+        Removes a batch of values, merging large batches into the tree in one pass.
     """
 
     def __init__(self):
         self.root: Node = None
 
+    def _new_node(self, value: int) -> Node:
+        """
+        Creates a detached node of the type used by this tree.
+        """
+        return Node(value)
+
+    def _update(self, node: Node) -> None:
+        """
+        Recomputes the subtree size of a node from its children.
+        """
+        node.size = 1 + _size(node.left) + _size(node.right)
+
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> "BinarySearchTree":
+        """
+        Builds a perfectly balanced tree from values in ascending order.
+
+        Parameters:
+        ----------
+        values : Iterable[int]
+            The values in ascending order; duplicates are stored once.
+
+        Returns:
+        -------
+        BinarySearchTree
+            A new tree containing the values.
+
+        Raises:
+        ------
+        ValueError
+            If the values are not in ascending order.
+
+        Time Complexity:
+        ---------------
+        O(n), one node allocation per value and no comparisons against the tree.
+        """
+        unique: list[int] = []
+        for value in values:
+            if unique and value <= unique[-1]:
+                if value == unique[-1]:
+                    continue
+                raise ValueError("values must be sorted in ascending order")
+            unique.append(value)
+        tree = cls()
+        tree.root = tree._build_balanced(unique, 0, len(unique))
+        return tree
+
+    def _build_balanced(self, values: list[int], lo: int, hi: int) -> Node:
+        """
+        Builds a balanced subtree from the sorted slice values[lo:hi].
+
+        The recursion depth is log2(n), so it is safe for any input size.
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._new_node(values[mid])
+        node.left = self._build_balanced(values, lo, mid)
+        node.right = self._build_balanced(values, mid + 1, hi)
+        self._update(node)
+        return node
+
+    def _prefers_rebuild(self, batch_size: int) -> bool:
+        """
+        Checks whether merging a batch and rebuilding the tree in O(n + m) beats
+        m separate root-to-leaf descents of O(log n) each.
+        """
+        size = _size(self.root)
+        return batch_size * math.log2(size + 2) >= size
+
+    def insert_many(self, values: Iterable[int]) -> int:
+        """
+        Inserts a batch of values into the binary search tree.
+
+        The batch is sorted once; large batches are merged with the in-order
+        sequence of the tree and the tree is rebuilt balanced, small batches fall
+        back to single inserts.
+
+        Parameters:
+        ----------
+        values : Iterable[int]
+            The values to be inserted into the tree.
+
+        Returns:
+        -------
+        int
+            The number of values that were inserted (not already in the tree).
+
+        Time Complexity:
+        ---------------
+        O(m log m + min(n + m, m log n)), for a batch of m values.
+        """
+        batch = sorted(set(values))
+        if not self._prefers_rebuild(len(batch)):
+            return sum(self.insert(value) for value in batch)
+
+        size_before = _size(self.root)
+        merged: list[int] = []
+        existing = self.iter_in_order(self.root)
+        current = next(existing, None)
+        for value in batch:
+            while current is not None and current < value:
+                merged.append(current)
+                current = next(existing, None)
+            if current == value:
+                continue
+            merged.append(value)
+        if current is not None:
+            merged.append(current)
+            merged.extend(existing)
+        self.root = self._build_balanced(merged, 0, len(merged))
+        return len(merged) - size_before
+
+    def remove_many(self, values: Iterable[int]) -> int:
+        """
+        Removes a batch of values from the binary search tree.
+
+        The batch is sorted once; large batches are filtered out of the in-order
+        sequence of the tree and the tree is rebuilt balanced, small batches fall
+        back to single removals.
+
+        Parameters:
+        ----------
+        values : Iterable[int]
+            The values to be removed from the tree.
+
+        Returns:
+        -------
+        int
+            The number of values that were removed (were present in the tree).
+
+        Time Complexity:
+        ---------------
+        O(m log m + min(n + m, m log n)), for a batch of m values.
+        """
+        batch = sorted(set(values))
+        if not self._prefers_rebuild(len(batch)):
+            return sum(self.remove(value) for value in batch)
+
+        size_before = _size(self.root)
+        kept: list[int] = []
+        position = 0
+        for current in self.iter_in_order(self.root):
+            while position < len(batch) and batch[position] < current:
+                position += 1
+            if position < len(batch) and batch[position] == current:
+                continue
+            kept.append(current)
+        self.root = self._build_balanced(kept, 0, len(kept))
+        return size_before - len(kept)
+
     def insert(self, value: int) -> bool:
         """
         Inserts a value into the binary search tree.
@@ -75,26 +256,32 @@ class BinarySearchTree:
         bool
             True if the value was inserted, False if the value already exists in the tree.
         """
-        new_node = Node(value)
+        new_node = self._new_node(value)
         if not self.root:
             self.root = new_node
             return True
 
+        path: list[Node] = []
         current_node: Node = self.root
         while True:
             if new_node.value == current_node.value:
                 return False
+            path.append(current_node)
             if new_node.value > current_node.value:
                 if current_node.right is None:
                     current_node.right = new_node
-                    return True
+                    break
                 current_node = current_node.right
             else:
                 if current_node.left is None:
                     current_node.left = new_node
-                    return True
+                    break
                 current_node = current_node.left
 
+        for node in path:
+            node.size += 1
+        return True
+
     def contains(self, value: int) -> bool:
         """
         Checks if a value exists in the binary search tree.
@@ -149,6 +336,7 @@ class BinarySearchTree:
                 temp = self._find_min(node.right)
                 node.value = temp.value
                 node.right = _remove_node(node.right, temp.value)
+            self._update(node)
             return node
 
         if not self.contains(value):
@@ -175,41 +363,267 @@ class BinarySearchTree:
             current = current.left
         return current
 
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the tree.
+        """
+        return _size(self.root)
+
+    def rank(self, value: int) -> int:
+        """
+        Returns the number of values in the tree that are smaller than value.
+
+        Parameters:
+        ----------
+        value : int
+            The value to rank; it does not need to be in the tree.
+
+        Returns:
+        -------
+        int
+            The number of values strictly smaller than value.
+
+        Time Complexity:
+        ---------------
+        O(h), where h is the height of the tree.
+        """
+        return self._count_below(value, inclusive=False)
+
+    def _count_below(self, value: int, inclusive: bool) -> int:
+        """
+        Counts the values smaller than (or, if inclusive, equal to) value.
+        """
+        count = 0
+        node = self.root
+        while node is not None:
+            if value > node.value or (inclusive and value == node.value):
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def select(self, k: int) -> int:
+        """
+        Returns the k-th smallest value in the tree.
+
+        Parameters:
+        ----------
+        k : int
+            The 0-based position of the value in ascending order.
+
+        Returns:
+        -------
+        int
+            The k-th smallest value.
+
+        Raises:
+        ------
+        IndexError
+            If k is not in the range [0, len(tree)).
+
+        Time Complexity:
+        ---------------
+        O(h), where h is the height of the tree.
+        """
+        if not 0 <= k < _size(self.root):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def floor(self, value: int) -> Optional[int]:
+        """
+        Returns the largest value in the tree that is at most value, or None.
+
+        Time Complexity:
+        ---------------
+        O(h), where h is the height of the tree.
+        """
+        result = None
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return node.value
+            if value > node.value:
+                result = node.value
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def ceiling(self, value: int) -> Optional[int]:
+        """
+        Returns the smallest value in the tree that is at least value, or None.
+
+        Time Complexity:
+        ---------------
+        O(h), where h is the height of the tree.
+        """
+        result = None
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return node.value
+            if value < node.value:
+                result = node.value
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def range_count(self, lo: int, hi: int) -> int:
+        """
+        Returns the number of values v in the tree with lo <= v <= hi.
+
+        Time Complexity:
+        ---------------
+        O(h), where h is the height of the tree.
+        """
+        if lo > hi:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(
+            lo, inclusive=False
+        )
+
+    def range_iter(self, lo: int, hi: int) -> Iterator[int]:
+        """
+        Lazily yields the values v in the tree with lo <= v <= hi in ascending order.
+
+        Only the subtrees that can contain values in the range are visited.
+
+        Time Complexity:
+        ---------------
+        O(h + m), where m is the number of values yielded.
+        """
+        stack: list[Node] = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                if current.value < lo:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if current.value > hi:
+                return
+            yield current.value
+            current = current.right
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Lazily yields the values of the tree in ascending order.
+        """
+        return self.iter_in_order(self.root)
+
+    def __reversed__(self) -> Iterator[int]:
+        """
+        Lazily yields the values of the tree in descending order.
+        """
+        return self.iter_reverse_order(self.root)
+
+    def iter_pre_order(self, node: Node) -> Iterator[int]:
+        """
+        Lazily yields the values of the subtree rooted at node in pre-order.
+
+        Time Complexity:
+        ---------------
+        O(1) amortized per value, O(h) extra space for the explicit stack.
+        """
+        stack = [node] if node is not None else []
+        while stack:
+            current = stack.pop()
+            yield current.value
+            if current.right is not None:
+                stack.append(current.right)
+            if current.left is not None:
+                stack.append(current.left)
+
+    def iter_in_order(self, node: Node) -> Iterator[int]:
+        """
+        Lazily yields the values of the subtree rooted at node in in-order.
+
+        Time Complexity:
+        ---------------
+        O(1) amortized per value, O(h) extra space for the explicit stack.
+        """
+        stack: list[Node] = []
+        current = node
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.value
+            current = current.right
+
+    def iter_reverse_order(self, node: Node) -> Iterator[int]:
+        """
+        Lazily yields the values of the subtree rooted at node in reverse in-order.
+
+        Time Complexity:
+        ---------------
+        O(1) amortized per value, O(h) extra space for the explicit stack.
+        """
+        stack: list[Node] = []
+        current = node
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.right
+            current = stack.pop()
+            yield current.value
+            current = current.left
+
+    def iter_post_order(self, node: Node) -> Iterator[int]:
+        """
+        Lazily yields the values of the subtree rooted at node in post-order.
+
+        Time Complexity:
+        ---------------
+        O(1) amortized per value, O(h) extra space for the explicit stack.
+        """
+        stack: list[Node] = []
+        current = node
+        last_visited: Node = None
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            peek = stack[-1]
+            if peek.right is not None and peek.right is not last_visited:
+                current = peek.right
+            else:
+                yield peek.value
+                last_visited = stack.pop()
+
     def pre_order_traversal(self, node: Node) -> list[int]:
         """
         Performs a pre-order traversal of the tree and returns the values of the nodes.
         """
-        if node is None:
-            return []
-        return (
-            [node.value]
-            + self.pre_order_traversal(node.left)
-            + self.pre_order_traversal(node.right)
-        )
+        return list(self.iter_pre_order(node))
 
     def in_order_traversal(self, node: Node) -> list[int]:
         """
         Performs an in-order traversal of the tree and returns the values of the nodes.
         """
-        if node is None:
-            return []
-        return (
-            self.in_order_traversal(node.left)
-            + [node.value]
-            + self.in_order_traversal(node.right)
-        )
+        return list(self.iter_in_order(node))
 
     def post_order_traversal(self, node: Node) -> list[int]:
         """
         Performs a post-order traversal of the tree and returns the values of the nodes.
         """
-        if node is None:
-            return []
-        return (
-            self.post_order_traversal(node.left)
-            + self.post_order_traversal(node.right)
-            + [node.value]
-        )
+        return list(self.iter_post_order(node))
 
 
 def main():
@@ -228,6 +642,62 @@ def main():
     print(f"pre-order traversal: {bst.pre_order_traversal(bst.root)}")
     print(f"in-order traversal: {bst.in_order_traversal(bst.root)}")
     print(f"post-order traversal: {bst.post_order_traversal(bst.root)}")
+    print(f"descending: {list(reversed(bst))}")
+    print(f"rank 44: {bst.rank(44)}, select 2: {bst.select(2)}")
+    print(f"floor 40: {bst.floor(40)}, ceiling 40: {bst.ceiling(40)}")
+    print(f"range_count 10..56: {bst.range_count(10, 56)}")
+    print(f"range_iter 10..56: {list(bst.range_iter(10, 56))}")
+
+    # Lazy traversal of a degenerate (sorted-input) tree, far deeper than the
+    # recursion limit, streaming only the first few values.
+    skewed = BinarySearchTree()
+    for value in range(5_000):
+        skewed.insert(value)
+    stream = iter(skewed)
+    print(f"first values of a 5,000-deep tree: {[next(stream) for _ in range(5)]}")
+
+    print(f"insert_many: {bst.insert_many([1, 2, 3, 73, 90])}")
+    print(f"remove_many: {bst.remove_many([1, 2, 100])}")
+    print(f"in-order traversal: {bst.in_order_traversal(bst.root)}")
+
+    benchmark_bulk_operations(200_000)
+
+
+def benchmark_bulk_operations(n: int):
+    """
+    Compares the bulk constructors and batch operations against loops of single
+    inserts and removals on n keys.
+    """
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.shuffle(shuffled)
+
+    def insert_loop(values: list[int]) -> BinarySearchTree:
+        tree = BinarySearchTree()
+        for value in values:
+            tree.insert(value)
+        return tree
+
+    time_loop = timeit.timeit(lambda: insert_loop(shuffled), number=1)
+    time_from_sorted = timeit.timeit(
+        lambda: BinarySearchTree.from_sorted(keys), number=1
+    )
+    time_insert_many = timeit.timeit(
+        lambda: BinarySearchTree().insert_many(shuffled), number=1
+    )
+    print(f"build {n:,} keys - loop of insert: {time_loop:.3f} seconds")
+    print(f"build {n:,} keys - from_sorted: {time_from_sorted:.3f} seconds")
+    print(f"build {n:,} keys - insert_many: {time_insert_many:.3f} seconds")
+
+    batch = shuffled[: n // 2]
+    tree = insert_loop(shuffled)
+    time_remove_loop = timeit.timeit(lambda: [tree.remove(v) for v in batch], number=1)
+    tree = insert_loop(shuffled)
+    time_remove_many = timeit.timeit(lambda: tree.remove_many(batch), number=1)
+    print(
+        f"remove {len(batch):,} keys - loop of remove: {time_remove_loop:.3f} seconds"
+    )
+    print(f"remove {len(batch):,} keys - remove_many: {time_remove_many:.3f} seconds")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+"""
+Module: bst_storage
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a compact binary on-disk format for binary search trees.
+The file holds a versioned header followed by the keys in ascending order as
+little-endian int64 values on every host (big-endian hosts byte-swap them):
+
+    offset  size  field
+    0       4     magic b"BSTK"
+    4       2     format version (currently 1)
+    6       2     reserved, 0
+    8       8     number of keys n
+    16      8*n   keys, ascending
+
+A file can be loaded back into a tree with a single bulk read and the O(n)
+from_sorted constructor, or memory-mapped with MappedBinarySearchTree and
+queried in place by binary search, which makes a warm start nearly instant.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import timeit
+from typing import Iterator, Optional
+
+from binary_search_tree import BinarySearchTree
+
+MAGIC = b"BSTK"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHq")
+
+
+# The keys are stored little-endian; a big-endian host swaps them on the way.
+_SWAP = sys.byteorder != "little"
+
+
+def _read_header(header: bytes) -> int:
+    """
+    Validates a header and returns the number of keys in the file.
+
+    Raises:
+    ------
+    ValueError
+        If the header is truncated, the magic does not match or the version is unknown.
+    """
+    if len(header) < HEADER.size:
+        raise ValueError("truncated BSTK header")
+    magic, version, _, count = HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError(f"not a BSTK file (magic {magic!r})")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported BSTK version {version}")
+    return count
+
+
+def save_tree(tree: BinarySearchTree, path: str) -> int:
+    """
+    Writes the keys of a tree to path.
+
+    Parameters:
+    ----------
+    tree : BinarySearchTree
+        The tree to save; any ordered container that iterates in ascending order works.
+    path : str
+        The destination file.
+
+    Returns:
+    -------
+    int
+        The number of keys written.
+    """
+    keys = array("q", tree)
+    if _SWAP:
+        keys.byteswap()
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(keys)))
+        keys.tofile(file)
+    return len(keys)
+
+
+def load_tree(path: str, tree_class=BinarySearchTree) -> BinarySearchTree:
+    """
+    Loads a tree saved by save_tree.
+
+    The keys are read with one bulk copy (no per-key parsing) and the tree is
+    rebuilt balanced with tree_class.from_sorted.
+
+    Time Complexity:
+    ---------------
+    O(n)
+    """
+    with open(path, "rb") as file:
+        count = _read_header(file.read(HEADER.size))
+        keys = array("q")
+        keys.fromfile(file, count)
+    if _SWAP:
+        keys.byteswap()
+    return tree_class.from_sorted(keys)
+
+
+class MappedBinarySearchTree:
+    """
+    A class representing a read-only, memory-mapped view of a saved tree.
+
+    Queries run directly against the mapped file by binary search, so opening a
+    file costs O(1) regardless of its size and pages are loaded on demand. On
+    big-endian hosts the keys are copied and byte-swapped once when opening.
+
+    Methods:
+    -------
+    contains(value: int) -> bool
+        Checks if a value exists in the file.
+    rank(value: int) -> int
+        Returns the number of values smaller than the given value.
+    select(k: int) -> int
+        Returns the k-th smallest value (0-based).
+    range_iter(lo: int, hi: int) -> Iterator[int]
+        Lazily yields the values between lo and hi (inclusive).
+    close()
+        Releases the mapping.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        count = _read_header(self._mmap[: HEADER.size])
+        end = HEADER.size + 8 * count
+        if len(self._mmap) < end:
+            self._mmap.close()
+            raise ValueError("truncated BSTK file")
+        view = memoryview(self._mmap)
+        if _SWAP:
+            self._keys = array("q", bytes(view[HEADER.size : end]))
+            self._keys.byteswap()
+        else:
+            self._keys = view[HEADER.size : end].cast("q")
+        view.release()
+
+    def close(self) -> None:
+        """
+        Releases the memory mapping; the object cannot be used afterwards.
+        """
+        if isinstance(self._keys, memoryview):
+            self._keys.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedBinarySearchTree":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._keys)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._keys)
+
+    def contains(self, value: int) -> bool:
+        """
+        Checks if a value exists in the file in O(log n).
+        """
+        index = bisect_left(self._keys, value)
+        return index < len(self._keys) and self._keys[index] == value
+
+    def rank(self, value: int) -> int:
+        """
+        Returns the number of values smaller than value in O(log n).
+        """
+        return bisect_left(self._keys, value)
+
+    def select(self, k: int) -> int:
+        """
+        Returns the k-th smallest value in O(1).
+
+        Raises:
+        ------
+        IndexError
+            If k is not in the range [0, len(tree)).
+        """
+        if not 0 <= k < len(self._keys):
+            raise IndexError("select index out of range")
+        return self._keys[k]
+
+    def floor(self, value: int) -> Optional[int]:
+        """
+        Returns the largest value at most value, or None.
+        """
+        index = bisect_right(self._keys, value)
+        return self._keys[index - 1] if index else None
+
+    def ceiling(self, value: int) -> Optional[int]:
+        """
+        Returns the smallest value at least value, or None.
+        """
+        index = bisect_left(self._keys, value)
+        return self._keys[index] if index < len(self._keys) else None
+
+    def range_iter(self, lo: int, hi: int) -> Iterator[int]:
+        """
+        Lazily yields the values v with lo <= v <= hi in ascending order.
+        """
+        keys = self._keys
+        for index in range(bisect_left(keys, lo), bisect_right(keys, hi)):
+            yield keys[index]
+
+
+def verify_round_trip(tree: BinarySearchTree, path: str) -> list[str]:
+    """
+    Saves tree to path and checks that load_tree and MappedBinarySearchTree both
+    give it back unchanged.
+
+    Returns:
+    -------
+    list[str]
+        A description of every mismatch; empty when the round trip is exact.
+    """
+    save_tree(tree, path)
+    problems = []
+    expected = list(tree)
+    if list(load_tree(path)) != expected:
+        problems.append("load_tree returned different keys")
+    with MappedBinarySearchTree(path) as mapped:
+        if list(mapped) != expected:
+            problems.append("the mapped tree has different keys")
+        for index, value in enumerate(expected):
+            if not mapped.contains(value):
+                problems.append(f"the mapped tree lacks {value}")
+            elif mapped.rank(value) != index or mapped.select(index) != value:
+                problems.append(f"the mapped rank or select of {value} differs")
+        if expected and mapped.contains(expected[-1] + 1):
+            problems.append(f"the mapped tree contains {expected[-1] + 1}")
+    return problems
+
+
+def main():
+    """
+    The main function to round-trip a tree through the on-disk format and compare
+    warm-start times.
+    """
+    tree = BinarySearchTree()
+    for value in [10, 23, 4, 56, 73, 33, 44, 38]:
+        tree.insert(value)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bstk")
+        problems = verify_round_trip(tree, path)
+        if problems:
+            raise RuntimeError(f"round trip failed: {problems}")
+        with MappedBinarySearchTree(path) as mapped:
+            print(f"mapped contains 33: {mapped.contains(33)}")
+            print(f"mapped range_iter 10..56: {list(mapped.range_iter(10, 56))}")
+        print("round trip: ok")
+
+        n = 200_000
+        big = BinarySearchTree.from_sorted(range(0, 2 * n, 2))
+        save_tree(big, path)
+        print(f"file size for {n:,} keys: {os.path.getsize(path):,} bytes")
+
+        keys = list(range(0, 2 * n, 2))
+        random.shuffle(keys)
+
+        def reinsert() -> BinarySearchTree:
+            rebuilt = BinarySearchTree()
+            for value in keys:
+                rebuilt.insert(value)
+            return rebuilt
+
+        time_reinsert = timeit.timeit(reinsert, number=1)
+        time_load = timeit.timeit(lambda: load_tree(path), number=1)
+
+        def map_and_query() -> bool:
+            with MappedBinarySearchTree(path) as mapped:
+                return mapped.contains(n)
+
+        time_mmap = timeit.timeit(map_and_query, number=1)
+        print(f"warm start by re-inserting every key: {time_reinsert:.3f} seconds")
+        print(f"warm start by load_tree: {time_load:.3f} seconds")
+        print(f"warm start by memory-mapping: {time_mmap:.6f} seconds")
+
+
+if __name__ == "__main__":
+    main()
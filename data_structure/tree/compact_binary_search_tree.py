@@ -0,0 +1,354 @@
+"""
+Module: compact_binary_search_tree - unbalanced, array-backed.
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a memory-compact Binary Search Tree with the same API as
+BinarySearchTree. Instead of one Python object per node, the tree is stored in
+three parallel array('q') columns (value, left index, right index), so a key costs
+24 bytes of raw storage plus the array growth slack. Slots freed by remove are
+chained into a free list and reused by later inserts.
+
+Keys are stored as signed 64-bit integers, so they must lie in [-2**63, 2**63 - 1];
+inserting anything else raises OverflowError (or TypeError for non-integers).
+"""
+
+from array import array
+import tracemalloc
+from typing import Iterator
+
+from binary_search_tree import Node
+
+NIL = -1
+
+
+class CompactBinarySearchTree:
+    """
+    A class representing an array-backed binary search tree.
+
+    Nodes are identified by their index into the parallel columns; NIL (-1) plays
+    the role of None. Keys are limited to int64 by the array('q') value column.
+
+    Attributes:
+    ----------
+    root : int
+        The index of the root node, NIL when the tree is empty.
+
+    Methods:
+    -------
+    insert(value: int) -> bool
+        Inserts a value into the binary search tree.
+    contains(value: int) -> bool
+        Checks if a value exists in the binary search tree.
+    remove(value: int) -> bool
+        Removes a value from the binary search tree.
+    """
+
+    def __init__(self):
+        self.root: int = NIL
+        self._values = array("q")
+        self._left = array("q")
+        self._right = array("q")
+        # Head of the chain of freed slots, linked through the left column.
+        self._free: int = NIL
+
+    def _new_node(self, value: int) -> int:
+        """
+        Allocates a slot for a new leaf, reusing a freed slot when one is available.
+        """
+        index = self._free
+        if index == NIL:
+            self._values.append(value)
+            self._left.append(NIL)
+            self._right.append(NIL)
+            return len(self._values) - 1
+        # Store the value first so an out-of-range key leaves the free list intact.
+        self._values[index] = value
+        self._free = self._left[index]
+        self._left[index] = NIL
+        self._right[index] = NIL
+        return index
+
+    def _release(self, index: int) -> None:
+        """
+        Returns a slot to the free list.
+        """
+        self._left[index] = self._free
+        self._right[index] = NIL
+        self._free = index
+
+    def insert(self, value: int) -> bool:
+        """
+        Inserts a value into the binary search tree.
+
+        Parameters:
+        ----------
+        value : int
+            The value to be inserted into the tree.
+
+        Returns:
+        -------
+        bool
+            True if the value was inserted, False if the value already exists in the tree.
+        """
+        if self.root == NIL:
+            self.root = self._new_node(value)
+            return True
+
+        values, left, right = self._values, self._left, self._right
+        current = self.root
+        while True:
+            current_value = values[current]
+            if value == current_value:
+                return False
+            if value > current_value:
+                if right[current] == NIL:
+                    right[current] = self._new_node(value)
+                    return True
+                current = right[current]
+            else:
+                if left[current] == NIL:
+                    left[current] = self._new_node(value)
+                    return True
+                current = left[current]
+
+    def contains(self, value: int) -> bool:
+        """
+        Checks if a value exists in the binary search tree.
+
+        Parameters:
+        ----------
+        value : int
+            The value to search for in the tree.
+
+        Returns:
+        -------
+        bool
+            True if the value exists in the tree, False otherwise.
+        """
+        values, left, right = self._values, self._left, self._right
+        current = self.root
+        while current != NIL:
+            current_value = values[current]
+            if value == current_value:
+                return True
+            current = right[current] if value > current_value else left[current]
+        return False
+
+    def remove(self, value: int) -> bool:
+        """
+        Removes a value from the binary search tree and recycles its slot.
+
+        Parameters:
+        ----------
+        value : int
+            The value to be removed from the tree.
+
+        Returns:
+        -------
+        bool
+            True if the value was removed, False if the value does not exist in the tree.
+        """
+        values, left, right = self._values, self._left, self._right
+        parent = NIL
+        node = self.root
+        while node != NIL and values[node] != value:
+            parent = node
+            node = right[node] if value > values[node] else left[node]
+        if node == NIL:
+            return False
+
+        # A node with two children takes the value of its in-order successor,
+        # which is then unlinked instead (it has at most one child).
+        if NIL not in (left[node], right[node]):
+            parent = node
+            successor = right[node]
+            while left[successor] != NIL:
+                parent = successor
+                successor = left[successor]
+            values[node] = values[successor]
+            node = successor
+
+        child = left[node] if left[node] != NIL else right[node]
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == node:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(node)
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Lazily yields the values of the tree in ascending order.
+        """
+        return self.iter_in_order(self.root)
+
+    def __reversed__(self) -> Iterator[int]:
+        """
+        Lazily yields the values of the tree in descending order.
+        """
+        return self._iter_in_order(self.root, self._right, self._left)
+
+    def iter_pre_order(self, node: int) -> Iterator[int]:
+        """
+        Lazily yields the values of the subtree rooted at node in pre-order.
+        """
+        values, left, right = self._values, self._left, self._right
+        stack = [node] if node != NIL else []
+        while stack:
+            current = stack.pop()
+            yield values[current]
+            if right[current] != NIL:
+                stack.append(right[current])
+            if left[current] != NIL:
+                stack.append(left[current])
+
+    def iter_in_order(self, node: int) -> Iterator[int]:
+        """
+        Lazily yields the values of the subtree rooted at node in in-order.
+        """
+        return self._iter_in_order(node, self._left, self._right)
+
+    def _iter_in_order(self, node: int, first: array, second: array) -> Iterator[int]:
+        """
+        Yields in-order values, descending through first before second.
+        """
+        values = self._values
+        stack: list[int] = []
+        current = node
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = first[current]
+            current = stack.pop()
+            yield values[current]
+            current = second[current]
+
+    def iter_post_order(self, node: int) -> Iterator[int]:
+        """
+        Lazily yields the values of the subtree rooted at node in post-order.
+        """
+        values, left, right = self._values, self._left, self._right
+        stack: list[int] = []
+        current = node
+        last_visited = NIL
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            peek = stack[-1]
+            if right[peek] != NIL and right[peek] != last_visited:
+                current = right[peek]
+            else:
+                yield values[peek]
+                last_visited = stack.pop()
+
+    def pre_order_traversal(self, node: int) -> list[int]:
+        """
+        Performs a pre-order traversal of the tree and returns the values of the nodes.
+        """
+        return list(self.iter_pre_order(node))
+
+    def in_order_traversal(self, node: int) -> list[int]:
+        """
+        Performs an in-order traversal of the tree and returns the values of the nodes.
+        """
+        return list(self.iter_in_order(node))
+
+    def post_order_traversal(self, node: int) -> list[int]:
+        """
+        Performs a post-order traversal of the tree and returns the values of the nodes.
+        """
+        return list(self.iter_post_order(node))
+
+
+class _DictNode:
+    """
+    The original node layout, with a per-instance __dict__, kept for comparison.
+    """
+
+    def __init__(self, value: int):
+        self.value = value
+        self.left = None
+        self.right = None
+
+
+def bytes_per_key(build, n: int) -> float:
+    """
+    Measures with tracemalloc the memory retained by build(keys) per key.
+    """
+    keys = list(range(n))
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    structure = build(keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return (current - baseline) / n
+
+
+def _build_linked(keys: list[int], node_class) -> object:
+    """
+    Links one node_class instance per key into a balanced tree and returns its root.
+    """
+
+    def build(lo: int, hi: int):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = node_class(keys[mid])
+        node.left = build(lo, mid)
+        node.right = build(mid + 1, hi)
+        return node
+
+    return build(0, len(keys))
+
+
+def _build_compact(keys: list[int]) -> CompactBinarySearchTree:
+    tree = CompactBinarySearchTree()
+    stack = [(0, len(keys))]
+    while stack:
+        lo, hi = stack.pop()
+        if lo < hi:
+            mid = (lo + hi) // 2
+            tree.insert(keys[mid])
+            stack.append((mid + 1, hi))
+            stack.append((lo, mid))
+    return tree
+
+
+def main():
+    """
+    The main function to demonstrate the usage of the CompactBinarySearchTree class
+    and to report its memory usage per key against the object-per-node layouts.
+    """
+    bst = CompactBinarySearchTree()
+    for value in [10, 23, 4, 56, 73, 33, 44, 38]:
+        bst.insert(value)
+
+    print(f"contains 33: {bst.contains(33)}")
+    print(f"contains 100: {bst.contains(100)}")
+    print(f"remove 33: {bst.remove(33)}")
+    print(f"contains 33: {bst.contains(33)}")
+    print(f"insert 35 reuses the freed slot: {bst.insert(35)}")
+
+    print(f"pre-order traversal: {bst.pre_order_traversal(bst.root)}")
+    print(f"in-order traversal: {bst.in_order_traversal(bst.root)}")
+    print(f"post-order traversal: {bst.post_order_traversal(bst.root)}")
+
+    n = 200_000
+    print(f"bytes per key with {n:,} keys (tracemalloc):")
+    dict_nodes = bytes_per_key(lambda keys: _build_linked(keys, _DictNode), n)
+    slotted_nodes = bytes_per_key(lambda keys: _build_linked(keys, Node), n)
+    print(f"  Node with __dict__:   {dict_nodes:6.1f}")
+    print(f"  Node with __slots__:  {slotted_nodes:6.1f}")
+    print(f"  parallel array('q'):  {bytes_per_key(_build_compact, n):6.1f}")
+
+
+if __name__ == "__main__":
+    main()
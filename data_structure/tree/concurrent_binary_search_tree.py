@@ -0,0 +1,319 @@
+"""
+Module: concurrent_binary_search_tree
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a thread-safe binary search tree for read-heavy workloads.
+The current content is an immutable PersistentBinarySearchTree version published
+through a single attribute. Readers (contains, rank, select, len, iteration) just
+load that reference and walk a tree that can never change under them, so they take
+no lock at all and never block each other or writers. Writers serialize on one
+mutex, build the next version by path copying (O(log n) new nodes per change) and
+publish it with one reference assignment, which is atomic.
+
+Iteration works on the version that was current when the iterator was created, so
+iterators always see a consistent key set, and writers never wait on a slow
+consumer.
+"""
+
+import random
+import threading
+import time
+from typing import Iterable, Iterator
+
+from avl_tree import AVLTree
+from persistent_binary_search_tree import PersistentBinarySearchTree
+
+
+class ConcurrentBinarySearchTree:
+    """
+    A class representing a thread-safe, balanced binary search tree.
+
+    Methods:
+    -------
+    insert(value: int) -> bool
+        Inserts a value into the tree; writers serialize on a mutex.
+    contains(value: int) -> bool
+        Checks if a value exists in the tree without taking any lock.
+    remove(value: int) -> bool
+        Removes a value from the tree; writers serialize on a mutex.
+    version() -> PersistentBinarySearchTree
+        Returns the current immutable version of the tree in O(1).
+    snapshot() -> tuple[int, ...]
+        Returns a consistent, immutable view of the values in ascending order.
+    __iter__() -> Iterator[int]
+        Iterates over the current version in ascending order.
+    """
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._version = PersistentBinarySearchTree.from_iterable(values)
+        self._write_lock = threading.Lock()
+        # The values of one version, paired with it so a stale copy is never used.
+        self._snapshot: tuple[PersistentBinarySearchTree, tuple[int, ...]] = (
+            None,
+            (),
+        )
+
+    def insert(self, value: int) -> bool:
+        """
+        Inserts a value into the tree.
+
+        Returns:
+        -------
+        bool
+            True if the value was inserted, False if the value already exists in the tree.
+        """
+        with self._write_lock:
+            version = self._version.insert(value)
+            if version is self._version:
+                return False
+            self._version = version
+            return True
+
+    def remove(self, value: int) -> bool:
+        """
+        Removes a value from the tree.
+
+        Returns:
+        -------
+        bool
+            True if the value was removed, False if the value does not exist in the tree.
+        """
+        with self._write_lock:
+            version = self._version.remove(value)
+            if version is self._version:
+                return False
+            self._version = version
+            return True
+
+    def insert_many(self, values: Iterable[int]) -> int:
+        """
+        Inserts a batch of values and publishes them as one new version, so readers
+        see either none or all of the batch.
+
+        Time Complexity:
+        ---------------
+        O(m log(n + m)) for m values.
+        """
+        batch = list(values)
+        with self._write_lock:
+            version, inserted = self._version, 0
+            for value in batch:
+                updated = version.insert(value)
+                inserted += updated is not version
+                version = updated
+            self._version = version
+            return inserted
+
+    def remove_many(self, values: Iterable[int]) -> int:
+        """
+        Removes a batch of values and publishes the result as one new version.
+
+        Time Complexity:
+        ---------------
+        O(m log n) for m values.
+        """
+        batch = list(values)
+        with self._write_lock:
+            version, removed = self._version, 0
+            for value in batch:
+                updated = version.remove(value)
+                removed += updated is not version
+                version = updated
+            self._version = version
+            return removed
+
+    def contains(self, value: int) -> bool:
+        """
+        Checks if a value exists in the tree; lookups never block each other.
+        """
+        return self._version.contains(value)
+
+    def rank(self, value: int) -> int:
+        """
+        Returns the number of values in the tree that are smaller than value.
+        """
+        return self._version.rank(value)
+
+    def select(self, k: int) -> int:
+        """
+        Returns the k-th smallest value in the tree (0-based).
+        """
+        return self._version.select(k)
+
+    def __len__(self) -> int:
+        return len(self._version)
+
+    def version(self) -> PersistentBinarySearchTree:
+        """
+        Returns the current version of the tree; it never changes afterwards.
+        """
+        return self._version
+
+    def snapshot(self) -> tuple[int, ...]:
+        """
+        Returns the values in ascending order as of a single point in time.
+
+        The copy is made without any lock, once per version, and shared between
+        callers.
+
+        Time Complexity:
+        ---------------
+        O(n) after a write, O(1) otherwise.
+        """
+        version = self._version
+        cached_version, values = self._snapshot
+        if cached_version is not version:
+            values = tuple(version)
+            self._snapshot = (version, values)
+        return values
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterates over the current version of the tree in ascending order.
+        """
+        return iter(self._version)
+
+
+class _GlobalLockTree:
+    """
+    A tree guarded by a single mutex, used as the throughput baseline.
+    """
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._tree = AVLTree.from_sorted(sorted(set(values)))
+        self._lock = threading.Lock()
+
+    def insert(self, value: int) -> bool:
+        with self._lock:
+            return self._tree.insert(value)
+
+    def remove(self, value: int) -> bool:
+        with self._lock:
+            return self._tree.remove(value)
+
+    def contains(self, value: int) -> bool:
+        with self._lock:
+            return self._tree.contains(value)
+
+
+def stress_test(num_threads: int = 8, ops_per_thread: int = 20_000) -> None:
+    """
+    Hammers one tree from many threads and checks the result.
+
+    Every thread owns a disjoint key range, so the final content is known
+    exactly, while snapshot readers check that every view they get is sorted.
+
+    Raises:
+    ------
+    AssertionError
+        If the tree ends up in a state that no serial execution could produce.
+    """
+    tree = ConcurrentBinarySearchTree()
+    expected: list[set[int]] = [set() for _ in range(num_threads)]
+    errors: list[str] = []
+    stop = threading.Event()
+
+    def writer(index: int):
+        rng = random.Random(index)
+        owned = expected[index]
+        base = index * 1_000
+        for _ in range(ops_per_thread):
+            value = base + rng.randrange(1_000)
+            if rng.random() < 0.6:
+                if tree.insert(value) == (value in owned):
+                    errors.append(f"insert({value}) disagreed with thread {index}")
+                owned.add(value)
+            else:
+                if tree.remove(value) != (value in owned):
+                    errors.append(f"remove({value}) disagreed with thread {index}")
+                owned.discard(value)
+
+    def reader():
+        while not stop.is_set():
+            values = list(tree)
+            if any(a >= b for a, b in zip(values, values[1:])):
+                errors.append("snapshot was not strictly ascending")
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    writers = [threading.Thread(target=writer, args=(i,)) for i in range(num_threads)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert not errors, errors[:5]
+    assert list(tree) == sorted(set().union(*expected))
+    assert len(tree) == sum(len(owned) for owned in expected)
+
+
+def benchmark_throughput(
+    tree, num_threads: int, ops_per_thread: int, read_ratio: float = 0.95
+) -> float:
+    """
+    Runs a mixed workload from several threads and returns operations per second.
+    """
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        ops = [
+            (rng.random() < read_ratio, rng.randrange(200_000))
+            for _ in range(ops_per_thread)
+        ]
+        barrier.wait()
+        for is_read, value in ops:
+            if is_read:
+                tree.contains(value)
+            elif value & 1:
+                tree.insert(value)
+            else:
+                tree.remove(value)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return num_threads * ops_per_thread / elapsed
+
+
+def main():
+    """
+    The main function to demonstrate the ConcurrentBinarySearchTree, run the stress
+    test and compare throughput against a single global lock.
+    """
+    tree = ConcurrentBinarySearchTree([10, 23, 4, 56, 73, 33, 44, 38])
+    view = iter(tree)
+    tree.remove(33)
+    print(f"snapshot taken before remove: {list(view)}")
+    print(f"snapshot taken after remove: {list(tree)}")
+
+    stress_test()
+    print("stress test passed")
+
+    initial = range(0, 200_000, 2)
+    for num_threads in [1, 2, 4, 8]:
+        global_lock = benchmark_throughput(
+            _GlobalLockTree(initial), num_threads, 50_000
+        )
+        lock_free = benchmark_throughput(
+            ConcurrentBinarySearchTree(initial), num_threads, 50_000
+        )
+        print(
+            f"{num_threads} threads, 95% contains - global lock: "
+            f"{global_lock:,.0f} ops/s, lock-free reads: {lock_free:,.0f} ops/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Module: ordered_set_benchmark
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module benchmarks the ordered containers of this package against each other
+on the shared insert/contains/remove/in-order iteration contract:
+BinarySearchTree (unbalanced), AVLTree and SortedBlockList.
+
+Three workloads are measured:
+- random: keys inserted in random order.
+- sorted: keys inserted in ascending order.
+- adversarial: keys inserted zig-zagging from both ends (0, n-1, 1, n-2, ...),
+  which turns an unbalanced tree into a chain just like sorted input does.
+
+Usage:
+------
+    python ordered_set_benchmark.py [n ...]
+
+n defaults to 10^5 and 10^6; pass 10000000 to run the 10^7 size as well.
+The unbalanced tree is skipped on workloads where it degrades to O(n^2).
+"""
+
+import random
+import sys
+import time
+from typing import Callable
+
+from avl_tree import AVLTree
+from binary_search_tree import BinarySearchTree
+from sorted_block_list import SortedBlockList
+
+DEFAULT_SIZES = (10**5, 10**6)
+
+# Largest n for which the unbalanced tree is run on a degenerate workload.
+QUADRATIC_LIMIT = 10_000
+
+
+def _random_keys(n: int) -> list[int]:
+    keys = list(range(n))
+    random.shuffle(keys)
+    return keys
+
+
+def _sorted_keys(n: int) -> list[int]:
+    return list(range(n))
+
+
+def _zigzag_keys(n: int) -> list[int]:
+    keys: list[int] = []
+    lo, hi = 0, n - 1
+    while lo <= hi:
+        keys.append(lo)
+        if lo != hi:
+            keys.append(hi)
+        lo += 1
+        hi -= 1
+    return keys
+
+
+WORKLOADS: dict[str, tuple[Callable[[int], list[int]], bool]] = {
+    # name: (key generator, degenerates the unbalanced tree)
+    "random": (_random_keys, False),
+    "sorted": (_sorted_keys, True),
+    "adversarial": (_zigzag_keys, True),
+}
+
+CONTAINERS: dict[str, Callable[[], object]] = {
+    "BinarySearchTree": BinarySearchTree,
+    "AVLTree": AVLTree,
+    "SortedBlockList": SortedBlockList,
+}
+
+
+def run_workload(factory: Callable[[], object], keys: list[int]) -> dict[str, float]:
+    """
+    Times inserting, looking up (hits and misses), iterating and removing keys.
+
+    Returns:
+    -------
+    dict[str, float]
+        The elapsed seconds of each phase.
+    """
+    timings: dict[str, float] = {}
+    container = factory()
+
+    start = time.perf_counter()
+    for key in keys:
+        container.insert(key)
+    timings["insert"] = time.perf_counter() - start
+
+    n = len(keys)
+    start = time.perf_counter()
+    for key in keys:
+        container.contains(key)
+        container.contains(key + n)
+    timings["contains"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in container:
+        pass
+    timings["iterate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        container.remove(key)
+    timings["remove"] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    """
+    Runs every container on every workload for the requested sizes.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or list(DEFAULT_SIZES)
+    header = f"{'n':>10} {'workload':<12} {'container':<17}"
+    print(f"{header} {'insert':>8} {'contains':>9} {'iterate':>8} {'remove':>8}")
+    for n in sizes:
+        for workload, (generate, degenerate) in WORKLOADS.items():
+            keys = generate(n)
+            for name, factory in CONTAINERS.items():
+                prefix = f"{n:>10,} {workload:<12} {name:<17}"
+                if factory is BinarySearchTree and degenerate and n > QUADRATIC_LIMIT:
+                    print(f"{prefix} skipped (O(n^2) on this workload)")
+                    continue
+                t = run_workload(factory, keys)
+                print(
+                    f"{prefix} {t['insert']:8.3f} {t['contains']:9.3f} "
+                    f"{t['iterate']:8.3f} {t['remove']:8.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
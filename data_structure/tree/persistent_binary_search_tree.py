@@ -0,0 +1,352 @@
+"""
+Module: persistent_binary_search_tree - immutable, path-copying.
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a persistent (fully immutable) balanced binary search tree.
+insert and remove never modify a node; they copy the O(log n) nodes on the path
+from the root to the change and return a new version of the tree that shares every
+other subtree with the old one. Old versions stay valid forever, so a snapshot is
+just a reference to a version, and keeping thousands of historical versions costs
+O(log n) extra nodes per change instead of O(n) per copy.
+
+The tree is kept AVL-balanced so that the copied path is always O(log n) long.
+"""
+
+import random
+import tracemalloc
+from typing import Iterable, Iterator, Optional
+
+from binary_search_tree import BinarySearchTree
+
+
+class PersistentNode:
+    """
+    A class representing an immutable node of a persistent binary search tree.
+
+    Attributes:
+    ----------
+    value : int
+        The value stored in the node.
+    left : PersistentNode, optional
+        The left subtree.
+    right : PersistentNode, optional
+        The right subtree.
+    height : int
+        The height of the subtree rooted at this node.
+    size : int
+        The number of nodes in the subtree rooted at this node.
+    """
+
+    __slots__ = ("value", "left", "right", "height", "size")
+
+    def __init__(self, value: int, left: "PersistentNode", right: "PersistentNode"):
+        self.value = value
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+        self.size = 1 + _size(left) + _size(right)
+
+
+def _height(node: Optional[PersistentNode]) -> int:
+    return node.height if node is not None else 0
+
+
+def _size(node: Optional[PersistentNode]) -> int:
+    return node.size if node is not None else 0
+
+
+def _balance(
+    value: int, left: Optional[PersistentNode], right: Optional[PersistentNode]
+) -> PersistentNode:
+    """
+    Builds a new node from value and two subtrees whose heights differ by at most 2,
+    rotating (with fresh nodes) as needed to restore the AVL invariant.
+    """
+    left_height, right_height = _height(left), _height(right)
+    if left_height > right_height + 1:
+        if _height(left.left) >= _height(left.right):
+            return PersistentNode(
+                left.value, left.left, PersistentNode(value, left.right, right)
+            )
+        pivot = left.right
+        return PersistentNode(
+            pivot.value,
+            PersistentNode(left.value, left.left, pivot.left),
+            PersistentNode(value, pivot.right, right),
+        )
+    if right_height > left_height + 1:
+        if _height(right.right) >= _height(right.left):
+            return PersistentNode(
+                right.value, PersistentNode(value, left, right.left), right.right
+            )
+        pivot = right.left
+        return PersistentNode(
+            pivot.value,
+            PersistentNode(value, left, pivot.left),
+            PersistentNode(right.value, pivot.right, right.right),
+        )
+    return PersistentNode(value, left, right)
+
+
+def _insert(node: Optional[PersistentNode], value: int) -> PersistentNode:
+    """
+    Returns a subtree containing value; returns node itself if value is present.
+    """
+    if node is None:
+        return PersistentNode(value, None, None)
+    if value == node.value:
+        return node
+    if value < node.value:
+        left = _insert(node.left, value)
+        if left is node.left:
+            return node
+        return _balance(node.value, left, node.right)
+    right = _insert(node.right, value)
+    if right is node.right:
+        return node
+    return _balance(node.value, node.left, right)
+
+
+def _remove_min(node: PersistentNode) -> Optional[PersistentNode]:
+    """
+    Returns a copy of the subtree without its minimum value.
+    """
+    if node.left is None:
+        return node.right
+    return _balance(node.value, _remove_min(node.left), node.right)
+
+
+def _remove(node: Optional[PersistentNode], value: int) -> Optional[PersistentNode]:
+    """
+    Returns a subtree without value; returns node itself if value is absent.
+    """
+    if node is None:
+        return None
+    if value == node.value:
+        return _remove_root(node)
+    if value < node.value:
+        left, right = _remove(node.left, value), node.right
+        unchanged = left is node.left
+    else:
+        left, right = node.left, _remove(node.right, value)
+        unchanged = right is node.right
+    return node if unchanged else _balance(node.value, left, right)
+
+
+def _remove_root(node: PersistentNode) -> Optional[PersistentNode]:
+    """
+    Returns a copy of the subtree without the value at its root.
+    """
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    successor = node.right
+    while successor.left is not None:
+        successor = successor.left
+    return _balance(successor.value, node.left, _remove_min(node.right))
+
+
+class PersistentBinarySearchTree:
+    """
+    A class representing one immutable version of a persistent binary search tree.
+
+    insert and remove return a new version instead of a bool; the version they are
+    called on is left untouched. When nothing changes, the same version is returned,
+    so `tree.insert(v) is tree` tells that v was already present.
+
+    Methods:
+    -------
+    insert(value: int) -> PersistentBinarySearchTree
+        Returns a version that also contains value.
+    remove(value: int) -> PersistentBinarySearchTree
+        Returns a version that does not contain value.
+    contains(value: int) -> bool
+        Checks if a value exists in this version.
+    rank(value: int) -> int
+        Returns the number of values smaller than value.
+    select(k: int) -> int
+        Returns the k-th smallest value.
+    __iter__() -> Iterator[int]
+        Lazily yields the values of this version in ascending order.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, root: Optional[PersistentNode] = None):
+        self.root = root
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> "PersistentBinarySearchTree":
+        """
+        Builds a balanced version containing the given values.
+
+        Time Complexity:
+        ---------------
+        O(n log n) for sorting, then O(n) to build the tree.
+        """
+        ordered = sorted(set(values))
+
+        def build(lo: int, hi: int) -> Optional[PersistentNode]:
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            return PersistentNode(ordered[mid], build(lo, mid), build(mid + 1, hi))
+
+        return cls(build(0, len(ordered)))
+
+    def insert(self, value: int) -> "PersistentBinarySearchTree":
+        """
+        Returns a new version of the tree that also contains value.
+
+        Time Complexity:
+        ---------------
+        O(log n) time and O(log n) new nodes; everything else is shared.
+        """
+        root = _insert(self.root, value)
+        return self if root is self.root else PersistentBinarySearchTree(root)
+
+    def remove(self, value: int) -> "PersistentBinarySearchTree":
+        """
+        Returns a new version of the tree that does not contain value.
+
+        Time Complexity:
+        ---------------
+        O(log n) time and O(log n) new nodes; everything else is shared.
+        """
+        root = _remove(self.root, value)
+        return self if root is self.root else PersistentBinarySearchTree(root)
+
+    def contains(self, value: int) -> bool:
+        """
+        Checks if a value exists in this version of the tree.
+        """
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return True
+            node = node.right if value > node.value else node.left
+        return False
+
+    def rank(self, value: int) -> int:
+        """
+        Returns the number of values in this version that are smaller than value.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        count = 0
+        node = self.root
+        while node is not None:
+            if value > node.value:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def select(self, k: int) -> int:
+        """
+        Returns the k-th smallest value (0-based) in this version.
+
+        Raises:
+        ------
+        IndexError
+            If k is not in the range [0, len(tree)).
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        if not 0 <= k < _size(self.root):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Lazily yields the values of this version in ascending order.
+        """
+        stack: list[PersistentNode] = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.value
+            current = current.right
+
+    def in_order_traversal(self) -> list[int]:
+        """
+        Returns the values of this version in ascending order.
+        """
+        return list(self)
+
+
+def _traced_bytes(build) -> int:
+    """
+    Returns the memory, in bytes, still allocated by build() when it returns.
+    """
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current - baseline
+
+
+def main():
+    """
+    The main function to demonstrate versioning with PersistentBinarySearchTree and
+    to compare the memory of many snapshots against full copies.
+    """
+    v1 = PersistentBinarySearchTree.from_iterable([10, 23, 4, 56, 73, 33, 44, 38])
+    v2 = v1.remove(33)
+    v3 = v2.insert(35)
+    print(f"v1: {v1.in_order_traversal()}")
+    print(f"v2: {v2.in_order_traversal()}")
+    print(f"v3: {v3.in_order_traversal()}")
+    print(
+        f"insert of an existing value returns the same version: {v3.insert(35) is v3}"
+    )
+
+    n, versions = 100_000, 1_000
+    keys = random.sample(range(10 * n), n)
+    base = PersistentBinarySearchTree.from_iterable(keys)
+    updates = [random.randrange(10 * n) for _ in range(versions)]
+
+    def persistent_history() -> list[PersistentBinarySearchTree]:
+        history = [base]
+        for value in updates:
+            history.append(history[-1].insert(value))
+        return history
+
+    # A deep copy of a mutable tree allocates exactly what building it does.
+    ordered = sorted(keys)
+    per_version = _traced_bytes(persistent_history) / versions
+    per_copy = _traced_bytes(lambda: BinarySearchTree.from_sorted(ordered))
+    print(f"extra memory per version of a {n:,}-key tree:")
+    print(f"  path copying: {per_version:12,.0f} bytes")
+    print(f"  full copy:    {per_copy:12,.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Module: sorted_block_list
+License: MIT
+Author: Prashant Garg
+Date: 2026-10-16
+
+Description:
+------------
+This module provides a cache-friendly ordered set built from a list of sorted
+blocks, in the style of sortedcontainers. Each block is a plain Python list of at
+most 2 * load values kept sorted with bisect, and a parallel list holds the maximum
+of every block. A lookup is two binary searches over contiguous lists instead of a
+chain of pointer dereferences, and an insert or remove shifts at most one block.
+It offers the insert/contains/remove/in-order iteration contract of
+BinarySearchTree.
+"""
+
+from bisect import bisect_left
+from itertools import chain
+from typing import Iterable, Iterator
+
+DEFAULT_LOAD = 1000
+
+
+class SortedBlockList:
+    """
+    A class representing an ordered set stored as a list of sorted blocks.
+
+    Attributes:
+    ----------
+    load : int
+        The target block length; a block is split in two once it exceeds 2 * load.
+
+    Methods:
+    -------
+    insert(value: int) -> bool
+        Inserts a value into the set.
+    contains(value: int) -> bool
+        Checks if a value exists in the set.
+    remove(value: int) -> bool
+        Removes a value from the set.
+    __iter__() -> Iterator[int]
+        Lazily yields the values in ascending order.
+    """
+
+    def __init__(self, values: Iterable[int] = (), load: int = DEFAULT_LOAD):
+        self.load = load
+        self._blocks: list[list[int]] = []
+        self._maxes: list[int] = []
+        ordered = sorted(set(values))
+        for start in range(0, len(ordered), load):
+            block = ordered[start : start + load]
+            self._blocks.append(block)
+            self._maxes.append(block[-1])
+        self._size = len(ordered)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Lazily yields the values in ascending order.
+        """
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[int]:
+        """
+        Lazily yields the values in descending order.
+        """
+        return chain.from_iterable(reversed(block) for block in reversed(self._blocks))
+
+    def insert(self, value: int) -> bool:
+        """
+        Inserts a value into the set.
+
+        Parameters:
+        ----------
+        value : int
+            The value to be inserted.
+
+        Returns:
+        -------
+        bool
+            True if the value was inserted, False if the value already exists.
+
+        Time Complexity:
+        ---------------
+        O(log n + load), the block shift is a single memmove.
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._blocks.append([value])
+            maxes.append(value)
+            self._size = 1
+            return True
+
+        position = bisect_left(maxes, value)
+        if position == len(maxes):
+            # Larger than every value: append to the last block.
+            position -= 1
+            block = self._blocks[position]
+            block.append(value)
+            maxes[position] = value
+        else:
+            block = self._blocks[position]
+            index = bisect_left(block, value)
+            if block[index] == value:
+                return False
+            block.insert(index, value)
+
+        self._size += 1
+        if len(block) > 2 * self.load:
+            self._split(position)
+        return True
+
+    def _split(self, position: int) -> None:
+        """
+        Splits an overfull block into two blocks of load values or more.
+        """
+        block = self._blocks[position]
+        half = block[self.load :]
+        del block[self.load :]
+        self._blocks.insert(position + 1, half)
+        self._maxes[position] = block[-1]
+        self._maxes.insert(position + 1, half[-1])
+
+    def contains(self, value: int) -> bool:
+        """
+        Checks if a value exists in the set.
+
+        Parameters:
+        ----------
+        value : int
+            The value to search for.
+
+        Returns:
+        -------
+        bool
+            True if the value exists, False otherwise.
+
+        Time Complexity:
+        ---------------
+        O(log n)
+        """
+        position = bisect_left(self._maxes, value)
+        if position == len(self._maxes):
+            return False
+        block = self._blocks[position]
+        return block[bisect_left(block, value)] == value
+
+    def remove(self, value: int) -> bool:
+        """
+        Removes a value from the set.
+
+        Parameters:
+        ----------
+        value : int
+            The value to be removed.
+
+        Returns:
+        -------
+        bool
+            True if the value was removed, False if the value does not exist.
+
+        Time Complexity:
+        ---------------
+        O(log n + load)
+        """
+        maxes = self._maxes
+        position = bisect_left(maxes, value)
+        if position == len(maxes):
+            return False
+        block = self._blocks[position]
+        index = bisect_left(block, value)
+        if block[index] != value:
+            return False
+
+        del block[index]
+        self._size -= 1
+        if not block:
+            del self._blocks[position]
+            del maxes[position]
+        elif index == len(block):
+            maxes[position] = block[-1]
+        return True
+
+    def in_order_traversal(self) -> list[int]:
+        """
+        Returns the values of the set in ascending order.
+        """
+        return list(self)
+
+
+def main():
+    """
+    The main function to demonstrate the usage of the SortedBlockList class.
+    """
+    blocks = SortedBlockList(load=2)
+    for value in [10, 23, 4, 56, 73, 33, 44, 38]:
+        blocks.insert(value)
+
+    print(f"contains 33: {blocks.contains(33)}")
+    print(f"contains 100: {blocks.contains(100)}")
+    print(f"remove 33: {blocks.remove(33)}")
+    print(f"contains 33: {blocks.contains(33)}")
+    print(f"in-order traversal: {blocks.in_order_traversal()}")
+
+
+if __name__ == "__main__":
+    main()